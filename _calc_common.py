@@ -0,0 +1,57 @@
+"""
+Shared setup for the detailed calculation modules
+=================================================
+
+Optional numba JIT support and the unit scaling constants used by
+castellated_detailed_calcs, composite_detailed_calcs and composite_slab.
+
+numba is imported on the first njit decoration, so a module that never
+JIT-compiles never imports it. castellated_detailed_calcs does not when
+its ahead-of-time compiled kernels (_dg31_kernels, see build_kernels.py)
+are present; the composite modules JIT-compile either way.
+"""
+
+from functools import lru_cache
+
+try:
+    from . import _dg31_kernels
+except ImportError:
+    try:
+        import _dg31_kernels
+    except ImportError:
+        _dg31_kernels = None
+
+
+@lru_cache(maxsize=None)
+def load_numba():
+    """The numba module, imported on first call, or None if not installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+def _njit_fallback(*args, **kwargs):
+    """Pass-through stand-in for numba.njit when numba is not in use."""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
+
+
+def njit(*args, **kwargs):
+    """numba.njit, importing numba on first use, or a pass-through without it."""
+    numba = load_numba()
+    return (numba.njit if numba is not None else _njit_fallback)(*args, **kwargs)
+
+
+def numba_prange():
+    """numba.prange for parallel loops, or range without numba."""
+    numba = load_numba()
+    return numba.prange if numba is not None else range
+
+
+# Unit conversions as reciprocal multipliers (multiply instead of divide)
+INV_MM_TO_M = 1e-3     # kN·mm → kN·m
+N_MM_TO_KN_M = 1e-6    # N·mm → kN·m
+N_TO_KN = 1e-3         # N → kN
@@ -0,0 +1,51 @@
+"""
+Ahead-of-time build of the castellated/cellular beam calculation kernels
+=========================================================================
+
+Compiles the numeric kernels of castellated_detailed_calcs into the
+_dg31_kernels extension module next to this file, so that one-shot runs
+skip both the numba import and the JIT compilation on first call.
+
+Usage:
+    python build_kernels.py
+
+Requires numba (and a C compiler) at build time only. When the extension
+module is absent, castellated_detailed_calcs falls back to its JIT (or
+pure-Python) kernels.
+"""
+
+import os
+import tempfile
+
+# The app imports castellated_detailed_calcs through its package while
+# this script imports it top-level; a private numba cache keeps the two
+# from loading each other's cached kernels
+os.environ['NUMBA_CACHE_DIR'] = tempfile.mkdtemp(prefix='dg31_build_')
+
+from numba.pycc import CC
+
+import castellated_detailed_calcs as _calcs
+
+# Exported name -> Numba signature, matching the call sites in
+# castellated_detailed_calcs
+_SIGNATURES = {
+    'web_post': 'Tuple((f8, f8, f8, f8, f8, f8, f8, i8, f8, f8, f8, f8))'
+                '(f8, f8, f8, f8, f8, f8, f8, b1, b1)',
+    'hshear': 'UniTuple(f8, 8)(f8, f8, f8, f8, f8, f8, f8, i8)',
+    'vshear': 'Tuple((f8, i8, f8, f8, f8))(f8, f8, f8, f8, f8, f8, f8, f8, i8)',
+    'deflection': 'UniTuple(f8, 6)(f8, f8, f8, f8, f8)',
+}
+
+
+def build(output_dir: str = None) -> None:
+    """Compile the kernels into _dg31_kernels in output_dir."""
+    cc = CC('_dg31_kernels')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    for name, signature in _SIGNATURES.items():
+        kernel = _calcs._JIT_KERNELS[name]
+        cc.export(name, signature)(getattr(kernel, 'py_func', kernel))
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -13,68 +13,264 @@ Version: 2.8
 """
 
 import math
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
-from enum import Enum
+import numpy as np
+from functools import lru_cache
+from dataclasses import InitVar, dataclass, field
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+from enum import Enum, IntEnum
+
+try:
+    from ._calc_common import (
+        INV_MM_TO_M, N_MM_TO_KN_M, N_TO_KN, _dg31_kernels, _njit_fallback, njit,
+    )
+except ImportError:
+    from _calc_common import (
+        INV_MM_TO_M, N_MM_TO_KN_M, N_TO_KN, _dg31_kernels, _njit_fallback, njit,
+    )
+
+# Ahead-of-time compiled kernels (see build_kernels.py) take precedence
+# over JIT compilation, which then is not imported at all
+if _dg31_kernels is not None:
+    njit = _njit_fallback
 
 
 # =============================================================================
 # DATA CLASSES FOR DETAILED CALCULATIONS
 # =============================================================================
 
-@dataclass
+class BeamType(IntEnum):
+    """
+    Opening type as an integer code, so the checks can branch on an int
+    (and numba kernels / NumPy masks can take it directly) rather than
+    comparing strings.
+    """
+    CASTELLATED = 0
+    CELLULAR = 1
+
+    @classmethod
+    def coerce(cls, value) -> "BeamType":
+        """Accept a BeamType, an int code, or the "Castellated"/"Cellular" string."""
+        if isinstance(value, str):
+            return cls.CASTELLATED if value == "Castellated" else cls.CELLULAR
+        return cls(int(value))
+
+    @property
+    def label(self) -> str:
+        """Display name used in the report text."""
+        return "Castellated" if self is BeamType.CASTELLATED else "Cellular"
+
+
+class Method(IntEnum):
+    """
+    Design method as an integer code, usable as an index into the
+    resistance/safety factor tables below.
+    """
+    LRFD = 0
+    ASD = 1
+
+    @classmethod
+    def coerce(cls, value) -> "Method":
+        """Accept a Method, an int code, or the "LRFD"/"ASD" string (any case)."""
+        if isinstance(value, str):
+            return cls.LRFD if value.upper() == "LRFD" else cls.ASD
+        return cls(int(value))
+
+
+# Shear factors indexed by Method: φv for LRFD, Ωv for ASD
+_H_SHEAR_FACTOR = (1.00, 1.50)                   # Shear yielding (AISC 360-16 J4.2)
+_V_SHEAR_FACTORS = ((1.00, 0.90), (1.50, 1.67))  # [Method][0 if Cv = 1.0 else 1] (G1)
+
+
+def _factored_load_lrfd(w_dead, w_live):
+    """LRFD strength combination 1.2D + 1.6L (scalars or arrays)."""
+    return 1.2 * w_dead + 1.6 * w_live
+
+
+def _factored_load_asd(w_dead, w_live):
+    """ASD combination D + L (scalars or arrays)."""
+    return w_dead + w_live
+
+
+# Line load combination for strength design, indexed by Method
+_FACTORED_LOAD = (_factored_load_lrfd, _factored_load_asd)
+
+
+@dataclass(frozen=True, slots=True)
 class DetailedCalcStep:
     """
     A single calculation step with full professional documentation.
+    Frozen: the section's step columns are the stored copy, so steps are
+    changed through the section rather than by editing a step.
     
     Attributes:
         step_number: Sequential step number within section
         title: Brief title of the calculation
         description: Detailed explanation of what is being calculated and why
         equation: The general equation in symbolic form
-        substitution: The equation with actual values substituted
+        substitution: The equation with actual values substituted, either as
+            text or as a (template, args) pair formatted when rendered
         result: Numerical result
         unit: Units of the result
         code_ref: Specific code section reference
         status: PASS/FAIL/INFO for checks
-        notes: Additional notes or warnings
+        notes: Additional notes or warnings, either as text or as a
+            (function, args) pair called when rendered
     """
     step_number: int
     title: str
     description: str
     equation: str
-    substitution: str
+    substitution: Union[str, Tuple[str, tuple]]
     result: float
     unit: str
     code_ref: str
     status: str = "INFO"  # INFO, PASS, FAIL, WARNING
-    notes: str = ""
+    notes: Union[str, Tuple[Callable[..., str], tuple]] = ""
+
+    @property
+    def rendered_substitution(self) -> str:
+        """Substitution text, formatting a deferred (template, args) pair."""
+        return _render_substitution(self.substitution)
+
+    @property
+    def rendered_notes(self) -> str:
+        """Notes text, calling a deferred (function, args) pair."""
+        return _render_notes(self.notes)
+
+
+def _render_substitution(sub: Union[str, Tuple[str, tuple]]) -> str:
+    """Text of a step substitution that may be a deferred (template, args) pair."""
+    return sub[0].format(*sub[1]) if isinstance(sub, tuple) else sub
+
+
+def _render_notes(notes: Union[str, Tuple[Callable[..., str], tuple]]) -> str:
+    """Text of step notes that may be a deferred (function, args) pair."""
+    return notes[0](*notes[1]) if isinstance(notes, tuple) else notes
+
+
+# Report builders record steps as plain tuples in DetailedCalcStep field
+# order ("rows"); sections store them column-wise
+_STEP_FIELD_INDEX = {name: i for i, name in enumerate(DetailedCalcStep.__dataclass_fields__)}
+
+
+def _step_row(step: DetailedCalcStep) -> tuple:
+    """The row tuple of a DetailedCalcStep."""
+    return (step.step_number, step.title, step.description, step.equation,
+            step.substitution, step.result, step.unit, step.code_ref,
+            step.status, step.notes)
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedCalcSection:
     """
     A section of calculations (e.g., "Section Properties", "Flexural Strength")
     
+    The calculation steps are stored column-wise: one list or array per
+    DetailedCalcStep field, all parallel and indexed by step position.
+    
     Attributes:
         section_number: Sequential section number
         title: Section title
         description: Overview of what this section covers
         code_ref: Primary code reference for this section
-        steps: List of calculation steps
+        steps: Initial list of calculation steps (stored via set_steps)
         conclusion: Summary conclusion for this section
         status: Overall PASS/FAIL for this section
+        step_numbers: Step numbers as an int32 column
+        titles, descriptions, equations, substitutions: Step text columns
+        results: Step results as a float64 column
+        units, code_refs: Step text columns
+        statuses: Step statuses as an object (str) column
+        notes: Step notes column
+    
+    The columns are the only store. Reading section.steps gives a
+    read-only snapshot: a tuple of DetailedCalcStep objects built from the
+    columns on each access (O(n), so bind it once when iterating
+    repeatedly), which does not support append(). To change the steps,
+    assign section.steps, call set_steps()/set_rows(), or add_step().
     """
     section_number: int
     title: str
     description: str
     code_ref: str
-    steps: List[DetailedCalcStep] = field(default_factory=list)
+    steps: InitVar[Optional[List[DetailedCalcStep]]] = None
     conclusion: str = ""
     status: str = "PASS"
+    step_numbers: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32), init=False)
+    titles: List[str] = field(default_factory=list, init=False)
+    descriptions: List[str] = field(default_factory=list, init=False)
+    equations: List[str] = field(default_factory=list, init=False)
+    substitutions: List[Union[str, Tuple[str, tuple]]] = field(default_factory=list, init=False)
+    results: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64), init=False)
+    units: List[str] = field(default_factory=list, init=False)
+    code_refs: List[str] = field(default_factory=list, init=False)
+    statuses: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object), init=False)
+    notes: List[Union[str, Tuple[Callable[..., str], tuple]]] = field(default_factory=list, init=False)
+
+    def __post_init__(self, steps: Optional[List[DetailedCalcStep]]) -> None:
+        if steps:
+            self.set_steps(steps)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def _columns(self) -> tuple:
+        """The step columns in DetailedCalcStep field order, as Python lists."""
+        return (self.step_numbers.tolist(), self.titles, self.descriptions, self.equations,
+                self.substitutions, self.results.tolist(), self.units, self.code_refs,
+                self.statuses.tolist(), self.notes)
+
+    def _steps_snapshot(self) -> Tuple[DetailedCalcStep, ...]:
+        return tuple(DetailedCalcStep(*row) for row in zip(*self._columns()))
+
+    def set_rows(self, rows: List[tuple]) -> None:
+        """Assign the steps from row tuples in DetailedCalcStep field order."""
+        (step_numbers, self.titles, self.descriptions, self.equations, self.substitutions,
+         results, self.units, self.code_refs, statuses, self.notes) = (
+            [list(column) for column in zip(*rows)] if rows else [[] for _ in range(10)]
+        )
+        self.step_numbers = np.array(step_numbers, dtype=np.int32)
+        self.results = np.array(results, dtype=np.float64)
+        self.statuses = np.array(statuses, dtype=object)
+
+    def set_steps(self, steps: List[DetailedCalcStep]) -> None:
+        """Assign the steps from DetailedCalcStep objects."""
+        self.set_rows([_step_row(s) for s in steps])
+
+    def add_step(self, **kw) -> None:
+        """
+        Append one step, given as DetailedCalcStep fields. step_number
+        defaults to the next number. Meant for one-off steps; the report
+        builders collect their steps and assign them with set_rows().
+        """
+        kw.setdefault('step_number', len(self) + 1)
+        step = DetailedCalcStep(**kw)
+        self.titles.append(step.title)
+        self.descriptions.append(step.description)
+        self.equations.append(step.equation)
+        self.substitutions.append(step.substitution)
+        self.units.append(step.unit)
+        self.code_refs.append(step.code_ref)
+        self.notes.append(step.notes)
+        self.step_numbers = np.append(self.step_numbers, np.int32(step.step_number))
+        self.results = np.append(self.results, np.float64(step.result))
+        self.statuses = np.append(self.statuses, np.array([step.status], dtype=object))
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """The step_number, result and status columns, keyed by DetailedCalcStep field name."""
+        return {'step_number': self.step_numbers, 'result': self.results, 'status': self.statuses}
+
+
+# Defined after the dataclass is built, where the steps InitVar would
+# otherwise take the property as its default
+DetailedCalcSection.steps = property(
+    DetailedCalcSection._steps_snapshot, DetailedCalcSection.set_steps,
+    doc="Read-only snapshot of the calculation steps, built from the columns on each access."
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedDesignReport:
     """
     Complete detailed design report for a castellated/cellular beam.
@@ -92,6 +288,540 @@ class DetailedDesignReport:
             self.overall_status = "FAIL"
 
 
+def stack_section_columns(sections: List[DetailedCalcSection]) -> Dict[str, np.ndarray]:
+    """
+    Stack the step columns of the same section taken from many designs
+    into 2-D arrays (one row per design, one column per step), so that
+    questions across a parametric run become NumPy mask operations, e.g.
+    which steps failed in any design:
+    
+        (stack_section_columns(secs)['status'] == "FAIL").any(axis=0)
+    
+    Sections with fewer steps (other code branches) are padded with NaN
+    results and empty statuses.
+    """
+    width = max((len(sec.results) for sec in sections), default=0)
+    results = np.full((len(sections), width), np.nan)
+    statuses = np.full((len(sections), width), "", dtype=object)
+    for i, sec in enumerate(sections):
+        n = len(sec.results)
+        results[i, :n] = sec.results
+        statuses[i, :n] = sec.statuses
+    return {'result': results, 'status': statuses}
+
+
+# Keys of the properties dict returned by calc_section_properties_detailed
+_SECTION_PROPS_KEYS = (
+    'dg', 'ho', 'dt',
+    'A_tee', 'y_bar_tee', 'I_tee', 'S_tee',
+    'Ix_gross', 'Sx_gross', 'Zx_gross',
+    'Ix_net', 'Sx_net',
+    'b_wp', 'h_wp',
+    'expansion_ratio', 'ho_dg_ratio'
+)
+
+# Results returned by the strength checks alongside their report section
+class GlobalFlexureResult(NamedTuple):
+    My: float
+    Mp: float
+    Lp: float
+    Lr: float
+    Cb: float
+    Mn: float
+    Mn_design: float
+    ratio: float
+    gov_state: str
+
+
+class VierendeelResult(NamedTuple):
+    V_tee: float
+    Mvr: float
+    Mvr_total: float
+    Mn_tee: float
+    Mn_vr: float
+    Mn_vr_design: float
+    ratio: float
+
+
+class WebPostResult(NamedTuple):
+    lambda_wp: float
+    Fe_wp: float
+    Fcr: float
+    Pn_wp: float
+    Pn_design: float
+    ratio: float
+    buckle_type: str
+
+
+class HorizontalShearResult(NamedTuple):
+    Vh: float
+    Vn_h: float
+    Vn_design: float
+    ratio: float
+
+
+class VerticalShearResult(NamedTuple):
+    Aw_total: float
+    Cv: float
+    Vn: float
+    Vn_design: float
+    ratio: float
+
+
+class DeflectionResult(NamedTuple):
+    Ix_eff: float
+    alpha: float
+    delta: float
+    delta_live: float
+    delta_limit_total: float
+    delta_limit_live: float
+    ratio_total: float
+    ratio_live: float
+
+
+_SQRT12 = math.sqrt(12)
+
+_PI_SQ = math.pi ** 2
+_LN_0_658 = math.log(0.658)  # AISC column curve: 0.658**x == exp(_LN_0_658 * x)
+
+
+# Banner rules used in section conclusions
+_RULE_HEAVY = "═" * 78
+_RULE_LIGHT = "─" * 78
+
+# Fixed status and notes texts, selected by lookup instead of rebuilt per call
+_PASS = "PASS"
+_FAIL = "FAIL"
+_WARNING = "WARNING"
+_CHECK_STATUS = {True: _PASS, False: _FAIL}     # keyed by ratio <= 1.0
+_CLASS_STATUS = {True: _PASS, False: _WARNING}  # keyed by λ <= λp
+_COMPACTNESS = {True: "Compact", False: "Noncompact"}
+_NOTES_FLANGE = {True: "Flange is Compact (λf ≤ λpf)", False: "Flange is Noncompact (λf > λpf)"}
+_NOTES_STEM = {True: "Stem is Compact (λw ≤ λpw)", False: "Stem is Noncompact (λw > λpw)"}
+_NOTES_FLEXURE = {_PASS: "✓ OK - Flexural strength is adequate", _FAIL: "✗ NG - Flexural strength is inadequate"}
+_NOTES_VIERENDEEL = {_PASS: "✓ OK - Vierendeel bending is adequate", _FAIL: "✗ NG - Vierendeel bending capacity exceeded"}
+_NOTES_WEB_POST = {_PASS: "✓ OK - Web post buckling is adequate", _FAIL: "✗ NG - Web post buckling capacity exceeded"}
+_NOTES_H_SHEAR = {_PASS: "✓ OK - Horizontal shear is adequate", _FAIL: "✗ NG - Horizontal shear capacity exceeded"}
+
+# Web post h/tw above which the buckling check is not meaningful
+_WP_SLENDERNESS_LIMIT = 300
+
+# Vierendeel moment equation by opening type
+_EQ_MVR_CAST = "Mvr = V_tee × e"
+_EQ_MVR_CELL = "Mvr = V_tee × (Do/2)"
+
+# Substitution templates for calc_vierendeel_bending_detailed, parsed once
+# and filled with str.format per step
+_FMT = {
+    "v_tee": "V_tee = {Vu:.2f} / 2 = {V:.2f} kN",
+    "mvr": "Mvr = {V:.2f} × {a:.1f} / 1000",
+    "lambda_f": "λf = {bf}/(2×{tf}) = {lf:.2f}, λpf = 0.38×√({E}/{Fy}) = {lpf:.2f}",
+    "lambda_w": "λw = ({dt:.1f}-{tf})/{tw} = {lw:.2f}, λpw = 0.84×√({E}/{Fy}) = {lpw:.2f}",
+    "z_tee": "Zx,tee = 1.5 × {S:.0f}",
+    "mp_tee": "Mp,tee = {Fy} × {Z:.0f} / 10⁶",
+    "mn_tee_noncompact": "Mn,tee = {Mp:.3f} × [1 - 0.3×({lw:.2f}-{lpw:.2f})/({lrw:.2f}-{lpw:.2f})]",
+    "mn_tee_compact": "Mn,tee = {Mp:.3f}",
+    "mn_vr": "Mn,vr = 2 × {Mn:.3f}",
+    "mn_vr_lrfd": "φMn,vr = 0.90 × {Mn:.3f}",
+    "mn_vr_asd": "Mn,vr/Ωb = {Mn:.3f} / 1.67",
+    "vier_check": "{M:.3f} / {Mn:.3f}",
+}
+
+# Static step descriptions for the Vierendeel and web post reports
+_DESC = {
+    "vier_section": (
+        "Check local bending in tee sections at web openings per AISC DG31 Section 5.3. "
+        "As shear force is transferred across the opening, each tee section acts as a "
+        "short beam subjected to local bending moments (Vierendeel action)."
+    ),
+    "vier_mechanism": (
+        "When a shear force V is transferred across a web opening, each tee (top and bottom) "
+        "must resist local bending moments. The shear is shared between the tees approximately "
+        "in proportion to their flexural stiffness. For symmetric sections, each tee carries V/2."
+    ),
+    "vier_moment": (
+        "The local bending moment in each tee is calculated as the tee shear times "
+        "the moment arm (half-length of opening). This moment causes bending stress "
+        "in the tee section."
+    ),
+    "tee_flange": (
+        "Classify the tee flange as compact or noncompact for flexure. "
+        "Compact flanges can develop the full plastic moment."
+    ),
+    "tee_stem": (
+        "Classify the tee stem (web) as compact or noncompact for flexure. "
+        "This affects the available flexural strength of the tee."
+    ),
+    "tee_zx": (
+        "Estimate the plastic section modulus of the tee for calculating plastic moment. "
+        "For tee sections, Zx is typically about 1.5 times the elastic section modulus."
+    ),
+    "tee_mp": "Calculate the plastic moment capacity of one tee section.",
+    "tee_mn_noncompact": "Since the tee stem is noncompact, the nominal moment capacity is reduced.",
+    "tee_mn_compact": "Since the tee section is compact, the full plastic moment can be developed.",
+    "vier_capacity": (
+        "The total Vierendeel moment resistance is provided by both top and bottom tees "
+        "acting together. For symmetric sections, this is twice the single tee capacity."
+    ),
+    "vier_lrfd": "Apply the resistance factor φb = 0.90 for flexure.",
+    "vier_asd": "Apply the safety factor Ωb = 1.67 for flexure.",
+    "vier_check": "Compare the required Vierendeel moment to the available capacity.",
+    "wp_section": (
+        "Check web post stability under combined horizontal shear and compression "
+        "per AISC DG31 Section 5.4. The web post is the solid web region between "
+        "adjacent openings and must resist forces transferred between tees."
+    ),
+    "wp_dimensions": (
+        "The web post is the solid web region between adjacent openings. "
+        "Its geometry affects its buckling resistance."
+    ),
+    "wp_height": (
+        "The effective height of the web post for buckling analysis. "
+        "This is the height over which buckling can occur."
+    ),
+    "wp_slenderness": "The slenderness ratio of the web post, which affects its buckling capacity.",
+    "wp_width_ratio": "The ratio of web post width to opening height affects the buckling mode.",
+    "wp_fe": "Calculate the elastic buckling stress of the web post as a compression element.",
+    "wp_width_ratio_cell": "The ratio of web post width to opening diameter.",
+    "wp_fe_cell": "Elastic buckling stress for the web post between circular openings.",
+    "wp_fe_fy": (
+        "Compare elastic buckling stress to yield stress to determine which "
+        "column curve equation applies."
+    ),
+    "wp_fcr_inelastic": "Since Fe ≥ 2.25Fy, inelastic buckling governs. Use AISC Eq. E3-2.",
+    "wp_fcr_elastic": "Since Fe < 2.25Fy, elastic buckling governs. Use AISC Eq. E3-3.",
+    "wp_area": "The effective area of the web post resisting buckling forces.",
+    "wp_pn": "The nominal web post buckling resistance.",
+    "wp_lrfd": "Apply the resistance factor φc = 0.90 for compression.",
+    "wp_asd": "Apply the safety factor Ωc = 1.67 for compression.",
+    "wp_check": "Compare the horizontal shear force in the web post to its buckling capacity.",
+}
+
+
+# Fixed-precision number formatting for step substitutions
+def _f0(x: float) -> str:
+    return format(x, '.0f')
+
+
+def _f1(x: float) -> str:
+    return format(x, '.1f')
+
+
+def _f2(x: float) -> str:
+    return format(x, '.2f')
+
+
+class _StepBuf:
+    """
+    Numbered step collector for the report builders.
+    
+    emit() takes the DetailedCalcStep fields other than step_number, and
+    emit_from() a step template plus the fields to fill in; both number
+    steps sequentially from 1. Steps are kept as row tuples (see
+    DetailedCalcSection.set_rows), so no DetailedCalcStep is built here. The
+    list is preallocated to an expected step count and grows past it if
+    needed.
+    """
+    __slots__ = ('rows', 'n')
+    wants_conclusion = True
+    
+    def __init__(self, size: int = 0):
+        self.rows = [None] * size
+        self.n = 0
+    
+    def _put(self, row: tuple) -> None:
+        if self.n < len(self.rows):
+            self.rows[self.n] = row
+        else:
+            self.rows.append(row)
+        self.n += 1
+    
+    def emit(self, title: str, description: str, equation: str, substitution,
+             result: float, unit: str, code_ref: str,
+             status: str = "INFO", notes="") -> None:
+        self._put((self.n + 1, title, description, equation, substitution,
+                   result, unit, code_ref, status, notes))
+    
+    def emit_from(self, template: DetailedCalcStep, **kw) -> None:
+        """emit() for a step template, filling in only the given fields."""
+        row = list(_step_row(template))
+        row[0] = self.n + 1
+        for name, value in kw.items():
+            row[_STEP_FIELD_INDEX[name]] = value
+        self._put(tuple(row))
+    
+    def to_rows(self) -> List[tuple]:
+        return self.rows[:self.n]
+
+
+class _NullStepBuf:
+    """
+    Step sink for callers that only want the numeric results: emit()
+    discards its arguments without building a DetailedCalcStep, and the
+    conclusion text is skipped.
+    """
+    __slots__ = ()
+    wants_conclusion = False
+    
+    def emit(self, **kw) -> None:
+        pass
+    
+    def emit_from(self, template: DetailedCalcStep, **kw) -> None:
+        pass
+    
+    def to_rows(self) -> List[tuple]:
+        return []
+
+
+_NULL_STEPS = _NullStepBuf()
+
+def _conclusion_formatter(template: str, **derived: Callable[[Dict], object]) -> Callable[[Dict], str]:
+    """
+    Return a function that fills a str.format template from a dict of
+    values (usually the report builder's locals()).
+    
+    Each keyword in derived names a display-only field that is computed
+    from the dict when the template is filled.
+    """
+    if not derived:
+        return template.format_map
+    
+    def _format(ctx: Dict) -> str:
+        return template.format_map({**ctx, **{name: fn(ctx) for name, fn in derived.items()}})
+    return _format
+
+
+# Section summary formatters, filled from the report builder's locals
+_FLEXURE_CONCLUSION = _conclusion_formatter("""
+GLOBAL FLEXURAL STRENGTH SUMMARY:
+══════════════════════════════════════════════════════════════════════════════
+Design Method: {method}
+Governing Limit State: {gov_state}
+──────────────────────────────────────────────────────────────────────────────
+CAPACITY:
+  Yield Moment (My):            {My:.2f} kN·m
+  Plastic Moment (Mp):          {Mp:.2f} kN·m
+  Nominal Strength (Mn):        {Mn:.2f} kN·m
+  Design Strength (φMn or Mn/Ω):{Mn_design:.2f} kN·m
+──────────────────────────────────────────────────────────────────────────────
+DEMAND:
+  Required Strength (Mu):       {Mu:.2f} kN·m
+──────────────────────────────────────────────────────────────────────────────
+CHECK:
+  D/C Ratio:                    {ratio:.3f}
+  Status:                       {status}
+══════════════════════════════════════════════════════════════════════════════
+""")
+
+_H_SHEAR_CONCLUSION = _conclusion_formatter("""
+HORIZONTAL SHEAR SUMMARY:
+══════════════════════════════════════════════════════════════════════════════
+Design Method: {method}
+──────────────────────────────────────────────────────────────────────────────
+CAPACITY:
+  Shear area (Aw):              {A_wp_shear:.0f} mm²
+  Shear yield stress (0.6Fy):   {Fv:.1f} MPa
+  Nominal capacity (Vn):        {Vn_h:.2f} kN
+  Design capacity:              {Vn_design:.2f} kN
+──────────────────────────────────────────────────────────────────────────────
+DEMAND:
+  Horizontal shear (Vh):        {Vh:.2f} kN
+──────────────────────────────────────────────────────────────────────────────
+CHECK:
+  D/C Ratio:                    {ratio:.3f}
+  Status:                       {status}
+══════════════════════════════════════════════════════════════════════════════
+""")
+
+_V_SHEAR_CONCLUSION = _conclusion_formatter("""
+VERTICAL SHEAR AT OPENINGS SUMMARY:
+══════════════════════════════════════════════════════════════════════════════
+Design Method: {method}
+Shear Behavior: {shear_type}
+──────────────────────────────────────────────────────────────────────────────
+SHEAR AREA:
+  Tee stem depth (d_stem):      {d_stem:.1f} mm
+  Total shear area (Aw):        {Aw_total:.0f} mm²
+  Web slenderness (h/tw):       {h_tw:.1f}
+  Shear coefficient (Cv):       {Cv:.3f}
+──────────────────────────────────────────────────────────────────────────────
+CAPACITY:
+  Nominal capacity (Vn):        {Vn:.2f} kN
+  Design capacity:              {Vn_design:.2f} kN
+──────────────────────────────────────────────────────────────────────────────
+DEMAND:
+  Required shear (Vu):          {Vu:.2f} kN
+──────────────────────────────────────────────────────────────────────────────
+CHECK:
+  D/C Ratio:                    {ratio:.3f}
+  Status:                       {status}
+══════════════════════════════════════════════════════════════════════════════
+""")
+
+_DEFLECTION_CONCLUSION = _conclusion_formatter("""
+DEFLECTION SUMMARY:
+══════════════════════════════════════════════════════════════════════════════
+STIFFNESS:
+  Gross Ix:                     {Ix_gross_e6:.2f} × 10⁶ mm⁴
+  Net Ix (at opening):          {Ix_net_e6:.2f} × 10⁶ mm⁴
+  Effective Ix:                 {Ix_eff_e6:.2f} × 10⁶ mm⁴
+  Reduction factor (α):         {alpha:.3f}
+──────────────────────────────────────────────────────────────────────────────
+CALCULATED DEFLECTIONS:
+  Total load deflection:        {delta:.2f} mm = L/{span_ratio:.0f}
+  Live load deflection:         {delta_live:.2f} mm = L/{live_span_ratio}
+──────────────────────────────────────────────────────────────────────────────
+LIMITS:
+  Total (L/240):                {delta_limit_total:.2f} mm
+  Live (L/360):                 {delta_limit_live:.2f} mm
+──────────────────────────────────────────────────────────────────────────────
+CHECKS:
+  Total D/C:                    {ratio_total:.3f} {total_mark}
+  Live D/C:                     {ratio_live:.3f} {live_mark}
+  Overall Status:               {status}
+══════════════════════════════════════════════════════════════════════════════
+""", live_span_ratio=lambda ctx: _live_span_ratio(ctx['L'], ctx['delta_live']))
+
+
+# =============================================================================
+# STEP TEMPLATES
+# Static text for steps whose wording never changes; _StepBuf.emit_from()
+# copies a template's row and fills in only the per-call fields.
+# =============================================================================
+
+_TPL_TEE_DEPTH = DetailedCalcStep(
+    step_number=0,
+    title="Tee Section Depth",
+    description="The tee depth is the depth of the top or bottom tee section at the opening location. "
+                "This is critical for Vierendeel bending capacity. "
+                "Both top and bottom tees are assumed symmetric.",
+    equation="dt = (dg - ho) / 2",
+    unit="mm",
+    code_ref="AISC DG31 §4.1",
+    substitution="",
+    result=0.0
+)
+
+_TPL_TEE_AREA = DetailedCalcStep(
+    step_number=0,
+    title="Tee Section Area",
+    description="Calculate the cross-sectional area of one tee section (top or bottom). "
+                "The tee consists of the flange plus the stem portion of the web.",
+    equation="A_tee = bf × tf + (dt - tf) × tw",
+    unit="mm²",
+    code_ref="AISC DG31 §4.2",
+    substitution="",
+    result=0.0
+)
+
+_TPL_TEE_CENTROID = DetailedCalcStep(
+    step_number=0,
+    title="Tee Section Centroid",
+    description="Locate the centroid of the tee section measured from the outer face of the flange. "
+                "This is needed for calculating tee moment of inertia and section modulus.",
+    equation="ȳ_tee = Σ(A_i × y_i) / A_tee",
+    unit="mm (from flange face)",
+    code_ref="Mechanics of Materials",
+    substitution="",
+    result=0.0
+)
+
+_TPL_TEE_INERTIA = DetailedCalcStep(
+    step_number=0,
+    title="Tee Section Moment of Inertia",
+    description="Calculate the moment of inertia of the tee about its centroidal axis "
+                "using the parallel axis theorem. This is critical for Vierendeel bending analysis.",
+    equation="I_tee = I_flange + I_stem (using parallel axis theorem)",
+    unit="mm⁴",
+    code_ref="AISC DG31 §4.2",
+    substitution="",
+    result=0.0
+)
+
+_TPL_TEE_MODULUS = DetailedCalcStep(
+    step_number=0,
+    title="Tee Section Modulus (at stem)",
+    description="Calculate the elastic section modulus of the tee at the stem tip, "
+                "which is typically the critical location for Vierendeel bending stress.",
+    equation="S_tee = I_tee / c_stem where c_stem = dt - ȳ_tee",
+    unit="mm³",
+    code_ref="AISC DG31 §4.2",
+    substitution="",
+    result=0.0
+)
+
+_TPL_IX_GROSS = DetailedCalcStep(
+    step_number=0,
+    title="Gross Section Moment of Inertia",
+    description="Calculate the moment of inertia of the full expanded section at a solid web location "
+                "(between openings) using the parallel axis theorem applied to both tees.",
+    equation="Ix,gross = 2 × (I_tee + A_tee × d²) where d = dg/2 - ȳ_tee",
+    unit="mm⁴",
+    code_ref="AISC DG31 §4.3",
+    substitution="",
+    result=0.0
+)
+
+_TPL_SX_GROSS = DetailedCalcStep(
+    step_number=0,
+    title="Gross Section Modulus",
+    description="Calculate the elastic section modulus of the gross expanded section.",
+    equation="Sx,gross = Ix,gross / (dg/2)",
+    unit="mm³",
+    code_ref="AISC DG31 §4.3",
+    substitution="",
+    result=0.0
+)
+
+_TPL_ZX_GROSS = DetailedCalcStep(
+    step_number=0,
+    title="Gross Plastic Section Modulus",
+    description="Estimate the plastic section modulus. For I-shaped sections, the shape factor "
+                "is typically about 1.12.",
+    equation="Zx,gross ≈ 1.12 × Sx,gross (shape factor for I-sections)",
+    unit="mm³",
+    code_ref="AISC DG31 §4.3",
+    substitution="",
+    result=0.0
+)
+
+_TPL_IX_NET = DetailedCalcStep(
+    step_number=0,
+    title="Net Section Moment of Inertia (at opening)",
+    description="Calculate the moment of inertia at the opening centerline where the web is absent. "
+                "The section consists of two separated tees. This is a conservative lower bound "
+                "that considers only the parallel axis contribution.",
+    equation="Ix,net = 2 × A_tee × d²net where dnet = dg/2 - dt/2",
+    unit="mm⁴",
+    code_ref="AISC DG31 §4.4",
+    substitution="",
+    result=0.0
+)
+
+_TPL_SX_NET = DetailedCalcStep(
+    step_number=0,
+    title="Net Section Modulus (at opening)",
+    description="Calculate the elastic section modulus at the opening centerline.",
+    equation="Sx,net = Ix,net / (dg/2)",
+    unit="mm³",
+    code_ref="AISC DG31 §4.4",
+    substitution="",
+    result=0.0
+)
+
+_TPL_WP_SLENDERNESS = DetailedCalcStep(
+    step_number=0,
+    title="Web Post Slenderness",
+    description="The web post slenderness ratio affects the buckling capacity. "
+                "Higher slenderness indicates more susceptibility to buckling.",
+    equation="λ_wp = ho / tw",
+    unit="-",
+    code_ref="AISC DG31 §5.4",
+    substitution="",
+    result=0.0
+)
+
+
 # =============================================================================
 # DETAILED CALCULATION FUNCTIONS
 # =============================================================================
@@ -102,8 +832,9 @@ def calc_section_properties_detailed(
     A: float, Ix: float,
     beam_type: str,
     ho: float, e: float, b: float, S: float, theta: float = 60,
-    Do: float = 0
-) -> DetailedCalcSection:
+    Do: float = 0,
+    verbose: bool = True
+) -> Tuple[DetailedCalcSection, Dict]:
     """
     Calculate expanded section properties with full detailed steps.
     
@@ -120,6 +851,8 @@ def calc_section_properties_detailed(
         S: Opening spacing (mm)
         theta: Cutting angle (degrees) - castellated only
         Do: Opening diameter (mm) - cellular only
+        verbose: If False, the steps go to a null sink and the conclusion
+                 text is skipped
         
     Returns:
         DetailedCalcSection with all calculation steps
@@ -131,15 +864,12 @@ def calc_section_properties_detailed(
         code_ref="AISC DG31 §3, §4"
     )
     
-    steps = []
-    step_num = 0
+    buf = _StepBuf(17) if verbose else _NULL_STEPS
     
     # =========================================================================
     # 1. PARENT SECTION DATA
     # =========================================================================
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Parent Section Properties",
         description=f"Record the properties of the parent section {parent_name} before cutting",
         equation="Given data from section tables",
@@ -148,189 +878,149 @@ def calc_section_properties_detailed(
         unit="mm (depth)",
         code_ref="Section Tables",
         status="INFO"
-    ))
+    )
     
     # =========================================================================
     # 2. EXPANDED DEPTH CALCULATION
     # =========================================================================
-    if beam_type == "Castellated":
+    bt = BeamType.coerce(beam_type)
+    if bt == BeamType.CASTELLATED:
         # For castellated: dg = d + ho/2 (cutting and re-welding adds half opening height)
         dg = d + ho / 2
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Expanded Beam Depth (Castellated)",
             description="The expanded depth is the original depth plus half the opening height. "
                        "When the beam is cut along the zigzag pattern and the halves are offset and rewelded, "
                        "the total depth increases by ho/2.",
             equation="dg = d + ho/2",
-            substitution=f"dg = {d} + {ho}/2 = {d} + {ho/2:.1f}",
+            substitution=f"dg = {d} + {ho}/2 = {d} + {_f1(ho/2)}",
             result=dg,
             unit="mm",
             code_ref="AISC DG31 §3.2, Eq. 3-1"
-        ))
+        )
     else:  # Cellular
         # For cellular: dg = d + Do/2
         dg = d + Do / 2
         ho = Do  # For cellular, ho = Do
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Expanded Beam Depth (Cellular)",
             description="For cellular beams, the expanded depth equals the original depth plus half the opening diameter. "
                        "The cutting and re-welding process increases depth by Do/2.",
             equation="dg = d + Do/2",
-            substitution=f"dg = {d} + {Do}/2 = {d} + {Do/2:.1f}",
+            substitution=f"dg = {d} + {Do}/2 = {d} + {_f1(Do/2)}",
             result=dg,
             unit="mm",
             code_ref="AISC DG31 §3.3, Eq. 3-2"
-        ))
+        )
+    
+    # Formatted once: dg, ho and dt recur in most substitutions below
+    dg_s, half_dg_s, ho_s = _f1(dg), _f1(dg / 2), _f1(ho)
     
     # =========================================================================
     # 3. EXPANSION RATIO CHECK
     # =========================================================================
     expansion_ratio = dg / d
-    step_num += 1
     exp_status = "PASS" if 1.25 <= expansion_ratio <= 1.75 else "WARNING"
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Expansion Ratio",
         description="The expansion ratio is the ratio of expanded depth to original depth. "
                    "Typical values range from 1.3 to 1.6 for efficient designs. "
                    "Values outside 1.25-1.75 may indicate non-optimal geometry.",
         equation="Expansion Ratio = dg / d",
-        substitution=f"Expansion Ratio = {dg:.1f} / {d:.1f}",
+        substitution=f"Expansion Ratio = {dg_s} / {d:.1f}",
         result=expansion_ratio,
         unit="-",
         code_ref="AISC DG31 §3.2",
         status=exp_status,
         notes="Recommended range: 1.3 to 1.6 for optimal efficiency"
-    ))
+    )
     
     # =========================================================================
     # 4. TEE DEPTH CALCULATION
     # =========================================================================
     dt = (dg - ho) / 2
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Tee Section Depth",
-        description="The tee depth is the depth of the top or bottom tee section at the opening location. "
-                   "This is critical for Vierendeel bending capacity. "
-                   "Both top and bottom tees are assumed symmetric.",
-        equation="dt = (dg - ho) / 2",
-        substitution=f"dt = ({dg:.1f} - {ho:.1f}) / 2",
-        result=dt,
-        unit="mm",
-        code_ref="AISC DG31 §4.1"
-    ))
+    dt_s = _f1(dt)
+    buf.emit_from(
+        _TPL_TEE_DEPTH,
+        substitution=f"dt = ({dg_s} - {ho_s}) / 2",
+        result=dt
+    )
     
     # =========================================================================
     # 5. TEE DEPTH ADEQUACY CHECK
     # =========================================================================
     dt_min = tf + 3 * tw
-    step_num += 1
     dt_status = "PASS" if dt >= dt_min else "FAIL"
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Tee Depth Adequacy Check",
         description="The tee depth must be sufficient to provide adequate flexural and shear capacity. "
                    "A minimum tee depth of tf + 3×tw is recommended to ensure stability "
                    "and prevent local failures.",
         equation="dt ≥ dt,min = tf + 3×tw",
-        substitution=f"dt = {dt:.1f} mm ≥ dt,min = {tf} + 3×{tw} = {dt_min:.1f} mm",
+        substitution=f"dt = {dt_s} mm ≥ dt,min = {tf} + 3×{tw} = {dt_min:.1f} mm",
         result=dt,
         unit="mm",
         code_ref="AISC DG31 §3.3",
         status=dt_status,
-        notes=f"dt,min = {dt_min:.1f} mm; dt,provided = {dt:.1f} mm; Ratio = {dt/dt_min:.2f}"
-    ))
+        notes=f"dt,min = {dt_min:.1f} mm; dt,provided = {dt_s} mm; Ratio = {_f2(dt/dt_min)}"
+    )
     
     # =========================================================================
     # 6. OPENING HEIGHT TO DEPTH RATIO
     # =========================================================================
     ho_dg_ratio = ho / dg
-    step_num += 1
     ratio_status = "PASS" if 0.4 <= ho_dg_ratio <= 0.7 else "WARNING"
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Opening Height to Depth Ratio",
         description="The ratio of opening height to expanded depth affects both structural efficiency "
                    "and aesthetics. Too small reduces the benefit of openings; too large weakens the section.",
         equation="ho/dg",
-        substitution=f"ho/dg = {ho:.1f} / {dg:.1f}",
+        substitution=f"ho/dg = {ho_s} / {dg_s}",
         result=ho_dg_ratio,
         unit="-",
         code_ref="AISC DG31 §3.2",
         status=ratio_status,
         notes="Recommended range: 0.50 to 0.70 for optimal performance"
-    ))
+    )
     
     # =========================================================================
     # 7. TEE SECTION PROPERTIES
     # =========================================================================
     # Area of one tee
     A_tee = bf * tf + (dt - tf) * tw
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Tee Section Area",
-        description="Calculate the cross-sectional area of one tee section (top or bottom). "
-                   "The tee consists of the flange plus the stem portion of the web.",
-        equation="A_tee = bf × tf + (dt - tf) × tw",
-        substitution=f"A_tee = {bf} × {tf} + ({dt:.1f} - {tf}) × {tw}",
-        result=A_tee,
-        unit="mm²",
-        code_ref="AISC DG31 §4.2"
-    ))
+    A_tee_s = _f0(A_tee)
+    buf.emit_from(
+        _TPL_TEE_AREA,
+        substitution=f"A_tee = {bf} × {tf} + ({dt_s} - {tf}) × {tw}",
+        result=A_tee
+    )
     
     # Centroid of tee from outer flange face
     y_bar_tee = (bf * tf * tf/2 + (dt - tf) * tw * (tf + (dt-tf)/2)) / A_tee
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Tee Section Centroid",
-        description="Locate the centroid of the tee section measured from the outer face of the flange. "
-                   "This is needed for calculating tee moment of inertia and section modulus.",
-        equation="ȳ_tee = Σ(A_i × y_i) / A_tee",
-        substitution=f"ȳ_tee = ({bf}×{tf}×{tf/2:.1f} + {(dt-tf):.1f}×{tw}×{(tf+(dt-tf)/2):.1f}) / {A_tee:.0f}",
-        result=y_bar_tee,
-        unit="mm (from flange face)",
-        code_ref="Mechanics of Materials"
-    ))
+    buf.emit_from(
+        _TPL_TEE_CENTROID,
+        substitution=f"ȳ_tee = ({bf}×{tf}×{tf/2:.1f} + {(dt-tf):.1f}×{tw}×{(tf+(dt-tf)/2):.1f}) / {A_tee_s}",
+        result=y_bar_tee
+    )
     
     # Moment of inertia of tee about its own centroid
     I_flange = bf * tf**3 / 12 + bf * tf * (y_bar_tee - tf/2)**2
     I_stem = tw * (dt - tf)**3 / 12 + tw * (dt - tf) * (tf + (dt-tf)/2 - y_bar_tee)**2
     I_tee = I_flange + I_stem
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Tee Section Moment of Inertia",
-        description="Calculate the moment of inertia of the tee about its centroidal axis "
-                   "using the parallel axis theorem. This is critical for Vierendeel bending analysis.",
-        equation="I_tee = I_flange + I_stem (using parallel axis theorem)",
+    buf.emit_from(
+        _TPL_TEE_INERTIA,
         substitution=f"I_tee = {I_flange/1e6:.4f}×10⁶ + {I_stem/1e6:.4f}×10⁶",
-        result=I_tee,
-        unit="mm⁴",
-        code_ref="AISC DG31 §4.2"
-    ))
+        result=I_tee
+    )
     
     # Section modulus of tee (at stem tip - critical location)
     c_stem = dt - y_bar_tee
     S_tee = I_tee / c_stem
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Tee Section Modulus (at stem)",
-        description="Calculate the elastic section modulus of the tee at the stem tip, "
-                   "which is typically the critical location for Vierendeel bending stress.",
-        equation="S_tee = I_tee / c_stem where c_stem = dt - ȳ_tee",
+    buf.emit_from(
+        _TPL_TEE_MODULUS,
         substitution=f"S_tee = {I_tee:.0f} / {c_stem:.1f}",
-        result=S_tee,
-        unit="mm³",
-        code_ref="AISC DG31 §4.2"
-    ))
+        result=S_tee
+    )
     
     # =========================================================================
     # 8. GROSS SECTION PROPERTIES (AT SOLID SECTION)
@@ -339,46 +1029,26 @@ def calc_section_properties_detailed(
     # Distance from neutral axis to tee centroid
     d_NA = dg/2 - y_bar_tee
     Ix_gross = 2 * (I_tee + A_tee * d_NA**2)
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Gross Section Moment of Inertia",
-        description="Calculate the moment of inertia of the full expanded section at a solid web location "
-                   "(between openings) using the parallel axis theorem applied to both tees.",
-        equation="Ix,gross = 2 × (I_tee + A_tee × d²) where d = dg/2 - ȳ_tee",
-        substitution=f"Ix,gross = 2 × ({I_tee:.0f} + {A_tee:.0f} × {d_NA:.1f}²)",
-        result=Ix_gross,
-        unit="mm⁴",
-        code_ref="AISC DG31 §4.3"
-    ))
+    buf.emit_from(
+        _TPL_IX_GROSS,
+        substitution=f"Ix,gross = 2 × ({I_tee:.0f} + {A_tee_s} × {d_NA:.1f}²)",
+        result=Ix_gross
+    )
     
     Sx_gross = Ix_gross / (dg / 2)
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Gross Section Modulus",
-        description="Calculate the elastic section modulus of the gross expanded section.",
-        equation="Sx,gross = Ix,gross / (dg/2)",
-        substitution=f"Sx,gross = {Ix_gross:.0f} / {dg/2:.1f}",
-        result=Sx_gross,
-        unit="mm³",
-        code_ref="AISC DG31 §4.3"
-    ))
+    buf.emit_from(
+        _TPL_SX_GROSS,
+        substitution=f"Sx,gross = {Ix_gross:.0f} / {half_dg_s}",
+        result=Sx_gross
+    )
     
     # Plastic section modulus (approximate as 1.12 × Sx for I-shapes)
     Zx_gross = Sx_gross * 1.12
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Gross Plastic Section Modulus",
-        description="Estimate the plastic section modulus. For I-shaped sections, the shape factor "
-                   "is typically about 1.12.",
-        equation="Zx,gross ≈ 1.12 × Sx,gross (shape factor for I-sections)",
+    buf.emit_from(
+        _TPL_ZX_GROSS,
         substitution=f"Zx,gross = 1.12 × {Sx_gross:.0f}",
-        result=Zx_gross,
-        unit="mm³",
-        code_ref="AISC DG31 §4.3"
-    ))
+        result=Zx_gross
+    )
     
     # =========================================================================
     # 9. NET SECTION PROPERTIES (AT OPENING)
@@ -387,42 +1057,26 @@ def calc_section_properties_detailed(
     # Net Ix is based on tees acting compositely through Vierendeel action
     d_net = dg/2 - dt/2  # Distance from NA to centroid of each tee
     Ix_net = 2 * A_tee * d_net**2  # Conservative: ignores tee's own I
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Net Section Moment of Inertia (at opening)",
-        description="Calculate the moment of inertia at the opening centerline where the web is absent. "
-                   "The section consists of two separated tees. This is a conservative lower bound "
-                   "that considers only the parallel axis contribution.",
-        equation="Ix,net = 2 × A_tee × d²net where dnet = dg/2 - dt/2",
-        substitution=f"Ix,net = 2 × {A_tee:.0f} × {d_net:.1f}²",
-        result=Ix_net,
-        unit="mm⁴",
-        code_ref="AISC DG31 §4.4"
-    ))
+    buf.emit_from(
+        _TPL_IX_NET,
+        substitution=f"Ix,net = 2 × {A_tee_s} × {d_net:.1f}²",
+        result=Ix_net
+    )
     
     Sx_net = Ix_net / (dg / 2)
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Net Section Modulus (at opening)",
-        description="Calculate the elastic section modulus at the opening centerline.",
-        equation="Sx,net = Ix,net / (dg/2)",
-        substitution=f"Sx,net = {Ix_net:.0f} / {dg/2:.1f}",
-        result=Sx_net,
-        unit="mm³",
-        code_ref="AISC DG31 §4.4"
-    ))
+    buf.emit_from(
+        _TPL_SX_NET,
+        substitution=f"Sx,net = {Ix_net:.0f} / {half_dg_s}",
+        result=Sx_net
+    )
     
     # =========================================================================
     # 10. WEB POST PROPERTIES (FOR BUCKLING CHECK)
     # =========================================================================
-    if beam_type == "Castellated":
+    if bt == BeamType.CASTELLATED:
         # Web post width for castellated
         b_wp = b
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Web Post Width (Castellated)",
             description="The web post is the solid web region between adjacent openings. "
                        "For castellated beams, this equals the parameter 'b' from the cutting pattern.",
@@ -431,13 +1085,11 @@ def calc_section_properties_detailed(
             result=b_wp,
             unit="mm",
             code_ref="AISC DG31 §3.4"
-        ))
+        )
     else:
         # Web post width for cellular
         b_wp = S - Do
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Web Post Width (Cellular)",
             description="For cellular beams, the web post width is the spacing minus the diameter.",
             equation="b_wp = S - Do",
@@ -445,46 +1097,40 @@ def calc_section_properties_detailed(
             result=b_wp,
             unit="mm",
             code_ref="AISC DG31 §3.5"
-        ))
+        )
     
     # Web post slenderness
     h_wp = ho  # Height of web post
     wp_slenderness = h_wp / tw
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Web Post Slenderness",
-        description="The web post slenderness ratio affects the buckling capacity. "
-                   "Higher slenderness indicates more susceptibility to buckling.",
-        equation="λ_wp = ho / tw",
-        substitution=f"λ_wp = {ho:.1f} / {tw}",
-        result=wp_slenderness,
-        unit="-",
-        code_ref="AISC DG31 §5.4"
-    ))
+    buf.emit_from(
+        _TPL_WP_SLENDERNESS,
+        substitution=f"λ_wp = {ho_s} / {tw}",
+        result=wp_slenderness
+    )
     
     # =========================================================================
     # SECTION SUMMARY
     # =========================================================================
-    section.steps = steps
-    section.conclusion = f"""
+    section.set_rows(buf.to_rows())
+    if buf.wants_conclusion:
+        section.conclusion = f"""
 SECTION PROPERTIES SUMMARY:
 ══════════════════════════════════════════════════════════════════════════════
 Parent Section: {parent_name}
-Beam Type: {beam_type}
+Beam Type: {bt.label}
 ──────────────────────────────────────────────────────────────────────────────
 GEOMETRY:
   Original depth (d):           {d:.1f} mm
-  Expanded depth (dg):          {dg:.1f} mm
+  Expanded depth (dg):          {dg_s} mm
   Expansion ratio (dg/d):       {expansion_ratio:.3f}
-  Opening height (ho):          {ho:.1f} mm
+  Opening height (ho):          {ho_s} mm
   Opening ratio (ho/dg):        {ho_dg_ratio:.3f}
-  Tee depth (dt):               {dt:.1f} mm
+  Tee depth (dt):               {dt_s} mm
   Web post width (b_wp):        {b_wp:.1f} mm
   Opening spacing (S):          {S:.1f} mm
 ──────────────────────────────────────────────────────────────────────────────
 SECTION PROPERTIES:
-  Tee area (A_tee):             {A_tee:.0f} mm²
+  Tee area (A_tee):             {A_tee_s} mm²
   Tee centroid (ȳ_tee):         {y_bar_tee:.1f} mm (from flange)
   Tee moment of inertia:        {I_tee/1e6:.4f} × 10⁶ mm⁴
   Tee section modulus:          {S_tee:.0f} mm³
@@ -504,13 +1150,86 @@ SECTION PROPERTIES:
     elif expansion_ratio < 1.25 or expansion_ratio > 1.75:
         section.status = "WARNING"
     
-    return section, {
-        'dg': dg, 'ho': ho, 'dt': dt,
-        'A_tee': A_tee, 'y_bar_tee': y_bar_tee, 'I_tee': I_tee, 'S_tee': S_tee,
-        'Ix_gross': Ix_gross, 'Sx_gross': Sx_gross, 'Zx_gross': Zx_gross,
-        'Ix_net': Ix_net, 'Sx_net': Sx_net,
-        'b_wp': b_wp, 'h_wp': h_wp,
-        'expansion_ratio': expansion_ratio, 'ho_dg_ratio': ho_dg_ratio
+    return section, dict(zip(_SECTION_PROPS_KEYS, (
+        dg, ho, dt,
+        A_tee, y_bar_tee, I_tee, S_tee,
+        Ix_gross, Sx_gross, Zx_gross,
+        Ix_net, Sx_net,
+        b_wp, h_wp,
+        expansion_ratio, ho_dg_ratio
+    )))
+
+
+def _global_flexure_core(
+    dg: float, bf: float, tf: float, ho: float,
+    Sx_gross: float, Zx_gross: float,
+    Fy: float, E: float,
+    Mu: float, Lb: float,
+    method: str = "LRFD"
+) -> Dict:
+    """
+    Numeric part of calc_global_flexure_detailed (no report text).
+    
+    Returns:
+        Dict of all intermediate and final values used by the report
+    """
+    My = Fy * Sx_gross / 1e6  # kN·m
+    Mp = Fy * Zx_gross / 1e6  # kN·m
+    
+    # Radius of gyration about weak axis for compression flange
+    ry = bf / _SQRT12
+    # Limiting unbraced length Lp (plastic)
+    sqrt_E_over_Fy = math.sqrt(E / Fy)
+    Lp = 1.76 * ry * sqrt_E_over_Fy
+    
+    # Effective radius of gyration rts (Eq. F2-7 with Cw = Iy·ho²/4 for a
+    # doubly symmetric section, so rts² = Iy·ho / 2Sx). Lr below depends on
+    # rts and is always reported, so this cannot be skipped when Lb ≤ Lp.
+    Iy_flange = tf * bf**3 / 12
+    rts = max(math.sqrt(Iy_flange * (dg/2) / Sx_gross), bf/6)  # Ensure reasonable value
+    
+    # Modification factor for openings
+    ho_factor = max(0.7, 1 - 0.3 * ho / dg)
+    
+    # Limiting unbraced length Lr (inelastic)
+    Lr = 1.95 * rts * (E / (0.7 * Fy)) * ho_factor
+    Lr = max(Lr, 1.5 * Lp)  # Ensure Lr > Lp
+    
+    Cb = 1.0  # Conservative for uniform moment
+    
+    Mn_calc = Fcr = Lb_over_rts_sq = 0.0
+    if Lb <= Lp:
+        # Yielding governs - full plastic moment
+        Mn = Mp
+        gov_state = "Yielding (Lb ≤ Lp)"
+    elif Lb <= Lr:
+        # Inelastic LTB
+        Mn_calc = Cb * (Mp - (Mp - 0.7 * My) * (Lb - Lp) / (Lr - Lp))
+        Mn = min(Mn_calc, Mp)
+        gov_state = "Inelastic LTB (Lp < Lb ≤ Lr)"
+    else:
+        # Elastic LTB
+        Lb_over_rts = Lb / rts
+        Lb_over_rts_sq = Lb_over_rts * Lb_over_rts
+        Fcr = Cb * _PI_SQ * E / Lb_over_rts_sq
+        Mn_calc = Fcr * Sx_gross / 1e6
+        Mn = min(Mn_calc, Mp)
+        gov_state = "Elastic LTB (Lb > Lr)"
+    
+    if method == "LRFD":
+        Mn_design = 0.90 * Mn
+    else:
+        Mn_design = Mn / 1.67
+    
+    ratio = Mu / Mn_design if Mn_design > 0 else float('inf')
+    status = _CHECK_STATUS[ratio <= 1.0]
+    
+    return {
+        'My': My, 'Mp': Mp, 'ry': ry, 'sqrt_E_over_Fy': sqrt_E_over_Fy, 'Lp': Lp,
+        'Iy_flange': Iy_flange, 'rts': rts, 'ho_factor': ho_factor, 'Lr': Lr, 'Cb': Cb,
+        'Mn_calc': Mn_calc, 'Fcr': Fcr, 'Lb_over_rts_sq': Lb_over_rts_sq,
+        'Mn': Mn, 'Mn_design': Mn_design, 'ratio': ratio, 'status': status,
+        'gov_state': gov_state
     }
 
 
@@ -521,8 +1240,9 @@ def calc_global_flexure_detailed(
     Ix_gross: float, Sx_gross: float, Zx_gross: float,
     Fy: float, E: float,
     Mu: float, Lb: float,
-    method: str = "LRFD"
-) -> DetailedCalcSection:
+    method: str = "LRFD",
+    verbose: bool = True
+) -> Tuple[DetailedCalcSection, GlobalFlexureResult]:
     """
     Detailed global flexural strength calculation per AISC DG31 §5.2.
     
@@ -531,173 +1251,156 @@ def calc_global_flexure_detailed(
         Mu: Required flexural strength (kN·m)
         Lb: Unbraced length (mm)
         method: "LRFD" or "ASD"
+        verbose: If False, skip the calculation steps and conclusion text
+                 and return only the section status with the results
         
     Returns:
-        DetailedCalcSection with all calculation steps
+        (DetailedCalcSection with all calculation steps, GlobalFlexureResult)
     """
+    c = _global_flexure_core(dg, bf, tf, ho, Sx_gross, Zx_gross, Fy, E, Mu, Lb, method)
+    results = GlobalFlexureResult._make([c[k] for k in GlobalFlexureResult._fields])
+    
     section = DetailedCalcSection(
         section_number=2,
         title="GLOBAL FLEXURAL STRENGTH",
         description="Check global flexural capacity of the expanded section per AISC DG31 Section 5.2. "
                    "The presence of web openings is accounted for through modified section properties "
                    "and reduced lateral-torsional buckling resistance.",
-        code_ref="AISC DG31 §5.2"
+        code_ref="AISC DG31 §5.2",
+        status=c['status']
     )
+    if not verbose:
+        return section, results
+    
+    My, Mp, ry, sqrt_E_over_Fy, Lp = c['My'], c['Mp'], c['ry'], c['sqrt_E_over_Fy'], c['Lp']
+    Iy_flange, rts, ho_factor, Lr, Cb = c['Iy_flange'], c['rts'], c['ho_factor'], c['Lr'], c['Cb']
+    Mn, Mn_design, ratio, status = c['Mn'], c['Mn_design'], c['ratio'], c['status']
+    gov_state = c['gov_state']
     
-    steps = []
-    step_num = 0
+    buf = _StepBuf(15)  # Preallocated to the upper bound on step count
     
     # =========================================================================
     # 1. MATERIAL AND SECTION DATA
     # =========================================================================
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Material Properties",
         description="Record the material yield strength and modulus of elasticity.",
         equation="Given material properties",
-        substitution=f"Fy = {Fy} MPa, E = {E} MPa",
+        substitution=("Fy = {} MPa, E = {} MPa", (Fy, E)),
         result=Fy,
         unit="MPa",
         code_ref="AISC 360-16 A3.1"
-    ))
+    )
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Required Flexural Strength",
         description="The required flexural strength from structural analysis under factored loads.",
         equation="Mu = (factored loads × L²) / 8 for simple span uniform load",
-        substitution=f"Mu = {Mu:.2f} kN·m (from analysis)",
+        substitution=("Mu = {:.2f} kN·m (from analysis)", (Mu,)),
         result=Mu,
         unit="kN·m",
         code_ref="ASCE 7 Load Combinations"
-    ))
+    )
     
     # =========================================================================
     # 2. YIELD MOMENT CALCULATION
     # =========================================================================
-    My = Fy * Sx_gross / 1e6  # kN·m
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Yield Moment",
         description="The yield moment is the moment at which the extreme fiber first reaches yield stress. "
                    "This is calculated using the gross section modulus.",
         equation="My = Fy × Sx,gross",
-        substitution=f"My = {Fy} × {Sx_gross/1e3:.1f}×10³ / 10⁶ = {Fy} × {Sx_gross:.0f} / 10⁶",
+        substitution=("My = {} × {:.1f}×10³ / 10⁶ = {} × {:.0f} / 10⁶",
+                      (Fy, Sx_gross/1e3, Fy, Sx_gross)),
         result=My,
         unit="kN·m",
         code_ref="AISC DG31 §5.2.1"
-    ))
+    )
     
     # =========================================================================
     # 3. PLASTIC MOMENT CALCULATION
     # =========================================================================
-    Mp = Fy * Zx_gross / 1e6  # kN·m
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Plastic Moment",
         description="The plastic moment is the moment required to fully plastify the cross-section. "
                    "This represents the upper bound of flexural strength for compact sections.",
         equation="Mp = Fy × Zx,gross",
-        substitution=f"Mp = {Fy} × {Zx_gross/1e3:.1f}×10³ / 10⁶ = {Fy} × {Zx_gross:.0f} / 10⁶",
+        substitution=("Mp = {} × {:.1f}×10³ / 10⁶ = {} × {:.0f} / 10⁶",
+                      (Fy, Zx_gross/1e3, Fy, Zx_gross)),
         result=Mp,
         unit="kN·m",
         code_ref="AISC 360-16 F2.1"
-    ))
+    )
     
     # =========================================================================
     # 4. LATERAL-TORSIONAL BUCKLING PARAMETERS
     # =========================================================================
     # Radius of gyration about weak axis for compression flange
-    ry = bf / math.sqrt(12)
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Radius of Gyration (compression flange)",
         description="Approximate radius of gyration of the compression flange about the y-axis, "
                    "used for lateral-torsional buckling calculations.",
         equation="ry ≈ bf / √12",
-        substitution=f"ry = {bf} / √12 = {bf} / {math.sqrt(12):.3f}",
+        substitution=("ry = {} / √12 = {} / {:.3f}", (bf, bf, _SQRT12)),
         result=ry,
         unit="mm",
         code_ref="AISC 360-16 F2"
-    ))
+    )
     
     # Limiting unbraced length Lp (plastic)
-    Lp = 1.76 * ry * math.sqrt(E / Fy)
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Limiting Unbraced Length Lp",
         description="Lp is the limiting laterally unbraced length for the limit state of yielding. "
                    "When Lb ≤ Lp, lateral-torsional buckling does not govern and the full plastic "
                    "moment can be achieved.",
         equation="Lp = 1.76 × ry × √(E/Fy)",
-        substitution=f"Lp = 1.76 × {ry:.1f} × √({E}/{Fy}) = 1.76 × {ry:.1f} × {math.sqrt(E/Fy):.2f}",
+        substitution=("Lp = 1.76 × {:.1f} × √({}/{}) = 1.76 × {:.1f} × {:.2f}",
+                      (ry, E, Fy, ry, sqrt_E_over_Fy)),
         result=Lp,
         unit="mm",
         code_ref="AISC 360-16 Eq. F2-5"
-    ))
+    )
     
     # Effective radius of gyration rts
-    Iy_flange = tf * bf**3 / 12
-    Sxc = Sx_gross  # For doubly symmetric section
-    rts_sq = math.sqrt(Iy_flange * (dg/2) / Sxc)
-    rts = max(rts_sq, bf/6)  # Ensure reasonable value
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Effective Radius of Gyration rts",
         description="The effective radius of gyration rts is used in the elastic buckling equation. "
                    "For castellated beams, this is computed considering the compression flange properties.",
-        equation="rts = √(√(Iy,flange × ho,c / Sxc))",
-        substitution=f"rts = √(√({Iy_flange:.0f} × {dg/2:.1f} / {Sxc:.0f})) = √({rts_sq:.1f})",
+        equation="rts = √(Iy,flange × (dg/2) / Sx) ≥ bf/6",
+        substitution=("rts = max(√({:.0f} × {:.1f} / {:.0f}), {}/6)", (Iy_flange, dg/2, Sx_gross, bf)),
         result=rts,
         unit="mm",
         code_ref="AISC 360-16 Eq. F2-7"
-    ))
+    )
     
     # Modification factor for openings
-    ho_factor = max(0.7, 1 - 0.3 * ho / dg)
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Opening Modification Factor",
         description="The presence of web openings reduces the torsional stiffness and warping constant, "
                    "effectively reducing the elastic buckling resistance. A reduction factor is applied.",
         equation="Cₒ = max(0.7, 1 - 0.3 × ho/dg)",
-        substitution=f"Cₒ = max(0.7, 1 - 0.3 × {ho:.1f}/{dg:.1f}) = max(0.7, {1 - 0.3*ho/dg:.3f})",
+        substitution=("Cₒ = max(0.7, 1 - 0.3 × {:.1f}/{:.1f}) = max(0.7, {:.3f})", (ho, dg, 1 - 0.3*ho/dg)),
         result=ho_factor,
         unit="-",
         code_ref="AISC DG31 §5.2.2"
-    ))
+    )
     
     # Limiting unbraced length Lr (inelastic)
-    Lr = 1.95 * rts * (E / (0.7 * Fy)) * ho_factor
-    Lr = max(Lr, 1.5 * Lp)  # Ensure Lr > Lp
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Limiting Unbraced Length Lr",
         description="Lr is the limiting unbraced length for the limit state of inelastic lateral-torsional "
                    "buckling. For castellated beams, this is reduced by the opening modification factor.",
         equation="Lr = 1.95 × rts × (E / 0.7Fy) × Cₒ",
-        substitution=f"Lr = 1.95 × {rts:.1f} × ({E} / (0.7×{Fy})) × {ho_factor:.3f}",
+        substitution=("Lr = 1.95 × {:.1f} × ({} / (0.7×{})) × {:.3f}", (rts, E, Fy, ho_factor)),
         result=Lr,
         unit="mm",
         code_ref="AISC DG31 §5.2.2, AISC 360-16 Eq. F2-6"
-    ))
+    )
     
     # =========================================================================
     # 5. MOMENT GRADIENT FACTOR
     # =========================================================================
-    Cb = 1.0  # Conservative for uniform moment
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Moment Gradient Factor Cb",
         description="The moment gradient factor accounts for non-uniform moment distribution. "
                    "For uniform moment (worst case), Cb = 1.0. Higher values are permitted for "
@@ -707,168 +1410,249 @@ def calc_global_flexure_detailed(
         result=Cb,
         unit="-",
         code_ref="AISC 360-16 Eq. F1-1"
-    ))
+    )
     
     # =========================================================================
     # 6. NOMINAL FLEXURAL STRENGTH DETERMINATION
     # =========================================================================
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Unbraced Length Classification",
         description="Compare the actual unbraced length Lb to the limiting lengths Lp and Lr "
                    "to determine which limit state governs.",
         equation="Compare: Lb vs Lp vs Lr",
-        substitution=f"Lb = {Lb:.0f} mm, Lp = {Lp:.0f} mm, Lr = {Lr:.0f} mm",
+        substitution=("Lb = {:.0f} mm, Lp = {:.0f} mm, Lr = {:.0f} mm", (Lb, Lp, Lr)),
         result=Lb,
         unit="mm",
         code_ref="AISC 360-16 F2.2"
-    ))
+    )
     
     if Lb <= Lp:
         # Yielding governs - full plastic moment
-        Mn = Mp
-        gov_state = "Yielding (Lb ≤ Lp)"
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Nominal Flexural Strength - Yielding",
             description="Since Lb ≤ Lp, lateral-torsional buckling does not occur before yielding. "
                        "The full plastic moment capacity can be achieved.",
             equation="Mn = Mp (for Lb ≤ Lp)",
-            substitution=f"Lb = {Lb:.0f} mm ≤ Lp = {Lp:.0f} mm ∴ Mn = Mp = {Mp:.2f}",
+            substitution=("Lb = {:.0f} mm ≤ Lp = {:.0f} mm ∴ Mn = Mp = {:.2f}", (Lb, Lp, Mp)),
             result=Mn,
             unit="kN·m",
             code_ref="AISC 360-16 Eq. F2-1"
-        ))
+        )
         
     elif Lb <= Lr:
         # Inelastic LTB
-        Mn_calc = Cb * (Mp - (Mp - 0.7 * My) * (Lb - Lp) / (Lr - Lp))
-        Mn = min(Mn_calc, Mp)
-        gov_state = "Inelastic LTB (Lp < Lb ≤ Lr)"
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Nominal Flexural Strength - Inelastic LTB",
             description="Since Lp < Lb ≤ Lr, inelastic lateral-torsional buckling governs. "
                        "The nominal strength is linearly interpolated between Mp and 0.7My.",
             equation="Mn = Cb × [Mp - (Mp - 0.7My) × (Lb - Lp)/(Lr - Lp)] ≤ Mp",
-            substitution=f"Mn = {Cb} × [{Mp:.2f} - ({Mp:.2f} - 0.7×{My:.2f}) × ({Lb:.0f} - {Lp:.0f})/({Lr:.0f} - {Lp:.0f})]",
+            substitution=("Mn = {} × [{:.2f} - ({:.2f} - 0.7×{:.2f}) × ({:.0f} - {:.0f})/({:.0f} - {:.0f})]",
+                          (Cb, Mp, Mp, My, Lb, Lp, Lr, Lp)),
             result=Mn,
             unit="kN·m",
             code_ref="AISC 360-16 Eq. F2-2"
-        ))
+        )
         
     else:
         # Elastic LTB
-        Fcr = Cb * math.pi**2 * E / (Lb / rts)**2
-        Mn_calc = Fcr * Sx_gross / 1e6
-        Mn = min(Mn_calc, Mp)
-        gov_state = "Elastic LTB (Lb > Lr)"
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        Fcr, Mn_calc, Lb_over_rts_sq = c['Fcr'], c['Mn_calc'], c['Lb_over_rts_sq']
+        buf.emit(
             title="Critical Buckling Stress",
             description="Since Lb > Lr, elastic lateral-torsional buckling governs. "
                        "First calculate the critical buckling stress.",
             equation="Fcr = Cb × π² × E / (Lb/rts)²",
-            substitution=f"Fcr = {Cb} × π² × {E} / ({Lb:.0f}/{rts:.1f})² = {Cb} × {math.pi**2:.4f} × {E} / {(Lb/rts)**2:.1f}",
+            substitution=("Fcr = {} × π² × {} / ({:.0f}/{:.1f})² = {} × {:.4f} × {} / {:.1f}",
+                          (Cb, E, Lb, rts, Cb, _PI_SQ, E, Lb_over_rts_sq)),
             result=Fcr,
             unit="MPa",
             code_ref="AISC 360-16 Eq. F2-4"
-        ))
+        )
         
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Nominal Flexural Strength - Elastic LTB",
             description="The nominal flexural strength for elastic LTB is limited by the critical stress.",
             equation="Mn = Fcr × Sx ≤ Mp",
-            substitution=f"Mn = {Fcr:.1f} × {Sx_gross:.0f} / 10⁶ = {Mn_calc:.2f} kN·m ≤ Mp = {Mp:.2f} kN·m",
+            substitution=("Mn = {:.1f} × {:.0f} / 10⁶ = {:.2f} kN·m ≤ Mp = {:.2f} kN·m", (Fcr, Sx_gross, Mn_calc, Mp)),
             result=Mn,
             unit="kN·m",
             code_ref="AISC 360-16 Eq. F2-3"
-        ))
+        )
     
     # =========================================================================
     # 7. DESIGN/ALLOWABLE STRENGTH
     # =========================================================================
     if method == "LRFD":
-        phi_b = 0.90
-        Mn_design = phi_b * Mn
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Design Flexural Strength (LRFD)",
             description="Apply the resistance factor φb = 0.90 for flexure to obtain the design strength.",
             equation="φbMn = φb × Mn",
-            substitution=f"φbMn = 0.90 × {Mn:.2f}",
+            substitution=("φbMn = 0.90 × {:.2f}", (Mn,)),
             result=Mn_design,
             unit="kN·m",
             code_ref="AISC 360-16 F1(1)"
-        ))
+        )
     else:
-        Omega_b = 1.67
-        Mn_design = Mn / Omega_b
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Allowable Flexural Strength (ASD)",
             description="Divide by the safety factor Ωb = 1.67 for flexure to obtain the allowable strength.",
             equation="Mn/Ωb = Mn / 1.67",
-            substitution=f"Mn/Ωb = {Mn:.2f} / 1.67",
+            substitution=("Mn/Ωb = {:.2f} / 1.67", (Mn,)),
             result=Mn_design,
             unit="kN·m",
             code_ref="AISC 360-16 F1(2)"
-        ))
+        )
+    
+    # =========================================================================
+    # 8. DEMAND/CAPACITY RATIO
+    # =========================================================================
+    buf.emit(
+        title="Flexural Demand/Capacity Check",
+        description="Compare the required flexural strength to the available flexural strength.",
+        equation="Mu / φbMn ≤ 1.0" if method == "LRFD" else "Ma / (Mn/Ωb) ≤ 1.0",
+        substitution=("{:.2f} / {:.2f}", (Mu, Mn_design)),
+        result=ratio,
+        unit="-",
+        code_ref="AISC 360-16 H1",
+        status=status,
+        notes=_NOTES_FLEXURE[status]
+    )
+    
+    section.set_rows(buf.to_rows())
+    section.conclusion = _FLEXURE_CONCLUSION(locals())
+    
+    return section, results
+
+
+def _mark_infeasible(section: DetailedCalcSection, reason: str) -> None:
+    """
+    Fail a check whose inputs are outside the range it applies to, with a
+    single explanatory step in place of the full calculation.
+    """
+    section.set_steps([DetailedCalcStep(
+        step_number=1,
+        title="Infeasible Geometry",
+        description="The input geometry is outside the range this check applies to. "
+                   "The remaining calculation steps are skipped.",
+        equation="-",
+        substitution=reason,
+        result=float('inf'),
+        unit="-",
+        code_ref=section.code_ref,
+        status="FAIL",
+        notes="✗ NG - Revise the section or opening geometry"
+    )])
+    section.status = "FAIL"
+    section.conclusion = "\n".join([
+        "",
+        f"{section.title} SUMMARY:",
+        _RULE_HEAVY,
+        f"  {reason}",
+        "  Status:                       FAIL",
+        _RULE_HEAVY,
+        ""
+    ])
+
+
+def _mark_not_applicable(section: DetailedCalcSection, reason: str) -> None:
+    """
+    Mark a check that has nothing to evaluate for the given inputs as
+    "NA", with a single explanatory step in place of the full calculation.
+    """
+    section.set_steps([DetailedCalcStep(
+        step_number=1,
+        title="Check Not Applicable",
+        description="The inputs give no meaningful result for this check. "
+                   "The remaining calculation steps are skipped.",
+        equation="-",
+        substitution=reason,
+        result=0.0,
+        unit="-",
+        code_ref=section.code_ref,
+        status="INFO"
+    )])
+    section.status = "NA"
+    section.conclusion = "\n".join([
+        "",
+        f"{section.title} SUMMARY:",
+        _RULE_HEAVY,
+        f"  {reason}",
+        "  Status:                       NA",
+        _RULE_HEAVY,
+        ""
+    ])
+
+
+@lru_cache(maxsize=16)
+def _slenderness_limits(Fy: float, E: float) -> Tuple[float, float, float]:
+    """
+    Tee slenderness limits for a material grade, cached per (Fy, E).
+    
+    Returns:
+        (λpf, λpw, λrw) = (0.38, 0.84, 1.52) × √(E/Fy)
+    """
+    r = math.sqrt(E / Fy)
+    return 0.38 * r, 0.84 * r, 1.52 * r
+
+
+def _vierendeel_core(
+    dt: float, bf: float, tf: float, tw: float, S_tee: float,
+    is_cast: bool, e: float, Do: float,
+    Fy: float, E: float,
+    Vu: float,
+    method: str = "LRFD"
+) -> Dict:
+    """
+    Numeric part of calc_vierendeel_bending_detailed (no report text).
+    
+    Returns:
+        Dict of all intermediate and final values used by the report
+    """
+    # Moment arm: half-length of opening (castellated) or Do/2 (cellular)
+    if is_cast:
+        a_v = e
+    else:
+        a_v = Do / 2
+    
+    # Vierendeel moment in each tee
+    V_tee = Vu / 2
+    Mvr = V_tee * a_v * INV_MM_TO_M  # kN·m (converting mm to m)
+    
+    # Tee classification
+    lambda_pf, lambda_pw, lambda_rw = _slenderness_limits(Fy, E)
+    lambda_f = bf / (2 * tf)
+    d_stem = dt - tf
+    lambda_w = d_stem / tw
     
-    # =========================================================================
-    # 8. DEMAND/CAPACITY RATIO
-    # =========================================================================
-    ratio = Mu / Mn_design if Mn_design > 0 else float('inf')
-    status = "PASS" if ratio <= 1.0 else "FAIL"
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Flexural Demand/Capacity Check",
-        description="Compare the required flexural strength to the available flexural strength.",
-        equation="Mu / φbMn ≤ 1.0" if method == "LRFD" else "Ma / (Mn/Ωb) ≤ 1.0",
-        substitution=f"{Mu:.2f} / {Mn_design:.2f}",
-        result=ratio,
-        unit="-",
-        code_ref="AISC 360-16 H1",
-        status=status,
-        notes=f"{'✓ OK - Flexural strength is adequate' if status == 'PASS' else '✗ NG - Flexural strength is inadequate'}"
-    ))
+    # Tee flexural strength (Zx,tee ≈ 1.5 Sx,tee for a compact tee)
+    Z_tee = 1.5 * S_tee
+    Mp_tee = Fy * Z_tee * N_MM_TO_KN_M  # kN·m
     
-    section.steps = steps
-    section.status = status
-    section.conclusion = f"""
-GLOBAL FLEXURAL STRENGTH SUMMARY:
-══════════════════════════════════════════════════════════════════════════════
-Design Method: {method}
-Governing Limit State: {gov_state}
-──────────────────────────────────────────────────────────────────────────────
-CAPACITY:
-  Yield Moment (My):            {My:.2f} kN·m
-  Plastic Moment (Mp):          {Mp:.2f} kN·m
-  Nominal Strength (Mn):        {Mn:.2f} kN·m
-  Design Strength (φMn or Mn/Ω):{Mn_design:.2f} kN·m
-──────────────────────────────────────────────────────────────────────────────
-DEMAND:
-  Required Strength (Mu):       {Mu:.2f} kN·m
-──────────────────────────────────────────────────────────────────────────────
-CHECK:
-  D/C Ratio:                    {ratio:.3f}
-  Status:                       {status}
-══════════════════════════════════════════════════════════════════════════════
-"""
+    # Stem reduction factor: x = 0 for a compact stem (Mn = Mp), rising
+    # linearly to 1 at λrw; beyond λrw use the elastic section modulus
+    x = min(max((lambda_w - lambda_pw) / (lambda_rw - lambda_pw), 0.0), 1.0)
+    if lambda_w <= lambda_rw:
+        Mn_tee = Mp_tee * (1 - 0.3 * x)
+    else:
+        Mn_tee = Fy * S_tee * N_MM_TO_KN_M
     
-    return section, {
-        'My': My, 'Mp': Mp, 'Lp': Lp, 'Lr': Lr, 'Cb': Cb,
-        'Mn': Mn, 'Mn_design': Mn_design, 'ratio': ratio,
-        'gov_state': gov_state
+    # Both top and bottom tees contribute
+    Mn_vr = 2 * Mn_tee
+    if method == "LRFD":
+        Mn_vr_design = 0.90 * Mn_vr
+    else:
+        Mn_vr_design = Mn_vr / 1.67
+    
+    Mvr_total = 2 * Mvr  # Total demand on both tees
+    ratio = Mvr_total / Mn_vr_design if Mn_vr_design > 0 else float('inf')
+    status = _CHECK_STATUS[ratio <= 1.0]
+    
+    return {
+        'a_v': a_v, 'V_tee': V_tee, 'Mvr': Mvr,
+        'lambda_f': lambda_f, 'lambda_pf': lambda_pf,
+        'lambda_w': lambda_w, 'lambda_pw': lambda_pw, 'lambda_rw': lambda_rw,
+        'Z_tee': Z_tee, 'Mp_tee': Mp_tee, 'Mn_tee': Mn_tee,
+        'Mn_vr': Mn_vr, 'Mn_vr_design': Mn_vr_design,
+        'Mvr_total': Mvr_total, 'ratio': ratio, 'status': status
     }
 
 
@@ -879,8 +1663,9 @@ def calc_vierendeel_bending_detailed(
     beam_type: str, e: float, Do: float,
     Fy: float, E: float,
     Vu: float,
-    method: str = "LRFD"
-) -> DetailedCalcSection:
+    method: str = "LRFD",
+    verbose: bool = True
+) -> Tuple[DetailedCalcSection, VierendeelResult]:
     """
     Detailed Vierendeel bending calculation per AISC DG31 §5.3.
     
@@ -891,290 +1676,404 @@ def calc_vierendeel_bending_detailed(
         Section properties, geometry, material properties
         Vu: Required shear strength at opening (kN)
         method: "LRFD" or "ASD"
+        verbose: If False, skip the calculation steps and conclusion text
+                 and return only the section status with the results
         
     Returns:
-        DetailedCalcSection with all calculation steps
+        (DetailedCalcSection with all calculation steps, VierendeelResult)
     """
     section = DetailedCalcSection(
         section_number=3,
         title="VIERENDEEL BENDING",
-        description="Check local bending in tee sections at web openings per AISC DG31 Section 5.3. "
-                   "As shear force is transferred across the opening, each tee section acts as a "
-                   "short beam subjected to local bending moments (Vierendeel action).",
+        description=_DESC["vier_section"],
         code_ref="AISC DG31 §5.3"
     )
     
-    steps = []
-    step_num = 0
+    is_cast = BeamType.coerce(beam_type) == BeamType.CASTELLATED
+    
+    # Degenerate tee (e.g. opening too deep for the section): no capacity
+    if S_tee <= 0 or tw <= 0:
+        V_tee = Vu / 2
+        Mvr = V_tee * (e if is_cast else Do / 2) * INV_MM_TO_M
+        _mark_infeasible(section, f"S_tee = {S_tee:.0f} mm³, tw = {tw} mm (tee has no flexural capacity)")
+        return section, VierendeelResult(
+            V_tee=V_tee, Mvr=Mvr, Mvr_total=2 * Mvr,
+            Mn_tee=0.0, Mn_vr=0.0, Mn_vr_design=0.0,
+            ratio=float('inf')
+        )
+    
+    c = _vierendeel_core(dt, bf, tf, tw, S_tee, is_cast, e, Do, Fy, E, Vu, method)
+    results = VierendeelResult._make([c[k] for k in VierendeelResult._fields])
+    section.status = c['status']
+    if not verbose:
+        return section, results
+    
+    a_v, V_tee, Mvr = c['a_v'], c['V_tee'], c['Mvr']
+    lambda_f, lambda_pf, lambda_w, lambda_pw = c['lambda_f'], c['lambda_pf'], c['lambda_w'], c['lambda_pw']
+    Z_tee, Mp_tee, Mn_tee = c['Z_tee'], c['Mp_tee'], c['Mn_tee']
+    Mn_vr, Mn_vr_design = c['Mn_vr'], c['Mn_vr_design']
+    Mvr_total, ratio, status = c['Mvr_total'], c['ratio'], c['status']
+    
+    buf = _StepBuf(12)  # Preallocated to the upper bound on step count
     
     # =========================================================================
     # 1. INTRODUCTION TO VIERENDEEL BENDING
     # =========================================================================
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Vierendeel Bending Mechanism",
-        description="When a shear force V is transferred across a web opening, each tee (top and bottom) "
-                   "must resist local bending moments. The shear is shared between the tees approximately "
-                   "in proportion to their flexural stiffness. For symmetric sections, each tee carries V/2.",
+        description=_DESC["vier_mechanism"],
         equation="V_tee = Vu / 2 (for symmetric tees)",
-        substitution=f"V_tee = {Vu:.2f} / 2 = {Vu/2:.2f} kN",
+        substitution=_FMT["v_tee"].format(Vu=Vu, V=Vu/2),
         result=Vu/2,
         unit="kN",
         code_ref="AISC DG31 §5.3.1"
-    ))
+    )
     
     # =========================================================================
     # 2. VIERENDEEL MOMENT CALCULATION
     # =========================================================================
     # For castellated beams, the critical section is at e from center
     # For cellular beams, use Do/2 as the half-length
-    if beam_type == "Castellated":
-        a_v = e  # Half-length of opening
-    else:
-        a_v = Do / 2
-    
-    # Vierendeel moment in each tee
     # Mvr = V_tee × a_v (moment arm from center of opening to web post)
-    V_tee = Vu / 2
-    Mvr = V_tee * a_v / 1000  # kN·m (converting mm to m)
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Vierendeel Moment in Tee",
-        description="The local bending moment in each tee is calculated as the tee shear times "
-                   "the moment arm (half-length of opening). This moment causes bending stress "
-                   "in the tee section.",
-        equation="Mvr = V_tee × e" if beam_type == "Castellated" else "Mvr = V_tee × (Do/2)",
-        substitution=f"Mvr = {V_tee:.2f} × {a_v:.1f} / 1000",
+        description=_DESC["vier_moment"],
+        equation=_EQ_MVR_CAST if is_cast else _EQ_MVR_CELL,
+        substitution=_FMT["mvr"].format(V=V_tee, a=a_v),
         result=Mvr,
         unit="kN·m",
         code_ref="AISC DG31 §5.3.1, Eq. 5-3"
-    ))
+    )
     
     # =========================================================================
     # 3. TEE SECTION CLASSIFICATION
     # =========================================================================
     # Check flange slenderness
-    lambda_f = bf / (2 * tf)
-    lambda_pf = 0.38 * math.sqrt(E / Fy)
-    step_num += 1
-    flange_status = "Compact" if lambda_f <= lambda_pf else "Noncompact"
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    flange_compact = lambda_f <= lambda_pf
+    flange_status = _COMPACTNESS[flange_compact]
+    buf.emit(
         title="Tee Flange Slenderness",
-        description="Classify the tee flange as compact or noncompact for flexure. "
-                   "Compact flanges can develop the full plastic moment.",
+        description=_DESC["tee_flange"],
         equation="λf = bf/(2tf), λpf = 0.38√(E/Fy)",
-        substitution=f"λf = {bf}/(2×{tf}) = {lambda_f:.2f}, λpf = 0.38×√({E}/{Fy}) = {lambda_pf:.2f}",
+        substitution=_FMT["lambda_f"].format(bf=bf, tf=tf, lf=lambda_f, E=E, Fy=Fy, lpf=lambda_pf),
         result=lambda_f,
         unit="-",
         code_ref="AISC 360-16 Table B4.1b",
-        status="PASS" if lambda_f <= lambda_pf else "WARNING",
-        notes=f"Flange is {flange_status} (λf {'≤' if lambda_f <= lambda_pf else '>'} λpf)"
-    ))
+        status=_CLASS_STATUS[flange_compact],
+        notes=_NOTES_FLANGE[flange_compact]
+    )
     
     # Check stem slenderness (web of tee)
-    d_stem = dt - tf
-    lambda_w = d_stem / tw
-    lambda_pw = 0.84 * math.sqrt(E / Fy)  # For tee stems in flexure
-    step_num += 1
-    stem_status = "Compact" if lambda_w <= lambda_pw else "Noncompact"
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    stem_compact = lambda_w <= lambda_pw
+    stem_status = _COMPACTNESS[stem_compact]
+    buf.emit(
         title="Tee Stem Slenderness",
-        description="Classify the tee stem (web) as compact or noncompact for flexure. "
-                   "This affects the available flexural strength of the tee.",
+        description=_DESC["tee_stem"],
         equation="λw = (dt-tf)/tw, λpw = 0.84√(E/Fy)",
-        substitution=f"λw = ({dt:.1f}-{tf})/{tw} = {lambda_w:.2f}, λpw = 0.84×√({E}/{Fy}) = {lambda_pw:.2f}",
+        substitution=_FMT["lambda_w"].format(dt=dt, tf=tf, tw=tw, lw=lambda_w, E=E, Fy=Fy, lpw=lambda_pw),
         result=lambda_w,
         unit="-",
         code_ref="AISC 360-16 Table B4.1b",
-        status="PASS" if lambda_w <= lambda_pw else "WARNING",
-        notes=f"Stem is {stem_status} (λw {'≤' if lambda_w <= lambda_pw else '>'} λpw)"
-    ))
+        status=_CLASS_STATUS[stem_compact],
+        notes=_NOTES_STEM[stem_compact]
+    )
     
     # =========================================================================
     # 4. TEE FLEXURAL STRENGTH
     # =========================================================================
     # Plastic section modulus of tee (approximate)
     # For tee with stem in compression, use 1.5×S_tee as approximate Zx
-    Z_tee = 1.5 * S_tee  # Approximate for compact tee
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Tee Plastic Section Modulus",
-        description="Estimate the plastic section modulus of the tee for calculating plastic moment. "
-                   "For tee sections, Zx is typically about 1.5 times the elastic section modulus.",
+        description=_DESC["tee_zx"],
         equation="Zx,tee ≈ 1.5 × Sx,tee (approximate for tee sections)",
-        substitution=f"Zx,tee = 1.5 × {S_tee:.0f}",
+        substitution=_FMT["z_tee"].format(S=S_tee),
         result=Z_tee,
         unit="mm³",
         code_ref="AISC DG31 §5.3.2"
-    ))
+    )
     
     # Plastic moment of tee
-    Mp_tee = Fy * Z_tee / 1e6  # kN·m
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Tee Plastic Moment",
-        description="Calculate the plastic moment capacity of one tee section.",
+        description=_DESC["tee_mp"],
         equation="Mp,tee = Fy × Zx,tee",
-        substitution=f"Mp,tee = {Fy} × {Z_tee:.0f} / 10⁶",
+        substitution=_FMT["mp_tee"].format(Fy=Fy, Z=Z_tee),
         result=Mp_tee,
         unit="kN·m",
         code_ref="AISC 360-16 F9"
-    ))
+    )
     
     # For noncompact stems, reduce capacity
     if lambda_w > lambda_pw:
-        lambda_rw = 1.52 * math.sqrt(E / Fy)
-        if lambda_w <= lambda_rw:
-            # Inelastic reduction
-            Mn_tee = Mp_tee * (1 - (lambda_w - lambda_pw) / (lambda_rw - lambda_pw) * 0.3)
-        else:
-            # Use elastic section modulus
-            Mn_tee = Fy * S_tee / 1e6
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        lambda_rw = c['lambda_rw']
+        buf.emit(
             title="Tee Nominal Moment (Noncompact Stem)",
-            description="Since the tee stem is noncompact, the nominal moment capacity is reduced.",
+            description=_DESC["tee_mn_noncompact"],
             equation="Mn,tee = Mp,tee × [1 - 0.3×(λw-λpw)/(λrw-λpw)] for λw ≤ λrw",
-            substitution=f"Mn,tee = {Mp_tee:.3f} × [1 - 0.3×({lambda_w:.2f}-{lambda_pw:.2f})/({lambda_rw:.2f}-{lambda_pw:.2f})]",
+            substitution=_FMT["mn_tee_noncompact"].format(Mp=Mp_tee, lw=lambda_w, lpw=lambda_pw, lrw=lambda_rw),
             result=Mn_tee,
             unit="kN·m",
             code_ref="AISC 360-16 F9.2"
-        ))
+        )
     else:
-        Mn_tee = Mp_tee
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Tee Nominal Moment (Compact)",
-            description="Since the tee section is compact, the full plastic moment can be developed.",
+            description=_DESC["tee_mn_compact"],
             equation="Mn,tee = Mp,tee",
-            substitution=f"Mn,tee = {Mp_tee:.3f}",
+            substitution=_FMT["mn_tee_compact"].format(Mp=Mp_tee),
             result=Mn_tee,
             unit="kN·m",
             code_ref="AISC 360-16 F9.1"
-        ))
+        )
     
     # =========================================================================
     # 5. COMBINED TEE CAPACITY
     # =========================================================================
     # Total Vierendeel capacity from both tees
-    Mn_vr = 2 * Mn_tee  # Both top and bottom tees contribute
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Total Vierendeel Moment Capacity",
-        description="The total Vierendeel moment resistance is provided by both top and bottom tees "
-                   "acting together. For symmetric sections, this is twice the single tee capacity.",
+        description=_DESC["vier_capacity"],
         equation="Mn,vr = 2 × Mn,tee",
-        substitution=f"Mn,vr = 2 × {Mn_tee:.3f}",
+        substitution=_FMT["mn_vr"].format(Mn=Mn_tee),
         result=Mn_vr,
         unit="kN·m",
         code_ref="AISC DG31 §5.3.3"
-    ))
+    )
     
     # =========================================================================
     # 6. DESIGN/ALLOWABLE STRENGTH
     # =========================================================================
     if method == "LRFD":
-        phi_b = 0.90
-        Mn_vr_design = phi_b * Mn_vr
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Design Vierendeel Strength (LRFD)",
-            description="Apply the resistance factor φb = 0.90 for flexure.",
+            description=_DESC["vier_lrfd"],
             equation="φMn,vr = 0.90 × Mn,vr",
-            substitution=f"φMn,vr = 0.90 × {Mn_vr:.3f}",
+            substitution=_FMT["mn_vr_lrfd"].format(Mn=Mn_vr),
             result=Mn_vr_design,
             unit="kN·m",
             code_ref="AISC 360-16 F1(1)"
-        ))
+        )
     else:
-        Omega_b = 1.67
-        Mn_vr_design = Mn_vr / Omega_b
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Allowable Vierendeel Strength (ASD)",
-            description="Apply the safety factor Ωb = 1.67 for flexure.",
+            description=_DESC["vier_asd"],
             equation="Mn,vr/Ωb = Mn,vr / 1.67",
-            substitution=f"Mn,vr/Ωb = {Mn_vr:.3f} / 1.67",
+            substitution=_FMT["mn_vr_asd"].format(Mn=Mn_vr),
             result=Mn_vr_design,
             unit="kN·m",
             code_ref="AISC 360-16 F1(2)"
-        ))
+        )
     
     # =========================================================================
     # 7. DEMAND/CAPACITY CHECK
     # =========================================================================
     # Required Vierendeel moment (both tees together)
-    Mvr_total = 2 * Mvr  # Total demand on both tees
-    ratio = Mvr_total / Mn_vr_design if Mn_vr_design > 0 else float('inf')
-    status = "PASS" if ratio <= 1.0 else "FAIL"
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Vierendeel Bending Check",
-        description="Compare the required Vierendeel moment to the available capacity.",
+        description=_DESC["vier_check"],
         equation="Mvr / φMn,vr ≤ 1.0" if method == "LRFD" else "Mvr / (Mn,vr/Ωb) ≤ 1.0",
-        substitution=f"{Mvr_total:.3f} / {Mn_vr_design:.3f}",
+        substitution=_FMT["vier_check"].format(M=Mvr_total, Mn=Mn_vr_design),
         result=ratio,
         unit="-",
         code_ref="AISC DG31 §5.3",
         status=status,
-        notes=f"{'✓ OK - Vierendeel bending is adequate' if status == 'PASS' else '✗ NG - Vierendeel bending capacity exceeded'}"
-    ))
+        notes=_NOTES_VIERENDEEL[status]
+    )
     
-    section.steps = steps
-    section.status = status
-    section.conclusion = f"""
-VIERENDEEL BENDING SUMMARY:
-══════════════════════════════════════════════════════════════════════════════
-Design Method: {method}
-──────────────────────────────────────────────────────────────────────────────
-TEE CLASSIFICATION:
-  Flange slenderness (λf):      {lambda_f:.2f} ({flange_status})
-  Stem slenderness (λw):        {lambda_w:.2f} ({stem_status})
-──────────────────────────────────────────────────────────────────────────────
-CAPACITY:
-  Single tee moment (Mn,tee):   {Mn_tee:.3f} kN·m
-  Total Vierendeel (Mn,vr):     {Mn_vr:.3f} kN·m
-  Design strength:              {Mn_vr_design:.3f} kN·m
-──────────────────────────────────────────────────────────────────────────────
-DEMAND:
-  Shear at opening (Vu):        {Vu:.2f} kN
-  Vierendeel moment (Mvr):      {Mvr_total:.3f} kN·m
-──────────────────────────────────────────────────────────────────────────────
-CHECK:
-  D/C Ratio:                    {ratio:.3f}
-  Status:                       {status}
-══════════════════════════════════════════════════════════════════════════════
-"""
+    section.set_rows(buf.to_rows())
+    section.conclusion = "\n".join([
+        "",
+        "VIERENDEEL BENDING SUMMARY:",
+        _RULE_HEAVY,
+        f"Design Method: {method}",
+        _RULE_LIGHT,
+        "TEE CLASSIFICATION:",
+        f"  Flange slenderness (λf):      {lambda_f:.2f} ({flange_status})",
+        f"  Stem slenderness (λw):        {lambda_w:.2f} ({stem_status})",
+        _RULE_LIGHT,
+        "CAPACITY:",
+        f"  Single tee moment (Mn,tee):   {Mn_tee:.3f} kN·m",
+        f"  Total Vierendeel (Mn,vr):     {Mn_vr:.3f} kN·m",
+        f"  Design strength:              {Mn_vr_design:.3f} kN·m",
+        _RULE_LIGHT,
+        "DEMAND:",
+        f"  Shear at opening (Vu):        {Vu:.2f} kN",
+        f"  Vierendeel moment (Mvr):      {Mvr_total:.3f} kN·m",
+        _RULE_LIGHT,
+        "CHECK:",
+        f"  D/C Ratio:                    {ratio:.3f}",
+        f"  Status:                       {status}",
+        _RULE_HEAVY,
+        ""
+    ])
+    
+    return section, results
+
+
+def calc_vierendeel_bending_batch(
+    dt: float, bf: float, tf: float, tw: float, S_tee: float,
+    beam_type,
+    Fy: float, E: float,
+    Vu: np.ndarray,
+    e: Optional[np.ndarray] = None,
+    Do: Optional[np.ndarray] = None,
+    method: str = "LRFD"
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized Vierendeel bending check at many openings at once.
+    
+    Same arithmetic as calc_vierendeel_bending_detailed (AISC DG31 §5.3),
+    evaluated with NumPy over arrays of opening shear and geometry, with
+    no calculation steps. Scalar tee properties are broadcast against the
+    per-opening arrays.
+    
+    Args:
+        dt, bf, tf, tw, S_tee: Tee geometry and section modulus (scalars or arrays)
+        beam_type: "Castellated"/"Cellular", a BeamType, or an array of
+                   BeamType codes (one per opening) for mixed openings
+        Fy, E: Material properties (MPa)
+        Vu: Required shear at each opening (kN)
+        e: Half-length of opening (mm) - castellated only
+        Do: Opening diameter (mm) - cellular only
+        method: "LRFD" or "ASD"
+        
+    Returns:
+        Dict of arrays: a_v, V_tee, Mvr, Mvr_total, Mn_tee, Mn_vr,
+        Mn_vr_design, ratio
+    """
+    Vu = np.asarray(Vu, dtype=np.float64)
+    if isinstance(beam_type, np.ndarray):
+        # Mixed openings: select the moment arm per opening by type code
+        a_v = np.where(beam_type == BeamType.CASTELLATED,
+                       np.asarray(e, dtype=np.float64),
+                       np.asarray(Do, dtype=np.float64) / 2)
+    elif BeamType.coerce(beam_type) == BeamType.CASTELLATED:
+        a_v = np.asarray(e, dtype=np.float64)
+    else:
+        a_v = np.asarray(Do, dtype=np.float64) / 2
+    
+    V_tee = Vu / 2
+    Mvr = V_tee * a_v * INV_MM_TO_M  # kN·m
+    
+    # Tee stem classification and flexural strength
+    _, lambda_pw, lambda_rw = _slenderness_limits(Fy, E)
+    lambda_w = (np.asarray(dt, dtype=np.float64) - tf) / tw
+    S_tee = np.asarray(S_tee, dtype=np.float64)
+    Mp_tee = Fy * (1.5 * S_tee) * N_MM_TO_KN_M
+    x = np.clip((lambda_w - lambda_pw) / (lambda_rw - lambda_pw), 0.0, 1.0)
+    Mn_tee = np.where(
+        lambda_w <= lambda_rw,
+        Mp_tee * (1 - 0.3 * x),
+        Fy * S_tee * N_MM_TO_KN_M
+    )
+    
+    Mn_vr = 2 * Mn_tee
+    if Method.coerce(method) == Method.LRFD:
+        Mn_vr_design = 0.90 * Mn_vr
+    else:
+        Mn_vr_design = Mn_vr / 1.67
+    
+    Mvr_total = 2 * Mvr
     
-    return section, {
-        'V_tee': V_tee, 'Mvr': Mvr, 'Mvr_total': Mvr_total,
+    # Scalar tee properties give 0-d capacities; broadcast every output to
+    # the common per-opening shape
+    a_v, V_tee, Mvr, Mvr_total, Mn_tee, Mn_vr, Mn_vr_design = np.broadcast_arrays(
+        a_v, V_tee, Mvr, Mvr_total, Mn_tee, Mn_vr, Mn_vr_design
+    )
+    ratio = np.full(Mvr_total.shape, np.inf)
+    np.divide(Mvr_total, Mn_vr_design, out=ratio, where=Mn_vr_design > 0)
+    
+    return {
+        'a_v': a_v, 'V_tee': V_tee, 'Mvr': Mvr, 'Mvr_total': Mvr_total,
         'Mn_tee': Mn_tee, 'Mn_vr': Mn_vr, 'Mn_vr_design': Mn_vr_design,
         'ratio': ratio
     }
 
 
+@njit(cache=True)
+def _web_post_kernel(ho, b_wp, tw, Do, Fy, E, Vh, cellular, asd):
+    """
+    Pure-arithmetic web post buckling check, JIT-compiled when numba is
+    available. String options are passed as int flags (cellular, asd) so
+    the kernel stays in nopython mode.
+    
+    Returns:
+        (h_eff, K_wp, width_ratio, lambda_wp, Fe_wp, Fe_Fy, Fcr, inelastic,
+         A_wp, Pn_wp, Pn_design, ratio)
+    """
+    # Effective height, buckling length factor and width ratio per opening type
+    if cellular:
+        h_eff = Do
+        K_wp = 0.85  # Slightly lower K for cellular
+        width_ratio = b_wp / Do
+    else:
+        h_eff = ho
+        K_wp = 0.9  # Effective length factor for web post
+        width_ratio = b_wp / ho
+    
+    lambda_wp = h_eff / tw
+    Fe_wp = _PI_SQ * E / (K_wp * lambda_wp)**2
+    
+    # AISC column curve
+    Fe_Fy = Fe_wp / Fy
+    if Fe_Fy >= 2.25:
+        Fcr = Fy * math.exp(_LN_0_658 * Fy / Fe_wp)
+        inelastic = 1
+    else:
+        Fcr = 0.877 * Fe_wp
+        inelastic = 0
+    
+    A_wp = b_wp * tw
+    Pn_wp = Fcr * A_wp * N_TO_KN  # kN
+    if asd:
+        Pn_design = Pn_wp / 1.67
+    else:
+        Pn_design = 0.90 * Pn_wp
+    
+    ratio = Vh / Pn_design if Pn_design > 0 else math.inf
+    
+    return (h_eff, K_wp, width_ratio, lambda_wp, Fe_wp, Fe_Fy, Fcr, inelastic,
+            A_wp, Pn_wp, Pn_design, ratio)
+
+
+def _web_post_core(
+    ho: float, b_wp: float, tw: float,
+    is_cast: bool, Do: float,
+    Fy: float, E: float,
+    Vh: float,
+    method: str = "LRFD"
+) -> Dict:
+    """
+    Numeric part of calc_web_post_buckling_detailed (no report text).
+    
+    Returns:
+        Dict of all intermediate and final values used by the report
+    """
+    (h_eff, K_wp, width_ratio, lambda_wp, Fe_wp, Fe_Fy, Fcr, inelastic,
+     A_wp, Pn_wp, Pn_design, ratio) = _web_post_kernel(
+        float(ho), float(b_wp), float(tw), float(Do), float(Fy), float(E), float(Vh),
+        not is_cast, method != "LRFD"
+    )
+    
+    return {
+        'h_eff': h_eff, 'K_wp': K_wp, 'width_ratio': width_ratio,
+        'lambda_wp': lambda_wp, 'Fe_wp': Fe_wp, 'Fe_Fy': Fe_Fy,
+        'Fcr': Fcr, 'buckle_type': "Inelastic" if inelastic else "Elastic",
+        'A_wp': A_wp, 'Pn_wp': Pn_wp, 'Pn_design': Pn_design,
+        'ratio': ratio, 'status': _CHECK_STATUS[ratio <= 1.0]
+    }
+
+
 def calc_web_post_buckling_detailed(
     parent_name: str,
     ho: float, b_wp: float, tw: float,
     beam_type: str, S: float, Do: float, theta: float,
     Fy: float, E: float,
     Vh: float,
-    method: str = "LRFD"
-) -> DetailedCalcSection:
+    method: str = "LRFD",
+    verbose: bool = True
+) -> Tuple[DetailedCalcSection, WebPostResult]:
     """
     Detailed web post buckling calculation per AISC DG31 §5.4.
     
@@ -1185,76 +2084,83 @@ def calc_web_post_buckling_detailed(
         Section properties and geometry
         Vh: Horizontal shear force in web post (kN)
         method: "LRFD" or "ASD"
+        verbose: If False, skip the calculation steps and conclusion text
+                 and return only the section status with the results
         
     Returns:
-        DetailedCalcSection with all calculation steps
+        (DetailedCalcSection with all calculation steps, WebPostResult)
     """
     section = DetailedCalcSection(
         section_number=4,
         title="WEB POST BUCKLING",
-        description="Check web post stability under combined horizontal shear and compression "
-                   "per AISC DG31 Section 5.4. The web post is the solid web region between "
-                   "adjacent openings and must resist forces transferred between tees.",
+        description=_DESC["wp_section"],
         code_ref="AISC DG31 §5.4"
     )
     
-    steps = []
-    step_num = 0
+    is_cast = BeamType.coerce(beam_type) == BeamType.CASTELLATED
+    
+    # Grossly slender or zero-thickness web post: skip the buckling analysis
+    h_eff = ho if is_cast else Do
+    lambda_wp = h_eff / tw if tw > 0 else float('inf')
+    if lambda_wp > _WP_SLENDERNESS_LIMIT:
+        _mark_infeasible(section, f"λ_wp = {lambda_wp:.1f} > {_WP_SLENDERNESS_LIMIT} (web post grossly slender)")
+        return section, WebPostResult(
+            lambda_wp=lambda_wp, Fe_wp=0.0, Fcr=0.0,
+            Pn_wp=0.0, Pn_design=0.0, ratio=float('inf'),
+            buckle_type="Infeasible"
+        )
+    
+    c = _web_post_core(ho, b_wp, tw, is_cast, Do, Fy, E, Vh, method)
+    results = WebPostResult._make([c[k] for k in WebPostResult._fields])
+    section.status = c['status']
+    if not verbose:
+        return section, results
+    
+    h_eff, K_wp, lambda_wp, Fe_wp, Fe_Fy = c['h_eff'], c['K_wp'], c['lambda_wp'], c['Fe_wp'], c['Fe_Fy']
+    Fcr, buckle_type, A_wp = c['Fcr'], c['buckle_type'], c['A_wp']
+    Pn_wp, Pn_design, ratio, status = c['Pn_wp'], c['Pn_design'], c['ratio'], c['status']
+    
+    buf = _StepBuf(12)  # Preallocated to the upper bound on step count
     
     # =========================================================================
     # 1. WEB POST GEOMETRY
     # =========================================================================
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Web Post Dimensions",
-        description="The web post is the solid web region between adjacent openings. "
-                   "Its geometry affects its buckling resistance.",
+        description=_DESC["wp_dimensions"],
         equation="b_wp = b (castellated) or S - Do (cellular)",
         substitution=f"b_wp = {b_wp:.1f} mm, ho = {ho:.1f} mm, tw = {tw} mm",
         result=b_wp,
         unit="mm",
         code_ref="AISC DG31 §5.4.1"
-    ))
+    )
     
     # =========================================================================
     # 2. WEB POST SLENDERNESS
     # =========================================================================
     # Effective length of web post for buckling
-    if beam_type == "Castellated":
-        # For castellated, the buckle half-wavelength depends on geometry
-        # Per DG31, use ho as the effective height
-        h_eff = ho
-    else:
-        # For cellular, similar approach
-        h_eff = Do
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    # Castellated: per DG31, use ho as the effective height
+    # Cellular: use the opening diameter Do
+    buf.emit(
         title="Web Post Effective Height",
-        description="The effective height of the web post for buckling analysis. "
-                   "This is the height over which buckling can occur.",
+        description=_DESC["wp_height"],
         equation="h_eff = ho (castellated) or Do (cellular)",
         substitution=f"h_eff = {h_eff:.1f} mm",
         result=h_eff,
         unit="mm",
         code_ref="AISC DG31 §5.4.1"
-    ))
+    )
     
     # Slenderness ratio
-    lambda_wp = h_eff / tw
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Web Post Slenderness Ratio",
-        description="The slenderness ratio of the web post, which affects its buckling capacity.",
+        description=_DESC["wp_slenderness"],
         equation="λ_wp = h_eff / tw",
         substitution=f"λ_wp = {h_eff:.1f} / {tw}",
         result=lambda_wp,
         unit="-",
         code_ref="AISC DG31 §5.4.1"
-    ))
+    )
     
     # =========================================================================
     # 3. WEB POST BUCKLING EQUATIONS
@@ -1263,234 +2169,288 @@ def calc_web_post_buckling_detailed(
     # that account for the complex stress field
     
     # For castellated beams (hexagonal openings)
-    if beam_type == "Castellated":
+    if is_cast:
         # Buckling coefficient depends on b/ho ratio
-        b_ho_ratio = b_wp / ho
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        b_ho_ratio = c['width_ratio']
+        buf.emit(
             title="Web Post Width Ratio",
-            description="The ratio of web post width to opening height affects the buckling mode.",
+            description=_DESC["wp_width_ratio"],
             equation="b/ho ratio",
             substitution=f"b/ho = {b_wp:.1f} / {ho:.1f}",
             result=b_ho_ratio,
             unit="-",
             code_ref="AISC DG31 §5.4.2"
-        ))
+        )
         
         # Critical buckling stress - empirical equation from DG31
         # Simplified approach: treat as compression member with modified K
-        K_wp = 0.9  # Effective length factor for web post
-        Fe_wp = math.pi**2 * E / (K_wp * lambda_wp)**2
-        
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Elastic Buckling Stress",
-            description="Calculate the elastic buckling stress of the web post as a compression element.",
+            description=_DESC["wp_fe"],
             equation="Fe = π²E / (K × λ_wp)²",
             substitution=f"Fe = π² × {E} / ({K_wp} × {lambda_wp:.1f})²",
             result=Fe_wp,
             unit="MPa",
             code_ref="AISC DG31 §5.4.2, AISC 360-16 E3"
-        ))
+        )
         
     else:  # Cellular
         # For cellular beams, buckling is around the circular opening
         # Use similar approach with adjusted parameters
-        b_Do_ratio = b_wp / Do
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        b_Do_ratio = c['width_ratio']
+        buf.emit(
             title="Web Post Width Ratio (Cellular)",
-            description="The ratio of web post width to opening diameter.",
+            description=_DESC["wp_width_ratio_cell"],
             equation="(S-Do)/Do ratio",
             substitution=f"b/Do = {b_wp:.1f} / {Do:.1f}",
             result=b_Do_ratio,
             unit="-",
             code_ref="AISC DG31 §5.4.3"
-        ))
-        
-        K_wp = 0.85  # Slightly lower K for cellular
-        Fe_wp = math.pi**2 * E / (K_wp * lambda_wp)**2
+        )
         
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Elastic Buckling Stress (Cellular)",
-            description="Elastic buckling stress for the web post between circular openings.",
+            description=_DESC["wp_fe_cell"],
             equation="Fe = π²E / (K × λ_wp)²",
             substitution=f"Fe = π² × {E} / ({K_wp} × {lambda_wp:.1f})²",
             result=Fe_wp,
             unit="MPa",
             code_ref="AISC DG31 §5.4.3"
-        ))
+        )
     
     # =========================================================================
     # 4. CRITICAL BUCKLING STRESS
     # =========================================================================
     # Apply AISC column equations
-    Fe_Fy = Fe_wp / Fy
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Elastic-to-Yield Ratio",
-        description="Compare elastic buckling stress to yield stress to determine which "
-                   "column curve equation applies.",
+        description=_DESC["wp_fe_fy"],
         equation="Fe/Fy",
         substitution=f"Fe/Fy = {Fe_wp:.1f} / {Fy}",
         result=Fe_Fy,
         unit="-",
         code_ref="AISC 360-16 E3"
-    ))
+    )
     
     if Fe_Fy >= 2.25:
         # Inelastic buckling
-        Fcr = Fy * 0.658**(Fy/Fe_wp)
-        buckle_type = "Inelastic"
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Critical Stress (Inelastic Buckling)",
-            description="Since Fe ≥ 2.25Fy, inelastic buckling governs. Use AISC Eq. E3-2.",
+            description=_DESC["wp_fcr_inelastic"],
             equation="Fcr = Fy × 0.658^(Fy/Fe)",
             substitution=f"Fcr = {Fy} × 0.658^({Fy}/{Fe_wp:.1f})",
             result=Fcr,
             unit="MPa",
             code_ref="AISC 360-16 Eq. E3-2"
-        ))
+        )
     else:
         # Elastic buckling
-        Fcr = 0.877 * Fe_wp
-        buckle_type = "Elastic"
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Critical Stress (Elastic Buckling)",
-            description="Since Fe < 2.25Fy, elastic buckling governs. Use AISC Eq. E3-3.",
+            description=_DESC["wp_fcr_elastic"],
             equation="Fcr = 0.877 × Fe",
             substitution=f"Fcr = 0.877 × {Fe_wp:.1f}",
             result=Fcr,
             unit="MPa",
             code_ref="AISC 360-16 Eq. E3-3"
-        ))
+        )
     
     # =========================================================================
     # 5. WEB POST BUCKLING CAPACITY
     # =========================================================================
     # Area of web post in shear/compression
-    A_wp = b_wp * tw
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Web Post Area",
-        description="The effective area of the web post resisting buckling forces.",
+        description=_DESC["wp_area"],
         equation="A_wp = b_wp × tw",
         substitution=f"A_wp = {b_wp:.1f} × {tw}",
         result=A_wp,
         unit="mm²",
         code_ref="AISC DG31 §5.4"
-    ))
+    )
     
     # Nominal buckling capacity
-    Pn_wp = Fcr * A_wp / 1000  # kN
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Nominal Buckling Capacity",
-        description="The nominal web post buckling resistance.",
+        description=_DESC["wp_pn"],
         equation="Pn = Fcr × A_wp",
         substitution=f"Pn = {Fcr:.1f} × {A_wp:.0f} / 1000",
         result=Pn_wp,
         unit="kN",
         code_ref="AISC DG31 §5.4"
-    ))
+    )
     
     # =========================================================================
     # 6. DESIGN/ALLOWABLE CAPACITY
     # =========================================================================
     if method == "LRFD":
-        phi_c = 0.90
-        Pn_design = phi_c * Pn_wp
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Design Buckling Capacity (LRFD)",
-            description="Apply the resistance factor φc = 0.90 for compression.",
+            description=_DESC["wp_lrfd"],
             equation="φPn = 0.90 × Pn",
             substitution=f"φPn = 0.90 × {Pn_wp:.2f}",
             result=Pn_design,
             unit="kN",
             code_ref="AISC 360-16 E1"
-        ))
+        )
     else:
-        Omega_c = 1.67
-        Pn_design = Pn_wp / Omega_c
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Allowable Buckling Capacity (ASD)",
-            description="Apply the safety factor Ωc = 1.67 for compression.",
+            description=_DESC["wp_asd"],
             equation="Pn/Ωc = Pn / 1.67",
             substitution=f"Pn/Ωc = {Pn_wp:.2f} / 1.67",
             result=Pn_design,
             unit="kN",
             code_ref="AISC 360-16 E1"
-        ))
+        )
     
     # =========================================================================
     # 7. DEMAND/CAPACITY CHECK
     # =========================================================================
-    ratio = Vh / Pn_design if Pn_design > 0 else float('inf')
-    status = "PASS" if ratio <= 1.0 else "FAIL"
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Web Post Buckling Check",
-        description="Compare the horizontal shear force in the web post to its buckling capacity.",
+        description=_DESC["wp_check"],
         equation="Vh / φPn ≤ 1.0" if method == "LRFD" else "Vh / (Pn/Ωc) ≤ 1.0",
         substitution=f"{Vh:.2f} / {Pn_design:.2f}",
         result=ratio,
         unit="-",
         code_ref="AISC DG31 §5.4",
         status=status,
-        notes=f"{'✓ OK - Web post buckling is adequate' if status == 'PASS' else '✗ NG - Web post buckling capacity exceeded'}"
-    ))
+        notes=_NOTES_WEB_POST[status]
+    )
     
-    section.steps = steps
-    section.status = status
-    section.conclusion = f"""
-WEB POST BUCKLING SUMMARY:
-══════════════════════════════════════════════════════════════════════════════
-Design Method: {method}
-Buckling Type: {buckle_type}
-──────────────────────────────────────────────────────────────────────────────
-WEB POST GEOMETRY:
-  Width (b_wp):                 {b_wp:.1f} mm
-  Height (h_eff):               {h_eff:.1f} mm
-  Thickness (tw):               {tw} mm
-  Slenderness (λ_wp):           {lambda_wp:.1f}
-──────────────────────────────────────────────────────────────────────────────
-BUCKLING ANALYSIS:
-  Elastic buckling (Fe):        {Fe_wp:.1f} MPa
-  Critical stress (Fcr):        {Fcr:.1f} MPa
-  Nominal capacity (Pn):        {Pn_wp:.2f} kN
-  Design capacity:              {Pn_design:.2f} kN
-──────────────────────────────────────────────────────────────────────────────
-DEMAND:
-  Horizontal shear (Vh):        {Vh:.2f} kN
-──────────────────────────────────────────────────────────────────────────────
-CHECK:
-  D/C Ratio:                    {ratio:.3f}
-  Status:                       {status}
-══════════════════════════════════════════════════════════════════════════════
-"""
+    section.set_rows(buf.to_rows())
+    section.conclusion = "\n".join([
+        "",
+        "WEB POST BUCKLING SUMMARY:",
+        _RULE_HEAVY,
+        f"Design Method: {method}",
+        f"Buckling Type: {buckle_type}",
+        _RULE_LIGHT,
+        "WEB POST GEOMETRY:",
+        f"  Width (b_wp):                 {b_wp:.1f} mm",
+        f"  Height (h_eff):               {h_eff:.1f} mm",
+        f"  Thickness (tw):               {tw} mm",
+        f"  Slenderness (λ_wp):           {lambda_wp:.1f}",
+        _RULE_LIGHT,
+        "BUCKLING ANALYSIS:",
+        f"  Elastic buckling (Fe):        {Fe_wp:.1f} MPa",
+        f"  Critical stress (Fcr):        {Fcr:.1f} MPa",
+        f"  Nominal capacity (Pn):        {Pn_wp:.2f} kN",
+        f"  Design capacity:              {Pn_design:.2f} kN",
+        _RULE_LIGHT,
+        "DEMAND:",
+        f"  Horizontal shear (Vh):        {Vh:.2f} kN",
+        _RULE_LIGHT,
+        "CHECK:",
+        f"  D/C Ratio:                    {ratio:.3f}",
+        f"  Status:                       {status}",
+        _RULE_HEAVY,
+        ""
+    ])
+    
+    return section, results
+
+
+@lru_cache(maxsize=32)
+def _shear_primitives(Fy: float, E: float, kv: float = 5.34) -> Tuple[float, float, float]:
+    """
+    Shear yield stress and web shear slenderness limits per AISC 360-16
+    G2.1, cached per (Fy, E, kv) since they depend only on the material
+    and web type. Horizontal shear uses Fv only, vertical shear all three.
+    
+    Returns:
+        (Fv, Cv1_limit, Cv2_limit) = (0.6·Fy, 1.10·√(kv·E/Fy), 1.37·√(kv·E/Fy))
+    """
+    r = math.sqrt(kv * E / Fy)
+    return 0.6 * Fy, 1.10 * r, 1.37 * r
+
+
+@dataclass(frozen=True, slots=True)
+class SteelGrade:
+    """
+    Material constants shared by the horizontal and vertical shear
+    checks, computed once per grade. A design loop can bind one instance
+    and pass it as grade= to both checks.
+    
+    Attributes:
+        Fy: Yield stress (MPa)
+        E: Modulus of elasticity (MPa)
+        Fv: Shear yield stress 0.6·Fy (MPa)
+        Cv1_limit, Cv2_limit: AISC 360-16 G2.1 web limits for an
+            unstiffened web (kv = 5.34)
+    """
+    Fy: float
+    E: float
+    Fv: float = field(init=False)
+    Cv1_limit: float = field(init=False)
+    Cv2_limit: float = field(init=False)
+
+    def __post_init__(self):
+        Fv, Cv1_limit, Cv2_limit = _shear_primitives(self.Fy, self.E)
+        object.__setattr__(self, 'Fv', Fv)
+        object.__setattr__(self, 'Cv1_limit', Cv1_limit)
+        object.__setattr__(self, 'Cv2_limit', Cv2_limit)
+
+
+@lru_cache(maxsize=32)
+def _steel_grade(Fy: float, E: float) -> SteelGrade:
+    """Cached SteelGrade for checks called with bare Fy, E."""
+    return SteelGrade(Fy, E)
+
+
+@njit('UniTuple(f8, 8)(f8, f8, f8, f8, f8, f8, f8, i8)')
+def _horizontal_shear_kernel(dg, ho, dt, tw, Mu, S, Fv, method_id):
+    """
+    Pure-arithmetic horizontal shear check, compiled eagerly for its
+    explicit float64 signature when numba is available. method_id is a
+    Method code indexing _H_SHEAR_FACTOR.
+    
+    Returns:
+        (T_flange, T_kN, Vh, A_wp_shear, Fv, Vn_h, Vn_design, ratio)
+    """
+    # Simplified approach: Vh based on global moment
+    arm = dg - dt  # Moment arm between tee centroids
+    T_flange = Mu * 1000 / arm  # Force in one flange (N converted from kN·m)
+    T_kN = T_flange / 1000
+    
+    # Conservative fraction of the flange force, minimum 5%
+    Vh = max(T_kN * S / (dg * 10), 0.05 * T_kN)
+    
+    # Web post resists horizontal shear through its cross-section
+    A_wp_shear = ho * tw
+    Vn_h = Fv * A_wp_shear / 1000  # kN (Fv = 0.6Fy shear yield stress)
+    factor = _H_SHEAR_FACTOR[method_id]
+    Vn_design = Vn_h / factor if method_id else factor * Vn_h
+    
+    ratio = Vh / Vn_design if Vn_design > 0 else math.inf
+    
+    return T_flange, T_kN, Vh, A_wp_shear, Fv, Vn_h, Vn_design, ratio
+
+
+def _horizontal_shear_core(
+    dg: float, ho: float, dt: float, tw: float,
+    Mu: float, S: float,
+    Fv: float,
+    method: str = "LRFD"
+) -> Dict:
+    """
+    Numeric part of calc_horizontal_shear_detailed (no report text).
+    
+    Returns:
+        Dict of all intermediate and final values used by the report
+    """
+    T_flange, T_kN, Vh, A_wp_shear, Fv, Vn_h, Vn_design, ratio = _horizontal_shear_kernel(
+        float(dg), float(ho), float(dt), float(tw), float(Mu), float(S), float(Fv),
+        int(Method.coerce(method))
+    )
+    status = _CHECK_STATUS[ratio <= 1.0]
     
-    return section, {
-        'lambda_wp': lambda_wp, 'Fe_wp': Fe_wp, 'Fcr': Fcr,
-        'Pn_wp': Pn_wp, 'Pn_design': Pn_design, 'ratio': ratio,
-        'buckle_type': buckle_type
+    return {
+        'T_flange': T_flange, 'T_kN': T_kN, 'Vh': Vh,
+        'A_wp_shear': A_wp_shear, 'Fv': Fv,
+        'Vn_h': Vn_h, 'Vn_design': Vn_design,
+        'ratio': ratio, 'status': status
     }
 
 
@@ -1499,31 +2459,49 @@ def calc_horizontal_shear_detailed(
     Ix_gross: float, Ix_net: float,
     Mu: float, S: float,
     Fy: float, E: float,
-    method: str = "LRFD"
-) -> DetailedCalcSection:
+    method: str = "LRFD",
+    verbose: bool = True,
+    grade: Optional[SteelGrade] = None
+) -> Tuple[DetailedCalcSection, HorizontalShearResult]:
     """
     Detailed horizontal shear calculation per AISC DG31 §5.5.
     
     Horizontal shear force develops in the web post due to the change in
     moment across the opening, transferred through the web post.
+    
+    With verbose=False the calculation steps and conclusion text are
+    skipped and only the section status and results are returned. A
+    precomputed grade, if given, supplies the material constants in
+    place of Fy, E.
     """
+    if grade is None:
+        grade = _steel_grade(Fy, E)
+    Fy = grade.Fy
+    m = Method.coerce(method)
+    method = m.name
+    c = _horizontal_shear_core(dg, ho, dt, tw, Mu, S, grade.Fv, m)
+    results = HorizontalShearResult._make([c[k] for k in HorizontalShearResult._fields])
+    
     section = DetailedCalcSection(
         section_number=5,
         title="HORIZONTAL SHEAR",
         description="Calculate the horizontal shear force in the web post due to moment gradient "
                    "across the opening per AISC DG31 Section 5.5.",
-        code_ref="AISC DG31 §5.5"
+        code_ref="AISC DG31 §5.5",
+        status=c['status']
     )
+    if not verbose:
+        return section, results
+    
+    T_kN, Vh, A_wp_shear, Fv = c['T_kN'], c['Vh'], c['A_wp_shear'], c['Fv']
+    Vn_h, Vn_design, ratio, status = c['Vn_h'], c['Vn_design'], c['ratio'], c['status']
     
-    steps = []
-    step_num = 0
+    buf = _StepBuf(7)
     
     # =========================================================================
     # 1. MOMENT GRADIENT AND HORIZONTAL SHEAR
     # =========================================================================
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Horizontal Shear Mechanism",
         description="As moment varies along the beam, the compression and tension forces in the "
                    "tees change. This change must be transferred through the web post as horizontal shear.",
@@ -1532,159 +2510,141 @@ def calc_horizontal_shear_detailed(
         result=0,
         unit="kN",
         code_ref="AISC DG31 §5.5.1"
-    ))
+    )
     
     # Calculate horizontal shear from moment
     # Vh = (M/dg) × (S/dg) approximately
     # Or more accurately: Vh = V × S × ho / (2 × Ix_gross) × A_tee
     
     # Simplified approach: Vh based on global moment
-    arm = dg - dt  # Moment arm between tee centroids
-    T_flange = Mu * 1000 / arm  # Force in one flange (N converted from kN·m)
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Flange Force from Moment",
         description="Calculate the approximate axial force in each tee from the global moment.",
         equation="T = M / (dg - dt)",
-        substitution=f"T = {Mu:.2f} × 1000 / ({dg:.1f} - {dt:.1f})",
-        result=T_flange/1000,
+        substitution=("T = {:.2f} × 1000 / ({:.1f} - {:.1f})", (Mu, dg, dt)),
+        result=T_kN,
         unit="kN",
         code_ref="AISC DG31 §5.5.1"
-    ))
+    )
     
     # Horizontal shear is related to how this force changes across one opening
     # Simplified: Vh ≈ T × (S/L) for uniform moment gradient
-    # Use conservative estimate
-    Vh = T_flange / 1000 * S / (dg * 10)  # Approximate horizontal shear
-    Vh = max(Vh, 0.05 * T_flange / 1000)  # Minimum 5% of flange force
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    # Use conservative estimate (minimum 5% of flange force)
+    buf.emit(
         title="Horizontal Shear Force",
         description="Estimate the horizontal shear force in the web post. This is conservatively "
                    "taken as a fraction of the flange force based on the moment gradient.",
         equation="Vh ≈ T × (S / 10dg) (approximate for uniform load)",
-        substitution=f"Vh = {T_flange/1000:.1f} × {S:.0f} / (10 × {dg:.1f})",
+        substitution=("Vh = {:.1f} × {:.0f} / (10 × {:.1f})", (T_kN, S, dg)),
         result=Vh,
         unit="kN",
         code_ref="AISC DG31 §5.5.2"
-    ))
+    )
     
     # =========================================================================
     # 2. HORIZONTAL SHEAR CAPACITY
     # =========================================================================
     # Web post resists horizontal shear through its cross-section
     # Capacity based on shear yield
-    A_wp_shear = ho * tw  # Effective area for horizontal shear
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Web Post Shear Area",
         description="The effective area of the web post resisting horizontal shear.",
         equation="Aw = ho × tw",
-        substitution=f"Aw = {ho:.1f} × {tw}",
+        substitution=("Aw = {:.1f} × {}", (ho, tw)),
         result=A_wp_shear,
         unit="mm²",
         code_ref="AISC DG31 §5.5.3"
-    ))
+    )
     
     # Nominal shear capacity
-    Fv = 0.6 * Fy  # Shear yield stress
-    Vn_h = Fv * A_wp_shear / 1000  # kN
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Nominal Horizontal Shear Capacity",
         description="The nominal horizontal shear capacity based on shear yielding of the web post.",
         equation="Vn = 0.6Fy × Aw",
-        substitution=f"Vn = 0.6 × {Fy} × {A_wp_shear:.0f} / 1000",
+        substitution=("Vn = 0.6 × {} × {:.0f} / 1000", (Fy, A_wp_shear)),
         result=Vn_h,
         unit="kN",
         code_ref="AISC 360-16 J4.2"
-    ))
+    )
     
     # =========================================================================
     # 3. DESIGN/ALLOWABLE CAPACITY
     # =========================================================================
-    if method == "LRFD":
-        phi_v = 1.00
-        Vn_design = phi_v * Vn_h
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+    if m == Method.LRFD:
+        buf.emit(
             title="Design Horizontal Shear Capacity (LRFD)",
             description="Apply the resistance factor φv = 1.00 for shear yielding.",
             equation="φVn = 1.00 × Vn",
-            substitution=f"φVn = 1.00 × {Vn_h:.2f}",
+            substitution=("φVn = 1.00 × {:.2f}", (Vn_h,)),
             result=Vn_design,
             unit="kN",
             code_ref="AISC 360-16 J4.2"
-        ))
+        )
     else:
-        Omega_v = 1.50
-        Vn_design = Vn_h / Omega_v
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Allowable Horizontal Shear Capacity (ASD)",
             description="Apply the safety factor Ωv = 1.50 for shear.",
             equation="Vn/Ωv = Vn / 1.50",
-            substitution=f"Vn/Ωv = {Vn_h:.2f} / 1.50",
+            substitution=("Vn/Ωv = {:.2f} / 1.50", (Vn_h,)),
             result=Vn_design,
             unit="kN",
             code_ref="AISC 360-16 J4.2"
-        ))
+        )
     
     # =========================================================================
     # 4. DEMAND/CAPACITY CHECK
     # =========================================================================
-    ratio = Vh / Vn_design if Vn_design > 0 else float('inf')
-    status = "PASS" if ratio <= 1.0 else "FAIL"
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Horizontal Shear Check",
         description="Compare the horizontal shear force to the available capacity.",
-        equation="Vh / φVn ≤ 1.0" if method == "LRFD" else "Vh / (Vn/Ωv) ≤ 1.0",
-        substitution=f"{Vh:.2f} / {Vn_design:.2f}",
+        equation="Vh / φVn ≤ 1.0" if m == Method.LRFD else "Vh / (Vn/Ωv) ≤ 1.0",
+        substitution=("{:.2f} / {:.2f}", (Vh, Vn_design)),
         result=ratio,
         unit="-",
         code_ref="AISC DG31 §5.5",
         status=status,
-        notes=f"{'✓ OK - Horizontal shear is adequate' if status == 'PASS' else '✗ NG - Horizontal shear capacity exceeded'}"
-    ))
+        notes=_NOTES_H_SHEAR[status]
+    )
     
-    section.steps = steps
-    section.status = status
-    section.conclusion = f"""
-HORIZONTAL SHEAR SUMMARY:
-══════════════════════════════════════════════════════════════════════════════
-Design Method: {method}
-──────────────────────────────────────────────────────────────────────────────
-CAPACITY:
-  Shear area (Aw):              {A_wp_shear:.0f} mm²
-  Shear yield stress (0.6Fy):   {Fv:.1f} MPa
-  Nominal capacity (Vn):        {Vn_h:.2f} kN
-  Design capacity:              {Vn_design:.2f} kN
-──────────────────────────────────────────────────────────────────────────────
-DEMAND:
-  Horizontal shear (Vh):        {Vh:.2f} kN
-──────────────────────────────────────────────────────────────────────────────
-CHECK:
-  D/C Ratio:                    {ratio:.3f}
-  Status:                       {status}
-══════════════════════════════════════════════════════════════════════════════
-"""
+    section.set_rows(buf.to_rows())
+    section.conclusion = _H_SHEAR_CONCLUSION(locals())
+    
+    return section, results
+
+
+_SHEAR_TYPES = ("Yielding", "Inelastic Buckling", "Elastic Buckling")
+
+
+@njit(cache=True)
+def _vertical_shear_kernel(h_tw, Cv1_limit, Cv2_limit, kv, E, Fy, Fv, Aw_total, method_id):
+    """
+    Pure-arithmetic AISC 360-16 G2.1 shear strength of the tee stems,
+    JIT-compiled when numba is available. Fv and the slenderness limits come
+    in precomputed from _shear_primitives, the method is passed as a Method code
+    (method_id) and the shear behavior comes back as an index into _SHEAR_TYPES
+    so the kernel stays in nopython mode.
     
-    return section, {
-        'Vh': Vh, 'Vn_h': Vn_h, 'Vn_design': Vn_design, 'ratio': ratio
-    }
+    Returns:
+        (Cv, shear_type_id, Vn, factor, Vn_design), where factor is φv
+        (LRFD) or Ωv (ASD)
+    """
+    if h_tw <= Cv1_limit:
+        Cv = 1.0
+        shear_type_id = 0
+    else:
+        if h_tw <= Cv2_limit:
+            Cv = Cv1_limit / h_tw
+            shear_type_id = 1
+        else:
+            Cv = 1.51 * kv * E / (h_tw**2 * Fy)
+            shear_type_id = 2
+    
+    Vn = Fv * Aw_total * Cv / 1000  # kN
+    
+    factor = _V_SHEAR_FACTORS[method_id][0 if Cv == 1.0 else 1]
+    Vn_design = Vn / factor if method_id else factor * Vn
+    
+    return Cv, shear_type_id, Vn, factor, Vn_design
 
 
 def calc_vertical_shear_detailed(
@@ -1692,11 +2652,22 @@ def calc_vertical_shear_detailed(
     A_tee: float,
     Fy: float, E: float,
     Vu: float,
-    method: str = "LRFD"
-) -> DetailedCalcSection:
+    method: str = "LRFD",
+    verbose: bool = True,
+    grade: Optional[SteelGrade] = None
+) -> Tuple[DetailedCalcSection, VerticalShearResult]:
     """
     Detailed vertical shear calculation at openings per AISC DG31 §5.6.
+    
+    With verbose=False the steps go to a null sink (no DetailedCalcStep
+    objects are built) and the conclusion text is skipped. A precomputed
+    grade, if given, supplies the material constants in place of Fy, E.
     """
+    if grade is None:
+        grade = _steel_grade(Fy, E)
+    Fy, E = grade.Fy, grade.E
+    m = Method.coerce(method)
+    method = m.name
     section = DetailedCalcSection(
         section_number=6,
         title="VERTICAL SHEAR AT OPENINGS",
@@ -1705,23 +2676,20 @@ def calc_vertical_shear_detailed(
         code_ref="AISC DG31 §5.6"
     )
     
-    steps = []
-    step_num = 0
+    buf = _StepBuf(8) if verbose else _NULL_STEPS
     
     # =========================================================================
     # 1. SHEAR AT OPENING
     # =========================================================================
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Required Vertical Shear",
         description="The required vertical shear strength at the critical opening location.",
         equation="Vu from structural analysis",
-        substitution=f"Vu = {Vu:.2f} kN",
+        substitution=("Vu = {:.2f} kN", (Vu,)),
         result=Vu,
         unit="kN",
         code_ref="ASCE 7 Load Combinations"
-    ))
+    )
     
     # =========================================================================
     # 2. TEE SHEAR AREA
@@ -1731,29 +2699,25 @@ def calc_vertical_shear_detailed(
     Aw_tee = d_stem * tw  # Shear area of one tee stem
     Aw_total = 2 * Aw_tee  # Both tees
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Tee Stem Depth",
         description="The depth of the tee stem (web portion of tee).",
         equation="d_stem = dt - tf",
-        substitution=f"d_stem = {dt:.1f} - {tf}",
+        substitution=("d_stem = {:.1f} - {}", (dt, tf)),
         result=d_stem,
         unit="mm",
         code_ref="AISC DG31 §5.6.1"
-    ))
+    )
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Total Shear Area at Opening",
         description="The total area resisting vertical shear consists of both tee stems.",
         equation="Aw = 2 × d_stem × tw",
-        substitution=f"Aw = 2 × {d_stem:.1f} × {tw}",
+        substitution=("Aw = 2 × {:.1f} × {}", (d_stem, tw)),
         result=Aw_total,
         unit="mm²",
         code_ref="AISC DG31 §5.6.1"
-    ))
+    )
     
     # =========================================================================
     # 3. WEB SHEAR COEFFICIENT
@@ -1761,171 +2725,342 @@ def calc_vertical_shear_detailed(
     # Check if web is compact for shear
     h_tw = d_stem / tw
     kv = 5.34  # For unstiffened webs
-    Cv1_limit = 1.10 * math.sqrt(kv * E / Fy)
+    Cv1_limit, Cv2_limit = grade.Cv1_limit, grade.Cv2_limit
+    Cv, shear_type_id, Vn, factor, Vn_design = _vertical_shear_kernel(
+        float(h_tw), Cv1_limit, Cv2_limit, kv, float(E), float(Fy), grade.Fv, float(Aw_total),
+        int(m)
+    )
+    shear_type = _SHEAR_TYPES[shear_type_id]
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Tee Stem Slenderness for Shear",
         description="Check the web slenderness to determine the shear coefficient Cv.",
         equation="h/tw vs 1.10√(kvE/Fy)",
-        substitution=f"h/tw = {h_tw:.1f}, limit = 1.10×√({kv}×{E}/{Fy}) = {Cv1_limit:.1f}",
+        substitution=("h/tw = {:.1f}, limit = 1.10×√({}×{}/{}) = {:.1f}", (h_tw, kv, E, Fy, Cv1_limit)),
         result=h_tw,
         unit="-",
         code_ref="AISC 360-16 G2.1"
-    ))
+    )
     
-    if h_tw <= Cv1_limit:
-        Cv = 1.0
-        shear_type = "Yielding"
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+    if shear_type_id == 0:
+        buf.emit(
             title="Web Shear Coefficient",
             description="Since h/tw ≤ 1.10√(kvE/Fy), the web is compact for shear and Cv = 1.0.",
             equation="Cv = 1.0 (compact web)",
-            substitution=f"h/tw = {h_tw:.1f} ≤ {Cv1_limit:.1f} ∴ Cv = 1.0",
+            substitution=("h/tw = {:.1f} ≤ {:.1f} ∴ Cv = 1.0", (h_tw, Cv1_limit)),
             result=Cv,
             unit="-",
             code_ref="AISC 360-16 G2.1(a)"
-        ))
+        )
     else:
-        Cv2_limit = 1.37 * math.sqrt(kv * E / Fy)
-        if h_tw <= Cv2_limit:
-            Cv = Cv1_limit / h_tw
-            shear_type = "Inelastic Buckling"
-        else:
-            Cv = 1.51 * kv * E / (h_tw**2 * Fy)
-            shear_type = "Elastic Buckling"
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        buf.emit(
             title="Web Shear Coefficient (Noncompact)",
             description=f"Since h/tw > 1.10√(kvE/Fy), {shear_type.lower()} governs.",
             equation="Cv from AISC 360-16 G2.1",
-            substitution=f"Cv = {Cv:.3f}",
+            substitution=("Cv = {:.3f}", (Cv,)),
             result=Cv,
             unit="-",
             code_ref="AISC 360-16 G2.1"
-        ))
+        )
     
     # =========================================================================
     # 4. NOMINAL SHEAR STRENGTH
     # =========================================================================
-    Vn = 0.6 * Fy * Aw_total * Cv / 1000  # kN
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Nominal Vertical Shear Strength",
         description="Calculate the nominal shear strength at the opening.",
         equation="Vn = 0.6 × Fy × Aw × Cv",
-        substitution=f"Vn = 0.6 × {Fy} × {Aw_total:.0f} × {Cv:.3f} / 1000",
+        substitution=("Vn = 0.6 × {} × {:.0f} × {:.3f} / 1000", (Fy, Aw_total, Cv)),
         result=Vn,
         unit="kN",
         code_ref="AISC 360-16 G2.1"
-    ))
+    )
     
     # =========================================================================
     # 5. DESIGN/ALLOWABLE CAPACITY
     # =========================================================================
-    if method == "LRFD":
-        if Cv == 1.0:
-            phi_v = 1.00
-        else:
-            phi_v = 0.90
-        Vn_design = phi_v * Vn
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+    if m == Method.LRFD:
+        phi_v = factor
+        buf.emit(
             title="Design Shear Strength (LRFD)",
             description=f"Apply φv = {phi_v:.2f} for shear.",
             equation=f"φVn = {phi_v:.2f} × Vn",
-            substitution=f"φVn = {phi_v:.2f} × {Vn:.2f}",
+            substitution=("φVn = {:.2f} × {:.2f}", (phi_v, Vn)),
             result=Vn_design,
             unit="kN",
             code_ref="AISC 360-16 G1"
-        ))
+        )
     else:
-        if Cv == 1.0:
-            Omega_v = 1.50
-        else:
-            Omega_v = 1.67
-        Vn_design = Vn / Omega_v
-        step_num += 1
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
+        Omega_v = factor
+        buf.emit(
             title="Allowable Shear Strength (ASD)",
             description=f"Apply Ωv = {Omega_v:.2f} for shear.",
             equation=f"Vn/Ωv = Vn / {Omega_v:.2f}",
-            substitution=f"Vn/Ωv = {Vn:.2f} / {Omega_v:.2f}",
+            substitution=("Vn/Ωv = {:.2f} / {:.2f}", (Vn, Omega_v)),
             result=Vn_design,
             unit="kN",
             code_ref="AISC 360-16 G1"
-        ))
+        )
     
     # =========================================================================
     # 6. DEMAND/CAPACITY CHECK
     # =========================================================================
     ratio = Vu / Vn_design if Vn_design > 0 else float('inf')
-    status = "PASS" if ratio <= 1.0 else "FAIL"
+    status = _CHECK_STATUS[ratio <= 1.0]
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Vertical Shear Check",
         description="Compare the required shear to the available shear strength at the opening.",
-        equation="Vu / φVn ≤ 1.0" if method == "LRFD" else "Va / (Vn/Ωv) ≤ 1.0",
-        substitution=f"{Vu:.2f} / {Vn_design:.2f}",
+        equation="Vu / φVn ≤ 1.0" if m == Method.LRFD else "Va / (Vn/Ωv) ≤ 1.0",
+        substitution=("{:.2f} / {:.2f}", (Vu, Vn_design)),
         result=ratio,
         unit="-",
         code_ref="AISC DG31 §5.6",
         status=status,
         notes=f"{'✓ OK - Vertical shear at opening is adequate' if status == 'PASS' else '✗ NG - Vertical shear capacity exceeded'}"
-    ))
+    )
     
-    section.steps = steps
+    section.set_rows(buf.to_rows())
     section.status = status
-    section.conclusion = f"""
-VERTICAL SHEAR AT OPENINGS SUMMARY:
-══════════════════════════════════════════════════════════════════════════════
-Design Method: {method}
-Shear Behavior: {shear_type}
-──────────────────────────────────────────────────────────────────────────────
-SHEAR AREA:
-  Tee stem depth (d_stem):      {d_stem:.1f} mm
-  Total shear area (Aw):        {Aw_total:.0f} mm²
-  Web slenderness (h/tw):       {h_tw:.1f}
-  Shear coefficient (Cv):       {Cv:.3f}
-──────────────────────────────────────────────────────────────────────────────
-CAPACITY:
-  Nominal capacity (Vn):        {Vn:.2f} kN
-  Design capacity:              {Vn_design:.2f} kN
-──────────────────────────────────────────────────────────────────────────────
-DEMAND:
-  Required shear (Vu):          {Vu:.2f} kN
-──────────────────────────────────────────────────────────────────────────────
-CHECK:
-  D/C Ratio:                    {ratio:.3f}
-  Status:                       {status}
-══════════════════════════════════════════════════════════════════════════════
-"""
+    if buf.wants_conclusion:
+        section.conclusion = _V_SHEAR_CONCLUSION(locals())
+    
+    return section, VerticalShearResult(Aw_total, Cv, Vn, Vn_design, ratio)
+
+
+@njit(cache=True)
+def _deflection_kernel(L, Ix_eff, E, w_total, w_live):
+    """
+    Pure-arithmetic simple-span deflection, JIT-compiled when numba is
+    available.
+    
+    Returns:
+        (delta, delta_live, delta_limit_total, delta_limit_live,
+         ratio_total, ratio_live)
+    """
+    # Simple span uniform load: δ = 5wL⁴ / (384EI), with 1 kN/m = 1 N/mm
+    L2 = L * L
+    delta = 5.0 * w_total * (L2 * L2) / (384.0 * E * Ix_eff)  # mm
+    
+    # L/240 for total load, L/360 for live load
+    delta_limit_total = L / 240.0
+    delta_limit_live = L / 360.0
+    delta_live = delta * w_live / w_total if w_total > 0 else 0.0
+    
+    return (delta, delta_live, delta_limit_total, delta_limit_live,
+            delta / delta_limit_total, delta_live / delta_limit_live)
+
+
+# Kernels as defined in this module, keyed by their exported AOT names
+_JIT_KERNELS = {
+    'web_post': _web_post_kernel,
+    'hshear': _horizontal_shear_kernel,
+    'vshear': _vertical_shear_kernel,
+    'deflection': _deflection_kernel,
+}
+
+if _dg31_kernels is not None:
+    _web_post_kernel = _dg31_kernels.web_post
+    _horizontal_shear_kernel = _dg31_kernels.hshear
+    _vertical_shear_kernel = _dg31_kernels.vshear
+    _deflection_kernel = _dg31_kernels.deflection
+
+
+def _deflection_core(
+    L: float,
+    Ix_gross: float, Ix_net: float,
+    E: float,
+    w_dead: float, w_live: float,
+    n_openings: int = 10
+) -> Dict:
+    """
+    Numeric part of calc_deflection_detailed (no report text).
+    
+    Returns:
+        Dict of all intermediate and final values used by the report
+    """
+    w_total = w_dead + w_live  # kN/m (service)
+    
+    # Average of solid and open section stiffness, reduced for the extra
+    # shear deformation at the openings
+    Ix_avg = (Ix_gross + Ix_net) / 2
+    alpha = 1.0 + 0.015 * n_openings  # Deflection increase factor
+    Ix_eff = Ix_avg / alpha
+    
+    (delta, delta_live, delta_limit_total, delta_limit_live,
+     ratio_total, ratio_live) = _deflection_kernel(
+        float(L), Ix_eff, float(E), float(w_total), float(w_live)
+    )
+    status = "PASS" if ratio_total <= 1.0 and ratio_live <= 1.0 else "FAIL"
+    
+    return {
+        'w_total': w_total, 'Ix_avg': Ix_avg, 'alpha': alpha, 'Ix_eff': Ix_eff,
+        'delta': delta, 'delta_live': delta_live,
+        'delta_limit_total': delta_limit_total, 'delta_limit_live': delta_limit_live,
+        'ratio_total': ratio_total, 'ratio_live': ratio_live, 'status': status
+    }
+
+
+def calc_deflection_batch(
+    L: np.ndarray,
+    Ix_gross: np.ndarray, Ix_net: np.ndarray,
+    E: float,
+    w_dead: np.ndarray, w_live: np.ndarray,
+    n_openings: np.ndarray = 10
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized deflection check for many candidate designs at once.
+    
+    Same arithmetic as calc_deflection_detailed (AISC DG31 §5.7),
+    evaluated with NumPy over arrays of span, stiffness, load and opening
+    count, with no calculation steps. Inputs broadcast against each other.
+    
+    Args:
+        L: Span (mm)
+        Ix_gross, Ix_net: Gross and net moment of inertia (mm⁴)
+        E: Modulus of elasticity (MPa)
+        w_dead, w_live: Service loads (kN/m)
+        n_openings: Number of web openings
+        
+    Returns:
+        Dict of arrays: Ix_eff, alpha, delta, delta_live, delta_limit_total,
+        delta_limit_live, ratio_total, ratio_live, ok (both checks pass)
+    """
+    L = np.asarray(L, dtype=np.float64)
+    w_dead = np.asarray(w_dead, dtype=np.float64)
+    w_live = np.asarray(w_live, dtype=np.float64)
+    w_total = w_dead + w_live
+    
+    alpha = 1.0 + 0.015 * np.asarray(n_openings, dtype=np.float64)
+    Ix_eff = (np.asarray(Ix_gross, dtype=np.float64) + Ix_net) / 2 / alpha
+    delta = 5 * w_total * (L**4) / (384 * E * Ix_eff)
+    
+    delta_limit_total = L / 240
+    delta_limit_live = L / 360
+    
+    delta, w_live, w_total, delta_limit_total, delta_limit_live, Ix_eff, alpha = np.broadcast_arrays(
+        delta, w_live, w_total, delta_limit_total, delta_limit_live, Ix_eff, alpha
+    )
+    delta_live = np.zeros(delta.shape)
+    np.divide(delta * w_live, w_total, out=delta_live, where=w_total > 0)
+    
+    ratio_total = delta / delta_limit_total
+    ratio_live = delta_live / delta_limit_live
+    
+    return {
+        'Ix_eff': Ix_eff, 'alpha': alpha,
+        'delta': delta, 'delta_live': delta_live,
+        'delta_limit_total': delta_limit_total, 'delta_limit_live': delta_limit_live,
+        'ratio_total': ratio_total, 'ratio_live': ratio_live,
+        'ok': (ratio_total <= 1.0) & (ratio_live <= 1.0)
+    }
+
+
+def calc_dg31_checks_batch(
+    dg: np.ndarray, ho: np.ndarray, dt: np.ndarray, tf: np.ndarray, tw: np.ndarray,
+    Fy: np.ndarray, E: float,
+    Vu: np.ndarray, Mu: np.ndarray, S: np.ndarray,
+    L: np.ndarray, Ix_gross: np.ndarray, Ix_net: np.ndarray,
+    w_dead: np.ndarray, w_live: np.ndarray,
+    n_openings: np.ndarray = 10,
+    method: str = "LRFD"
+) -> Dict[str, np.ndarray]:
+    """
+    Horizontal shear, vertical shear and deflection checks for many
+    candidate designs in one vectorized pass.
+    
+    Same arithmetic as calc_horizontal_shear_detailed (§5.5),
+    calc_vertical_shear_detailed (§5.6) and calc_deflection_detailed
+    (§5.7), evaluated with NumPy over one array per input field, with no
+    calculation steps. Inputs broadcast against each other.
+    
+    Args:
+        dg, ho, dt, tf, tw: Expanded depth, opening height, tee depth,
+                            flange and web thickness (mm)
+        Fy, E: Material properties (MPa)
+        Vu, Mu: Required shear (kN) and moment (kN·m)
+        S: Opening spacing (mm)
+        L, Ix_gross, Ix_net, w_dead, w_live, n_openings: Deflection inputs
+                            as for calc_deflection_batch
+        method: "LRFD" or "ASD"
+        
+    Returns:
+        Dict of arrays: Vh, Vn_h_design, ratio_h, Cv, Vn_v_design, ratio_v,
+        delta, delta_live, ratio_total, ratio_live, ok (all checks pass)
+    """
+    dg = np.asarray(dg, dtype=np.float64)
+    dt = np.asarray(dt, dtype=np.float64)
+    tw = np.asarray(tw, dtype=np.float64)
+    Fy = np.asarray(Fy, dtype=np.float64)
+    m = Method.coerce(method)
+    
+    # Horizontal shear (§5.5)
+    T_kN = np.asarray(Mu, dtype=np.float64) * 1000 / (dg - dt) / 1000
+    Vh = np.maximum(T_kN * S / (dg * 10), 0.05 * T_kN)
+    Fv = 0.6 * Fy  # shared by both shear checks
+    Vn_h = Fv * (np.asarray(ho, dtype=np.float64) * tw) / 1000
+    factor_h = _H_SHEAR_FACTOR[m]
+    Vn_h_design = Vn_h / factor_h if m else factor_h * Vn_h
+    
+    # Vertical shear at openings (§5.6)
+    kv = 5.34
+    d_stem = dt - tf
+    Aw_total = 2 * (d_stem * tw)
+    h_tw = d_stem / tw
+    r = np.sqrt(kv * E / Fy)
+    Cv1_limit, Cv2_limit = 1.10 * r, 1.37 * r
+    Cv = np.where(
+        h_tw <= Cv1_limit,
+        1.0,
+        np.where(h_tw <= Cv2_limit, Cv1_limit / h_tw, 1.51 * kv * E / (h_tw**2 * Fy))
+    )
+    Vn_v = Fv * Aw_total * Cv / 1000
+    factor_v = np.asarray(_V_SHEAR_FACTORS[m])[np.where(Cv == 1.0, 0, 1)]
+    Vn_v_design = Vn_v / factor_v if m else factor_v * Vn_v
     
-    return section, {
-        'Aw_total': Aw_total, 'Cv': Cv, 'Vn': Vn, 
-        'Vn_design': Vn_design, 'ratio': ratio
+    Vh, Vn_h_design, Vu, Vn_v_design, Cv = np.broadcast_arrays(
+        Vh, Vn_h_design, np.asarray(Vu, dtype=np.float64), Vn_v_design, Cv
+    )
+    ratio_h = np.full(Vh.shape, np.inf)
+    np.divide(Vh, Vn_h_design, out=ratio_h, where=Vn_h_design > 0)
+    ratio_v = np.full(Vu.shape, np.inf)
+    np.divide(Vu, Vn_v_design, out=ratio_v, where=Vn_v_design > 0)
+    
+    # Deflection (§5.7)
+    d = calc_deflection_batch(L, Ix_gross, Ix_net, E, w_dead, w_live, n_openings)
+    
+    return {
+        'Vh': Vh, 'Vn_h_design': Vn_h_design, 'ratio_h': ratio_h,
+        'Cv': Cv, 'Vn_v_design': Vn_v_design, 'ratio_v': ratio_v,
+        'delta': d['delta'], 'delta_live': d['delta_live'],
+        'ratio_total': d['ratio_total'], 'ratio_live': d['ratio_live'],
+        'ok': (ratio_h <= 1.0) & (ratio_v <= 1.0) & d['ok']
     }
 
 
+def _live_span_ratio(L: float, delta_live: float):
+    """Truncated L/δL for display, or 'inf' when there is no live deflection."""
+    return int(L / delta_live) if delta_live > 0 else 'inf'
+
+
+def _live_deflection_note(ratio_live: float, L: float, delta_live: float) -> str:
+    """Notes text of the live load deflection check, built when rendered."""
+    return f"{'✓ OK' if ratio_live <= 1.0 else '✗ NG'} - δL = L/{_live_span_ratio(L, delta_live)}"
+
+
 def calc_deflection_detailed(
     L: float, dg: float,
     Ix_gross: float, Ix_net: float,
     E: float,
     w_dead: float, w_live: float,
-    n_openings: int = 10
-) -> DetailedCalcSection:
+    n_openings: int = 10,
+    verbose: bool = True
+) -> Tuple[DetailedCalcSection, DeflectionResult]:
     """
     Detailed deflection calculation per AISC DG31 §5.7.
+    
+    With verbose=False the steps go to a null sink (no DetailedCalcStep
+    objects are built) and the conclusion text is skipped.
     """
     section = DetailedCalcSection(
         section_number=7,
@@ -1935,26 +3070,43 @@ def calc_deflection_detailed(
         code_ref="AISC DG31 §5.7"
     )
     
-    steps = []
-    step_num = 0
+    # Nothing to evaluate without load or stiffness: skip the deflection math
+    if E <= 0 or Ix_gross + Ix_net <= 0 or w_dead + w_live <= 0:
+        _mark_not_applicable(section, f"E = {E} MPa, Ix,gross + Ix,net = {Ix_gross + Ix_net:.0f} mm⁴, "
+                                      f"w = {w_dead + w_live} kN/m (no deflection to check)")
+        return section, DeflectionResult(
+            Ix_eff=0.0, alpha=1.0 + 0.015 * n_openings,
+            delta=0.0, delta_live=0.0,
+            delta_limit_total=L / 240, delta_limit_live=L / 360,
+            ratio_total=0.0, ratio_live=0.0
+        )
+    
+    c = _deflection_core(L, Ix_gross, Ix_net, E, w_dead, w_live, n_openings)
+    w_total = w_service = c['w_total']  # kN/m
+    Ix_avg, alpha, Ix_eff, delta = c['Ix_avg'], c['alpha'], c['Ix_eff'], c['delta']
+    delta_limit_total, delta_limit_live = c['delta_limit_total'], c['delta_limit_live']
+    delta_live, ratio_total, ratio_live, status = c['delta_live'], c['ratio_total'], c['ratio_live'], c['status']
+    
+    # Stiffnesses in 10⁶ mm⁴ and span/deflection ratios, shown in both the
+    # steps and the summary
+    Ix_gross_e6, Ix_net_e6, Ix_eff_e6 = Ix_gross / 1e6, Ix_net / 1e6, Ix_eff / 1e6
+    span_ratio = L / delta
+    
+    buf = _StepBuf(9) if verbose else _NULL_STEPS
     
     # =========================================================================
     # 1. LOADING
     # =========================================================================
-    w_total = w_dead + w_live
-    w_service = w_total  # kN/m
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Service Load",
         description="The total service load for deflection calculation (unfactored).",
         equation="w = wD + wL",
-        substitution=f"w = {w_dead} + {w_live}",
+        substitution=("w = {} + {}", (w_dead, w_live)),
         result=w_service,
         unit="kN/m",
         code_ref="Service Load Combination"
-    ))
+    )
     
     # =========================================================================
     # 2. EFFECTIVE MOMENT OF INERTIA
@@ -1966,37 +3118,28 @@ def calc_deflection_detailed(
     # where k is a factor depending on opening geometry
     # Simplified approach: use ratio of opening length to spacing
     
-    Ix_avg = (Ix_gross + Ix_net) / 2
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Average Moment of Inertia",
         description="Calculate an average moment of inertia considering both solid and open sections.",
         equation="Ix,avg = (Ix,gross + Ix,net) / 2",
-        substitution=f"Ix,avg = ({Ix_gross/1e6:.2f}×10⁶ + {Ix_net/1e6:.2f}×10⁶) / 2",
+        substitution=("Ix,avg = ({:.2f}×10⁶ + {:.2f}×10⁶) / 2", (Ix_gross_e6, Ix_net_e6)),
         result=Ix_avg,
         unit="mm⁴",
         code_ref="AISC DG31 §5.7.1"
-    ))
+    )
     
     # Effective Ix considering additional shear deformation at openings
     # Use reduction factor based on number of openings
-    alpha = 1.0 + 0.015 * n_openings  # Deflection increase factor
-    Ix_eff = Ix_avg / alpha
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Effective Moment of Inertia",
         description="Apply a reduction to account for additional shear deformation at openings. "
                    "The factor increases with the number of openings.",
         equation="Ix,eff = Ix,avg / α where α = 1 + 0.015 × n_openings",
-        substitution=f"Ix,eff = {Ix_avg/1e6:.2f}×10⁶ / {alpha:.3f}",
+        substitution=("Ix,eff = {:.2f}×10⁶ / {:.3f}", (Ix_avg/1e6, alpha)),
         result=Ix_eff,
         unit="mm⁴",
         code_ref="AISC DG31 §5.7.2"
-    ))
+    )
     
     # =========================================================================
     # 3. CALCULATED DEFLECTION
@@ -2005,131 +3148,136 @@ def calc_deflection_detailed(
     # δ = 5wL⁴ / (384EI)
     # Units: w in kN/m = N/mm (numerically), L in mm, E in MPa = N/mm², I in mm⁴
     # Result in mm
-    delta = 5 * w_service * (L**4) / (384 * E * Ix_eff)  # mm
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Calculated Deflection",
         description="Calculate the maximum deflection at midspan for a uniformly loaded simple span. "
                    "Note: 1 kN/m = 1 N/mm numerically, so units work directly.",
         equation="δ = 5wL⁴ / (384EI)",
-        substitution=f"δ = 5 × {w_service:.2f} × ({L:.0f})⁴ / (384 × {E} × {Ix_eff/1e6:.2f}×10⁶)",
+        substitution=("δ = 5 × {:.2f} × ({:.0f})⁴ / (384 × {} × {:.2f}×10⁶)", (w_service, L, E, Ix_eff_e6)),
         result=delta,
         unit="mm",
         code_ref="AISC DG31 §5.7.3"
-    ))
+    )
     
     # =========================================================================
     # 4. DEFLECTION LIMITS
     # =========================================================================
     # L/240 for total load, L/360 for live load
-    delta_limit_total = L / 240
-    delta_limit_live = L / 360
-    delta_live = delta * w_live / w_total if w_total > 0 else 0
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Deflection Limit (Total Load)",
         description="The allowable deflection limit for total load is typically L/240.",
         equation="δ_allow = L / 240",
-        substitution=f"δ_allow = {L:.0f} / 240",
+        substitution=("δ_allow = {:.0f} / 240", (L,)),
         result=delta_limit_total,
         unit="mm",
         code_ref="IBC Table 1604.3"
-    ))
+    )
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Deflection Limit (Live Load)",
         description="The allowable deflection limit for live load is typically L/360.",
         equation="δ_allow = L / 360",
-        substitution=f"δ_allow = {L:.0f} / 360",
+        substitution=("δ_allow = {:.0f} / 360", (L,)),
         result=delta_limit_live,
         unit="mm",
         code_ref="IBC Table 1604.3"
-    ))
+    )
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Live Load Deflection",
         description="Calculate the deflection due to live load only.",
         equation="δL = δ_total × wL / (wD + wL)",
-        substitution=f"δL = {delta:.2f} × {w_live} / {w_total}",
+        substitution=("δL = {:.2f} × {} / {}", (delta, w_live, w_total)),
         result=delta_live,
         unit="mm",
         code_ref="Proportional to loads"
-    ))
+    )
     
     # =========================================================================
     # 5. DEFLECTION CHECKS
     # =========================================================================
-    ratio_total = delta / delta_limit_total
-    ratio_live = delta_live / delta_limit_live
-    status = "PASS" if ratio_total <= 1.0 and ratio_live <= 1.0 else "FAIL"
-    
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Total Load Deflection Check",
         description="Compare calculated total load deflection to the L/240 limit.",
         equation="δ / (L/240) ≤ 1.0",
-        substitution=f"{delta:.2f} / {delta_limit_total:.2f}",
+        substitution=("{:.2f} / {:.2f}", (delta, delta_limit_total)),
         result=ratio_total,
         unit="-",
         code_ref="IBC 1604.3",
         status="PASS" if ratio_total <= 1.0 else "FAIL",
-        notes=f"{'✓ OK' if ratio_total <= 1.0 else '✗ NG'} - δ = L/{L/delta:.0f}"
-    ))
+        notes=f"{'✓ OK' if ratio_total <= 1.0 else '✗ NG'} - δ = L/{span_ratio:.0f}"
+    )
     
-    step_num += 1
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
+    buf.emit(
         title="Live Load Deflection Check",
         description="Compare calculated live load deflection to the L/360 limit.",
         equation="δL / (L/360) ≤ 1.0",
-        substitution=f"{delta_live:.2f} / {delta_limit_live:.2f}",
+        substitution=("{:.2f} / {:.2f}", (delta_live, delta_limit_live)),
         result=ratio_live,
         unit="-",
         code_ref="IBC 1604.3",
         status="PASS" if ratio_live <= 1.0 else "FAIL",
-        notes=f"{'✓ OK' if ratio_live <= 1.0 else '✗ NG'} - δL = L/{int(L/delta_live) if delta_live > 0 else 'inf'}"
-    ))
+        notes=(_live_deflection_note, (ratio_live, L, delta_live))
+    )
     
-    section.steps = steps
+    section.set_rows(buf.to_rows())
     section.status = status
-    section.conclusion = f"""
-DEFLECTION SUMMARY:
-══════════════════════════════════════════════════════════════════════════════
-STIFFNESS:
-  Gross Ix:                     {Ix_gross/1e6:.2f} × 10⁶ mm⁴
-  Net Ix (at opening):          {Ix_net/1e6:.2f} × 10⁶ mm⁴
-  Effective Ix:                 {Ix_eff/1e6:.2f} × 10⁶ mm⁴
-  Reduction factor (α):         {alpha:.3f}
-──────────────────────────────────────────────────────────────────────────────
-CALCULATED DEFLECTIONS:
-  Total load deflection:        {delta:.2f} mm = L/{L/delta:.0f}
-  Live load deflection:         {delta_live:.2f} mm = L/{int(L/delta_live) if delta_live > 0 else 'inf'}
-──────────────────────────────────────────────────────────────────────────────
-LIMITS:
-  Total (L/240):                {delta_limit_total:.2f} mm
-  Live (L/360):                 {delta_limit_live:.2f} mm
-──────────────────────────────────────────────────────────────────────────────
-CHECKS:
-  Total D/C:                    {ratio_total:.3f} {'✓ OK' if ratio_total <= 1.0 else '✗ NG'}
-  Live D/C:                     {ratio_live:.3f} {'✓ OK' if ratio_live <= 1.0 else '✗ NG'}
-  Overall Status:               {status}
-══════════════════════════════════════════════════════════════════════════════
-"""
+    if buf.wants_conclusion:
+        total_mark = '✓ OK' if ratio_total <= 1.0 else '✗ NG'
+        live_mark = '✓ OK' if ratio_live <= 1.0 else '✗ NG'
+        section.conclusion = _DEFLECTION_CONCLUSION(locals())
+    
+    return section, DeflectionResult(
+        Ix_eff, alpha, delta, delta_live,
+        delta_limit_total, delta_limit_live, ratio_total, ratio_live
+    )
+
+
+def calc_design_demands_batch(
+    w_dead: np.ndarray, w_live: np.ndarray, L: np.ndarray,
+    bf: np.ndarray, tf: np.ndarray,
+    Fy: np.ndarray, E: float,
+    method: str = "LRFD"
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized design demands and flange compactness for many candidate
+    designs at once, e.g. a sweep over parent sections and spans ahead of
+    the detailed report for the chosen ones.
     
-    return section, {
-        'Ix_eff': Ix_eff, 'alpha': alpha,
-        'delta': delta, 'delta_live': delta_live,
-        'delta_limit_total': delta_limit_total, 'delta_limit_live': delta_limit_live,
-        'ratio_total': ratio_total, 'ratio_live': ratio_live
+    Same arithmetic as the load calculations of design_castellated_detailed
+    (simply supported, uniform load) and the flange limit of the global
+    flexure check, evaluated with NumPy with no calculation steps. Inputs
+    broadcast against each other.
+    
+    Args:
+        w_dead, w_live: Service loads (kN/m)
+        L: Span (mm)
+        bf, tf: Flange width and thickness (mm)
+        Fy, E: Material properties (MPa)
+        method: "LRFD" or "ASD"
+        
+    Returns:
+        Dict of arrays: w_u (kN/m), Mu (kN·m), Vu, Vh (kN), lambda_f,
+        lambda_pf, flange_compact
+    """
+    w_dead = np.asarray(w_dead, dtype=np.float64)
+    w_live = np.asarray(w_live, dtype=np.float64)
+    L_m = np.asarray(L, dtype=np.float64) / 1000  # m
+    
+    # Factored loads for strength design
+    w_u = _FACTORED_LOAD[Method.coerce(method)](w_dead, w_live)
+    
+    Mu = w_u * L_m**2 / 8
+    Vu = w_u * L_m / 2
+    Vh = Vu * 0.15  # Web post horizontal shear, as in the detailed design
+    
+    lambda_f = np.asarray(bf, dtype=np.float64) / (2 * np.asarray(tf, dtype=np.float64))
+    lambda_pf = 0.38 * np.sqrt(E / np.asarray(Fy, dtype=np.float64))
+    
+    return {
+        'w_u': w_u, 'Mu': Mu, 'Vu': Vu, 'Vh': Vh,
+        'lambda_f': lambda_f, 'lambda_pf': lambda_pf,
+        'flange_compact': lambda_f <= lambda_pf
     }
 
 
@@ -2137,6 +3285,29 @@ CHECKS:
 # MAIN DETAILED DESIGN FUNCTION
 # =============================================================================
 
+# Overall summary table, filled from design_castellated_detailed's locals
+_DESIGN_SUMMARY = _conclusion_formatter("""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║           CASTELLATED/CELLULAR BEAM DESIGN SUMMARY                           ║
+║                    Per AISC Design Guide 31                                  ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║ Beam: {designation:<60} ║
+║ Method: {method:<68} ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║ CHECK                          │ DEMAND    │ CAPACITY  │ D/C   │ STATUS     ║
+╠────────────────────────────────┼───────────┼───────────┼───────┼────────────╣
+║ Global Flexure (§5.2)          │ {Mu:>7.1f}   │ {Mn_design:>7.1f}   │ {flex_ratio:>5.3f} │ {flex_status:<10} ║
+║ Vierendeel Bending (§5.3)      │ {Mvr_total:>7.3f}   │ {Mn_vr_design:>7.3f}   │ {vier_ratio:>5.3f} │ {vier_status:<10} ║
+║ Web Post Buckling (§5.4)       │ {Vh:>7.1f}   │ {Pn_design:>7.1f}   │ {wp_ratio:>5.3f} │ {wp_status:<10} ║
+║ Horizontal Shear (§5.5)        │ {Vh_h:>7.1f}   │ {Vn_h_design:>7.1f}   │ {h_ratio:>5.3f} │ {h_status:<10} ║
+║ Vertical Shear (§5.6)          │ {Vu:>7.1f}   │ {Vn_v_design:>7.1f}   │ {v_ratio:>5.3f} │ {v_status:<10} ║
+║ Deflection (§5.7)              │ {delta:>7.1f}   │ {delta_limit:>7.1f}   │ {defl_ratio:>5.3f} │ {defl_status:<10} ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║ OVERALL RESULT: {overall:<62} ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""")
+
+
 def design_castellated_detailed(
     parent_name: str,
     d: float, bf: float, tf: float, tw: float, A: float, Ix: float,
@@ -2146,14 +3317,21 @@ def design_castellated_detailed(
     Fy: float, Fu: float, E: float,
     w_dead: float, w_live: float, L: float,
     Lb: float,
-    method: str = "LRFD"
+    method: str = "LRFD",
+    verbose: bool = True
 ) -> DetailedDesignReport:
     """
     Complete detailed design of castellated/cellular beam.
     
+    With verbose=False every check skips its calculation steps and
+    conclusion text, for sweeps that only need the numeric results and
+    statuses; the sections then have no steps but the summary table is
+    still built.
+    
     Returns:
         DetailedDesignReport with all calculation sections
     """
+    beam_type = BeamType.coerce(beam_type).label
     report = DetailedDesignReport(
         project_info={
             'title': 'Castellated/Cellular Beam Design',
@@ -2169,10 +3347,18 @@ def design_castellated_detailed(
     # =========================================================================
     sec_props_section, props = calc_section_properties_detailed(
         parent_name, d, bf, tf, tw, A, Ix,
-        beam_type, ho, e, b, S, theta, Do
+        beam_type, ho, e, b, S, theta, Do,
+        verbose=verbose
     )
     report.add_section(sec_props_section)
     
+    # Expanded section properties used by the checks below (for cellular
+    # beams the opening height ho is the diameter Do)
+    dg, ho, dt = props['dg'], props['ho'], props['dt']
+    A_tee, I_tee, S_tee, y_bar_tee = props['A_tee'], props['I_tee'], props['S_tee'], props['y_bar_tee']
+    Ix_gross, Sx_gross, Zx_gross = props['Ix_gross'], props['Sx_gross'], props['Zx_gross']
+    Ix_net, b_wp = props['Ix_net'], props['b_wp']
+    
     # =========================================================================
     # 2. LOAD CALCULATIONS
     # =========================================================================
@@ -2181,10 +3367,7 @@ def design_castellated_detailed(
     L_m = L / 1000  # m
     
     # Factored loads for strength design
-    if method == "LRFD":
-        w_u = 1.2 * w_dead + 1.6 * w_live  # kN/m
-    else:
-        w_u = w_dead + w_live  # kN/m
+    w_u = _FACTORED_LOAD[Method.coerce(method)](w_dead, w_live)  # kN/m
     
     # Calculate demands
     # Mu = w × L² / 8 (for simply supported beam with uniform load)
@@ -2196,11 +3379,12 @@ def design_castellated_detailed(
     # =========================================================================
     flexure_section, flex_results = calc_global_flexure_detailed(
         parent_name,
-        props['dg'], bf, tf, tw, props['ho'], props['dt'],
-        props['Ix_gross'], props['Sx_gross'], props['Zx_gross'],
+        dg, bf, tf, tw, ho, dt,
+        Ix_gross, Sx_gross, Zx_gross,
         Fy, E,
         Mu, Lb,
-        method
+        method,
+        verbose=verbose
     )
     report.add_section(flexure_section)
     
@@ -2209,12 +3393,13 @@ def design_castellated_detailed(
     # =========================================================================
     vierendeel_section, vier_results = calc_vierendeel_bending_detailed(
         parent_name,
-        props['dg'], props['ho'], props['dt'], bf, tf, tw,
-        props['A_tee'], props['I_tee'], props['S_tee'], props['y_bar_tee'],
+        dg, ho, dt, bf, tf, tw,
+        A_tee, I_tee, S_tee, y_bar_tee,
         beam_type, e, Do,
         Fy, E,
         Vu,  # kN
-        method
+        method,
+        verbose=verbose
     )
     report.add_section(vierendeel_section)
     
@@ -2226,23 +3411,27 @@ def design_castellated_detailed(
     
     wp_section, wp_results = calc_web_post_buckling_detailed(
         parent_name,
-        props['ho'], props['b_wp'], tw,
+        ho, b_wp, tw,
         beam_type, S, Do, theta,
         Fy, E,
         Vh,
-        method
+        method,
+        verbose=verbose
     )
     report.add_section(wp_section)
     
     # =========================================================================
     # 6. HORIZONTAL SHEAR
     # =========================================================================
+    grade = _steel_grade(Fy, E)  # Shared material constants for both shear checks
     horiz_section, horiz_results = calc_horizontal_shear_detailed(
-        props['dg'], props['ho'], props['dt'], tw,
-        props['Ix_gross'], props['Ix_net'],
+        dg, ho, dt, tw,
+        Ix_gross, Ix_net,
         Mu, S,
         Fy, E,
-        method
+        method,
+        verbose=verbose,
+        grade=grade
     )
     report.add_section(horiz_section)
     
@@ -2250,11 +3439,13 @@ def design_castellated_detailed(
     # 7. VERTICAL SHEAR
     # =========================================================================
     vert_section, vert_results = calc_vertical_shear_detailed(
-        props['dg'], props['ho'], props['dt'], bf, tf, tw,
-        props['A_tee'],
+        dg, ho, dt, bf, tf, tw,
+        A_tee,
         Fy, E,
         Vu,  # kN
-        method
+        method,
+        verbose=verbose,
+        grade=grade
     )
     report.add_section(vert_section)
     
@@ -2263,91 +3454,121 @@ def design_castellated_detailed(
     # =========================================================================
     n_openings = int(L / S) if S > 0 else 10
     defl_section, defl_results = calc_deflection_detailed(
-        L, props['dg'],
-        props['Ix_gross'], props['Ix_net'],
+        L, dg,
+        Ix_gross, Ix_net,
         E,
         w_dead, w_live,  # kN/m
-        n_openings
+        n_openings,
+        verbose=verbose
     )
     report.add_section(defl_section)
     
     # =========================================================================
     # OVERALL SUMMARY
     # =========================================================================
-    report.summary = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║           CASTELLATED/CELLULAR BEAM DESIGN SUMMARY                           ║
-║                    Per AISC Design Guide 31                                  ║
-╠══════════════════════════════════════════════════════════════════════════════╣
-║ Beam: {report.beam_designation[:60]:<60} ║
-║ Method: {method:<68} ║
-╠══════════════════════════════════════════════════════════════════════════════╣
-║ CHECK                          │ DEMAND    │ CAPACITY  │ D/C   │ STATUS     ║
-╠────────────────────────────────┼───────────┼───────────┼───────┼────────────╣
-║ Global Flexure (§5.2)          │ {Mu:>7.1f}   │ {flex_results['Mn_design']:>7.1f}   │ {flex_results['ratio']:>5.3f} │ {flexure_section.status:<10} ║
-║ Vierendeel Bending (§5.3)      │ {vier_results['Mvr_total']:>7.3f}   │ {vier_results['Mn_vr_design']:>7.3f}   │ {vier_results['ratio']:>5.3f} │ {vierendeel_section.status:<10} ║
-║ Web Post Buckling (§5.4)       │ {Vh:>7.1f}   │ {wp_results['Pn_design']:>7.1f}   │ {wp_results['ratio']:>5.3f} │ {wp_section.status:<10} ║
-║ Horizontal Shear (§5.5)        │ {horiz_results['Vh']:>7.1f}   │ {horiz_results['Vn_design']:>7.1f}   │ {horiz_results['ratio']:>5.3f} │ {horiz_section.status:<10} ║
-║ Vertical Shear (§5.6)          │ {Vu:>7.1f}   │ {vert_results['Vn_design']:>7.1f}   │ {vert_results['ratio']:>5.3f} │ {vert_section.status:<10} ║
-║ Deflection (§5.7)              │ {defl_results['delta']:>7.1f}   │ {defl_results['delta_limit_total']:>7.1f}   │ {defl_results['ratio_total']:>5.3f} │ {defl_section.status:<10} ║
-╠══════════════════════════════════════════════════════════════════════════════╣
-║ OVERALL RESULT: {report.overall_status:<62} ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-"""
+    # Pull every value out of the result containers first; each row then
+    # formats plain locals only
+    Mn_design, flex_ratio = flex_results.Mn_design, flex_results.ratio
+    Mvr_total, Mn_vr_design, vier_ratio = (
+        vier_results.Mvr_total, vier_results.Mn_vr_design, vier_results.ratio
+    )
+    Pn_design, wp_ratio = wp_results.Pn_design, wp_results.ratio
+    Vh_h, Vn_h_design, h_ratio = horiz_results.Vh, horiz_results.Vn_design, horiz_results.ratio
+    Vn_v_design, v_ratio = vert_results.Vn_design, vert_results.ratio
+    delta, delta_limit, defl_ratio = (
+        defl_results.delta, defl_results.delta_limit_total, defl_results.ratio_total
+    )
+    designation = report.beam_designation[:60]
+    overall = report.overall_status
+    
+    flex_status, vier_status, wp_status = (
+        flexure_section.status, vierendeel_section.status, wp_section.status
+    )
+    h_status, v_status, defl_status = (
+        horiz_section.status, vert_section.status, defl_section.status
+    )
+    report.summary = _DESIGN_SUMMARY(locals())
     
     return report
 
 
-def format_detailed_report(report: DetailedDesignReport) -> str:
+_STEP_MARKERS = {"PASS": " ✓", "FAIL": " ✗", "WARNING": " ⚠"}
+
+# One report block per section header and per step; a step block ends in
+# a newline so the join leaves a blank line after it
+_SECTION_HEADER = """
+{rule}
+SECTION {number}: {title}
+Reference: {code_ref}
+{dash}
+{description}
+{dash}
+"""
+
+_STEP_BLOCK = """Step {number}: {title}{marker}
+  {description}
+  Equation: {equation}
+  Calculation: {substitution}
+  Result: {result:.4g} {unit}
+  Reference: {code_ref}
+{note}"""
+
+
+def _iter_report_chunks(report: DetailedDesignReport) -> Iterator[str]:
     """
-    Format the detailed design report as a complete text document.
+    Yield the text of the detailed report in order, one line or block at a
+    time, so that it can be joined or written out without building the
+    full list of pieces first.
     """
-    output = []
-    
-    # Title
-    output.append("=" * 80)
-    output.append(f"  {report.project_info.get('title', 'DESIGN REPORT')}")
-    output.append(f"  Code: {report.project_info.get('code', 'AISC DG31')}")
-    output.append(f"  Generated by: {report.project_info.get('designer', 'CompositeBeam Pro')}")
-    output.append("=" * 80)
-    output.append("")
-    output.append(f"BEAM: {report.beam_designation}")
-    output.append(f"TYPE: {report.beam_type}")
-    output.append("")
+    rule, dash = "=" * 80, "-" * 80
+    info = report.project_info
+    yield rule
+    yield f"  {info.get('title', 'DESIGN REPORT')}"
+    yield f"  Code: {info.get('code', 'AISC DG31')}"
+    yield f"  Generated by: {info.get('designer', 'CompositeBeam Pro')}"
+    yield rule
+    yield ""
+    yield f"BEAM: {report.beam_designation}"
+    yield f"TYPE: {report.beam_type}"
+    yield ""
     
     # Each section
     for section in report.sections:
-        output.append("")
-        output.append("=" * 80)
-        output.append(f"SECTION {section.section_number}: {section.title}")
-        output.append(f"Reference: {section.code_ref}")
-        output.append("-" * 80)
-        output.append(section.description)
-        output.append("-" * 80)
-        output.append("")
-        
-        for step in section.steps:
-            status_marker = ""
-            if step.status == "PASS":
-                status_marker = " ✓"
-            elif step.status == "FAIL":
-                status_marker = " ✗"
-            elif step.status == "WARNING":
-                status_marker = " ⚠"
-            
-            output.append(f"Step {step.step_number}: {step.title}{status_marker}")
-            output.append(f"  {step.description}")
-            output.append(f"  Equation: {step.equation}")
-            output.append(f"  Calculation: {step.substitution}")
-            output.append(f"  Result: {step.result:.4g} {step.unit}")
-            output.append(f"  Reference: {step.code_ref}")
-            if step.notes:
-                output.append(f"  Note: {step.notes}")
-            output.append("")
-        
-        output.append(section.conclusion)
+        yield _SECTION_HEADER.format(
+            rule=rule, dash=dash, number=section.section_number, title=section.title,
+            code_ref=section.code_ref, description=section.description
+        )
+        for (number, title, description, equation, substitution,
+             result, unit, code_ref, status, notes) in zip(*section._columns()):
+            yield _STEP_BLOCK.format(
+                number=number, title=title,
+                marker=_STEP_MARKERS.get(status, ""),
+                description=description, equation=equation,
+                substitution=_render_substitution(substitution),
+                result=result, unit=unit, code_ref=code_ref,
+                note=f"  Note: {_render_notes(notes)}\n" if notes else ""
+            )
+        yield section.conclusion
     
     # Summary
-    output.append(report.summary)
-    
-    return "\n".join(output)
+    yield report.summary
+
+
+def format_detailed_report(report: DetailedDesignReport) -> str:
+    """
+    Format the detailed design report as a complete text document.
+    """
+    return "\n".join(_iter_report_chunks(report))
+
+
+def write_detailed_report(report: DetailedDesignReport, fp: TextIO) -> None:
+    """
+    Write the detailed design report to an open text file (or StringIO),
+    streaming it section by section. The text is the same as
+    format_detailed_report(report).
+    """
+    chunks = _iter_report_chunks(report)
+    fp.write(next(chunks))
+    for chunk in chunks:
+        fp.write("\n")
+        fp.write(chunk)
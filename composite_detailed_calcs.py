@@ -17,33 +17,55 @@ Author: CompositeBeam Pro
 Version: 2.9
 """
 
-import math
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from math import sqrt
+import numpy as np
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+try:
+    from ._calc_common import INV_MM_TO_M, N_TO_KN, load_numba, njit, numba_prange
+except ImportError:
+    from _calc_common import INV_MM_TO_M, N_TO_KN, load_numba, njit, numba_prange
+
+NUMBA_AVAILABLE = load_numba() is not None
+prange = numba_prange()
 
 
 # =============================================================================
 # DATA CLASSES FOR DETAILED CALCULATIONS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DetailedCalcStep:
     """
     A single calculation step with full professional documentation.
+    
+    The report builders construct steps positionally, in field order. The
+    substitution is either text or a (template, args) pair formatted on
+    first render, so steps that are never displayed skip the formatting.
     """
     step_number: int
     title: str
     description: str
     equation: str
-    substitution: str
+    substitution: Union[str, Tuple[str, tuple]]
     result: float
     unit: str
     code_ref: str
     status: str = "INFO"  # INFO, PASS, FAIL, WARNING
     notes: str = ""
 
+    @property
+    def rendered_substitution(self) -> str:
+        """Substitution text, formatting a deferred (template, args) pair once."""
+        sub = self.substitution
+        if isinstance(sub, tuple):
+            sub = self.substitution = sub[0].format(*sub[1])
+        return sub
+
 
-@dataclass
+@dataclass(slots=True)
 class DetailedCalcSection:
     """
     A section of calculations (e.g., "Section Properties", "Flexural Strength")
@@ -57,7 +79,7 @@ class DetailedCalcSection:
     status: str = "PASS"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompositeDesignReport:
     """
     Complete detailed design report for a composite beam.
@@ -78,11 +100,62 @@ class CompositeDesignReport:
 # SECTION 1: STEEL SECTION PROPERTIES
 # =============================================================================
 
+# Compactness classes indexed by the class codes of _classify_compactness
+_COMPACTNESS_CLASSES = ("Compact", "Noncompact", "Slender")
+_COMPACTNESS_STATUS = ("PASS", "WARNING", "FAIL")
+
+
+@lru_cache(maxsize=32)
+def _compactness_limits(Fy: float, E: float) -> Tuple[float, float, float, float]:
+    """
+    Flange and web compactness limits for a material grade, cached per
+    (Fy, E) since they depend only on the material.
+    
+    Returns:
+        (λpf, λrf, λpw, λrw) = (0.38, 1.0, 3.76, 5.70) × √(E/Fy)
+    """
+    # √(E/Fy) is shared by all four compactness limits
+    sqrt_E_Fy = sqrt(E / Fy)
+    return 0.38 * sqrt_E_Fy, sqrt_E_Fy, 3.76 * sqrt_E_Fy, 5.70 * sqrt_E_Fy
+
+
+@njit(cache=True)
+def _classify_compactness(bf, tf, d, tw, lambda_pf, lambda_rf, lambda_pw, lambda_rw):
+    """
+    Pure-arithmetic flange and web compactness per AISC 360-16 Table
+    B4.1b (Cases 10 and 15), JIT-compiled when numba is available. The
+    limits come in precomputed from _compactness_limits and the classes
+    come back as codes indexing _COMPACTNESS_CLASSES.
+    
+    Returns:
+        (lambda_f, h, lambda_w, flange_code, web_code)
+    """
+    lambda_f = bf / (2 * tf)
+    if lambda_f <= lambda_pf:
+        flange_code = 0
+    elif lambda_f <= lambda_rf:
+        flange_code = 1
+    else:
+        flange_code = 2
+    
+    h = d - 2 * tf
+    lambda_w = h / tw
+    if lambda_w <= lambda_pw:
+        web_code = 0
+    elif lambda_w <= lambda_rw:
+        web_code = 1
+    else:
+        web_code = 2
+    
+    return lambda_f, h, lambda_w, flange_code, web_code
+
+
 def calc_steel_section_properties_detailed(
     section_name: str,
     d: float, bf: float, tf: float, tw: float,
     A: float, Ix: float, Sx: float, Zx: float,
-    Fy: float, E: float
+    Fy: float, E: float,
+    verbose: bool = True
 ) -> DetailedCalcSection:
     """
     Calculate and document steel section properties.
@@ -98,6 +171,8 @@ def calc_steel_section_properties_detailed(
         Zx: Plastic section modulus (mm^3)
         Fy: Yield stress (MPa)
         E: Modulus of elasticity (MPa)
+        verbose: If False, skip the calculation steps and return the
+                 classification with the conclusion only
     """
     section = DetailedCalcSection(
         section_number=1,
@@ -105,186 +180,166 @@ def calc_steel_section_properties_detailed(
         description="Document the properties of the steel section per AISC 360-16.",
         code_ref="AISC 360-16 Table 1-1"
     )
+    lambda_pf, lambda_rf, lambda_pw, lambda_rw = _compactness_limits(Fy, E)
+    lambda_f, h, lambda_w, flange_code, web_code = _classify_compactness(
+        float(bf), float(tf), float(d), float(tw), lambda_pf, lambda_rf, lambda_pw, lambda_rw
+    )
+    # Class codes are ordered, so the most restrictive element has the
+    # highest code
+    overall_code = max(flange_code, web_code)
+    overall_class = _COMPACTNESS_CLASSES[overall_code]
+    overall_status = _COMPACTNESS_STATUS[overall_code]
+    
+    section.conclusion = f"Steel section {section_name} is {overall_class}. All properties documented for composite design."
+    section.status = overall_status
+    if not verbose:
+        return section
+    
     steps = []
     step_num = 1
     
     # Step 1: Section identification
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Steel Section",
-        description=f"Selected steel section: {section_name}",
-        equation="Section from AISC Manual Table 1-1",
-        substitution=f"Section = {section_name}",
-        result=d,
-        unit="mm (depth)",
-        code_ref="AISC 360-16 Table 1-1"
+        step_num,
+        "Steel Section",
+        f"Selected steel section: {section_name}",
+        "Section from AISC Manual Table 1-1",
+        f"Section = {section_name}",
+        d,
+        "mm (depth)",
+        "AISC 360-16 Table 1-1"
     ))
     step_num += 1
     
     # Step 2: Section dimensions
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Section Dimensions",
-        description="Record the key geometric properties of the selected section.",
-        equation="d, bf, tf, tw from section tables",
-        substitution=f"d = {d:.1f} mm, bf = {bf:.1f} mm, tf = {tf:.1f} mm, tw = {tw:.1f} mm",
-        result=d,
-        unit="mm",
-        code_ref="AISC Manual Table 1-1"
+        step_num,
+        "Section Dimensions",
+        "Record the key geometric properties of the selected section.",
+        "d, bf, tf, tw from section tables",
+        f"d = {d:.1f} mm, bf = {bf:.1f} mm, tf = {tf:.1f} mm, tw = {tw:.1f} mm",
+        d,
+        "mm",
+        "AISC Manual Table 1-1"
     ))
     step_num += 1
     
     # Step 3: Cross-sectional area
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Cross-Sectional Area",
-        description="Total cross-sectional area of the steel section.",
-        equation="A = As (from section tables)",
-        substitution=f"As = {A:.0f} mm²",
-        result=A,
-        unit="mm²",
-        code_ref="AISC Manual Table 1-1"
+        step_num,
+        "Cross-Sectional Area",
+        "Total cross-sectional area of the steel section.",
+        "A = As (from section tables)",
+        f"As = {A:.0f} mm²",
+        A,
+        "mm²",
+        "AISC Manual Table 1-1"
     ))
     step_num += 1
     
     # Step 4: Moment of inertia
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Moment of Inertia (Strong Axis)",
-        description="Second moment of area about the strong (x-x) axis.",
-        equation="Ix from section tables",
-        substitution=f"Ix = {Ix/1e6:.2f}×10⁶ mm⁴",
-        result=Ix,
-        unit="mm⁴",
-        code_ref="AISC Manual Table 1-1"
+        step_num,
+        "Moment of Inertia (Strong Axis)",
+        "Second moment of area about the strong (x-x) axis.",
+        "Ix from section tables",
+        f"Ix = {Ix/1e6:.2f}×10⁶ mm⁴",
+        Ix,
+        "mm⁴",
+        "AISC Manual Table 1-1"
     ))
     step_num += 1
     
     # Step 5: Elastic section modulus
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Elastic Section Modulus",
-        description="Section modulus for elastic bending stress calculations.",
-        equation="Sx = Ix / (d/2)",
-        substitution=f"Sx = {Sx/1e3:.2f}×10³ mm³",
-        result=Sx,
-        unit="mm³",
-        code_ref="AISC Manual Table 1-1"
+        step_num,
+        "Elastic Section Modulus",
+        "Section modulus for elastic bending stress calculations.",
+        "Sx = Ix / (d/2)",
+        f"Sx = {Sx/1e3:.2f}×10³ mm³",
+        Sx,
+        "mm³",
+        "AISC Manual Table 1-1"
     ))
     step_num += 1
     
     # Step 6: Plastic section modulus
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Plastic Section Modulus",
-        description="Plastic section modulus for full plastification of the cross-section.",
-        equation="Zx from section tables",
-        substitution=f"Zx = {Zx/1e3:.2f}×10³ mm³",
-        result=Zx,
-        unit="mm³",
-        code_ref="AISC Manual Table 1-1"
+        step_num,
+        "Plastic Section Modulus",
+        "Plastic section modulus for full plastification of the cross-section.",
+        "Zx from section tables",
+        f"Zx = {Zx/1e3:.2f}×10³ mm³",
+        Zx,
+        "mm³",
+        "AISC Manual Table 1-1"
     ))
     step_num += 1
     
     # Step 7: Material properties
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Material Properties",
-        description="Steel yield strength and modulus of elasticity.",
-        equation="Fy, E from material specification",
-        substitution=f"Fy = {Fy:.0f} MPa, E = {E:.0f} MPa",
-        result=Fy,
-        unit="MPa",
-        code_ref="AISC 360-16 Table A3.1"
+        step_num,
+        "Material Properties",
+        "Steel yield strength and modulus of elasticity.",
+        "Fy, E from material specification",
+        f"Fy = {Fy:.0f} MPa, E = {E:.0f} MPa",
+        Fy,
+        "MPa",
+        "AISC 360-16 Table A3.1"
     ))
     step_num += 1
     
     # Step 8: Flange classification
-    lambda_f = bf / (2 * tf)
-    lambda_pf = 0.38 * math.sqrt(E / Fy)
-    lambda_rf = 1.0 * math.sqrt(E / Fy)
-    
-    if lambda_f <= lambda_pf:
-        flange_class = "Compact"
-        flange_status = "PASS"
-    elif lambda_f <= lambda_rf:
-        flange_class = "Noncompact"
-        flange_status = "WARNING"
-    else:
-        flange_class = "Slender"
-        flange_status = "FAIL"
+    flange_class = _COMPACTNESS_CLASSES[flange_code]
+    flange_status = _COMPACTNESS_STATUS[flange_code]
     
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Flange Compactness (Flexure)",
-        description="Check flange width-to-thickness ratio for local buckling per Table B4.1b Case 10.",
-        equation="λf = bf/(2×tf) ≤ λpf = 0.38√(E/Fy)",
-        substitution=f"λf = {bf:.1f}/(2×{tf:.1f}) = {lambda_f:.2f} vs λpf = 0.38×√({E}/{Fy}) = {lambda_pf:.2f}",
-        result=lambda_f,
-        unit="",
-        code_ref="AISC 360-16 Table B4.1b",
-        status=flange_status,
-        notes=f"Flange is {flange_class}"
+        step_num,
+        "Flange Compactness (Flexure)",
+        "Check flange width-to-thickness ratio for local buckling per Table B4.1b Case 10.",
+        "λf = bf/(2×tf) ≤ λpf = 0.38√(E/Fy)",
+        f"λf = {bf:.1f}/(2×{tf:.1f}) = {lambda_f:.2f} vs λpf = 0.38×√({E}/{Fy}) = {lambda_pf:.2f}",
+        lambda_f,
+        "",
+        "AISC 360-16 Table B4.1b",
+        flange_status,
+        f"Flange is {flange_class}"
     ))
     step_num += 1
     
     # Step 9: Web classification
-    h = d - 2 * tf
-    lambda_w = h / tw
-    lambda_pw = 3.76 * math.sqrt(E / Fy)
-    lambda_rw = 5.70 * math.sqrt(E / Fy)
-    
-    if lambda_w <= lambda_pw:
-        web_class = "Compact"
-        web_status = "PASS"
-    elif lambda_w <= lambda_rw:
-        web_class = "Noncompact"
-        web_status = "WARNING"
-    else:
-        web_class = "Slender"
-        web_status = "FAIL"
+    web_class = _COMPACTNESS_CLASSES[web_code]
+    web_status = _COMPACTNESS_STATUS[web_code]
     
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Web Compactness (Flexure)",
-        description="Check web height-to-thickness ratio for local buckling per Table B4.1b Case 15.",
-        equation="λw = h/tw ≤ λpw = 3.76√(E/Fy)",
-        substitution=f"λw = {h:.1f}/{tw:.1f} = {lambda_w:.2f} vs λpw = 3.76×√({E}/{Fy}) = {lambda_pw:.2f}",
-        result=lambda_w,
-        unit="",
-        code_ref="AISC 360-16 Table B4.1b",
-        status=web_status,
-        notes=f"Web is {web_class}"
+        step_num,
+        "Web Compactness (Flexure)",
+        "Check web height-to-thickness ratio for local buckling per Table B4.1b Case 15.",
+        "λw = h/tw ≤ λpw = 3.76√(E/Fy)",
+        f"λw = {h:.1f}/{tw:.1f} = {lambda_w:.2f} vs λpw = 3.76×√({E}/{Fy}) = {lambda_pw:.2f}",
+        lambda_w,
+        "",
+        "AISC 360-16 Table B4.1b",
+        web_status,
+        f"Web is {web_class}"
     ))
     step_num += 1
     
     # Step 10: Overall classification
-    if flange_class == "Compact" and web_class == "Compact":
-        overall_class = "Compact"
-        overall_status = "PASS"
-    elif flange_class == "Slender" or web_class == "Slender":
-        overall_class = "Slender"
-        overall_status = "FAIL"
-    else:
-        overall_class = "Noncompact"
-        overall_status = "WARNING"
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Overall Section Classification",
-        description="The section is classified based on the most restrictive element (flange or web).",
-        equation="Classification = most restrictive of (flange, web)",
-        substitution=f"Flange: {flange_class}, Web: {web_class}",
-        result=1.0 if overall_class == "Compact" else 0.5,
-        unit="",
-        code_ref="AISC 360-16 §B4",
-        status=overall_status,
-        notes=f"Section is {overall_class}"
+        step_num,
+        "Overall Section Classification",
+        "The section is classified based on the most restrictive element (flange or web).",
+        "Classification = most restrictive of (flange, web)",
+        f"Flange: {flange_class}, Web: {web_class}",
+        1.0 if overall_class == "Compact" else 0.5,
+        "",
+        "AISC 360-16 §B4",
+        overall_status,
+        f"Section is {overall_class}"
     ))
     
     section.steps = steps
-    section.conclusion = f"Steel section {section_name} is {overall_class}. All properties documented for composite design."
-    section.status = overall_status
     
     return section
 
@@ -293,12 +348,40 @@ def calc_steel_section_properties_detailed(
 # SECTION 2: EFFECTIVE CONCRETE SLAB WIDTH
 # =============================================================================
 
+@lru_cache(maxsize=512)
+def _effective_width_values(
+    L: float,
+    spacing: float,
+    edge_distance: float,
+    beam_position: str,
+    overhang: float
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Numeric part of calc_effective_width_detailed, cached per input set
+    since catalog runs revisit the same span and spacing many times.
+    
+    Returns:
+        (b_limit_1, b_limit_2, b_limit_3, b_interior, b_edge, beff); for
+        interior beams b_limit_3 is unused and both sides are equal
+    """
+    b_limit_1 = L / 8
+    b_limit_2 = spacing / 2
+    if beam_position == "Interior":
+        b_each_side = min(b_limit_1, b_limit_2)
+        return b_limit_1, b_limit_2, 0.0, b_each_side, b_each_side, 2 * b_each_side
+    b_limit_3 = edge_distance if edge_distance > 0 else overhang
+    b_interior = min(b_limit_1, b_limit_2)
+    b_edge = min(b_limit_1, b_limit_3)
+    return b_limit_1, b_limit_2, b_limit_3, b_interior, b_edge, b_interior + b_edge
+
+
 def calc_effective_width_detailed(
     L: float,
     spacing: float,
     edge_distance: float,
     beam_position: str,
-    overhang: float = 0
+    overhang: float = 0,
+    verbose: bool = True
 ) -> Tuple[DetailedCalcSection, float]:
     """
     Calculate effective concrete slab width per AISC 360-16 §I3.1a.
@@ -309,143 +392,143 @@ def calc_effective_width_detailed(
         edge_distance: Distance to slab edge for edge beams (mm)
         beam_position: "Interior" or "Edge"
         overhang: Slab overhang beyond edge beam (mm)
+        verbose: If False, skip the calculation steps (the width comes
+                 from the cached numeric part alone)
     
     Returns:
         Tuple of (DetailedCalcSection, effective_width in mm)
     """
+    b_limit_1, b_limit_2, b_limit_3, b_interior, b_edge, beff = _effective_width_values(
+        L, spacing, edge_distance, beam_position, overhang
+    )
+    
     section = DetailedCalcSection(
         section_number=2,
         title="EFFECTIVE CONCRETE SLAB WIDTH",
         description="Determine the effective width of concrete slab acting compositely with the steel beam.",
         code_ref="AISC 360-16 §I3.1a"
     )
+    if not verbose:
+        section.conclusion = f"Effective concrete slab width beff = {beff:.0f} mm"
+        return section, beff
+    
     steps = []
     step_num = 1
     
     # Step 1: Code requirement overview
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Code Requirement",
-        description="The effective width of the concrete slab on each side of the beam centerline shall not exceed the least of the following limits per AISC 360-16 §I3.1a.",
-        equation="beff = Σ(min of limiting values on each side)",
-        substitution="See calculation below for each side",
-        result=0,
-        unit="mm",
-        code_ref="AISC 360-16 §I3.1a"
+        step_num,
+        "Code Requirement",
+        "The effective width of the concrete slab on each side of the beam centerline shall not exceed the least of the following limits per AISC 360-16 §I3.1a.",
+        "beff = Σ(min of limiting values on each side)",
+        "See calculation below for each side",
+        0,
+        "mm",
+        "AISC 360-16 §I3.1a"
     ))
     step_num += 1
     
     # Step 2: Limit 1 - One-eighth of beam span
-    b_limit_1 = L / 8
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Limit 1: Span/8 (Each Side)",
-        description="One-eighth of the beam span, measured from center of beam.",
-        equation="b₁ = L/8",
-        substitution=f"b₁ = {L:.0f}/8 = {b_limit_1:.1f} mm",
-        result=b_limit_1,
-        unit="mm",
-        code_ref="AISC 360-16 §I3.1a(a)"
+        step_num,
+        "Limit 1: Span/8 (Each Side)",
+        "One-eighth of the beam span, measured from center of beam.",
+        "b₁ = L/8",
+        f"b₁ = {L:.0f}/8 = {b_limit_1:.1f} mm",
+        b_limit_1,
+        "mm",
+        "AISC 360-16 §I3.1a(a)"
     ))
     step_num += 1
     
     # Step 3: Limit 2 - Half distance to adjacent beam
-    b_limit_2 = spacing / 2
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Limit 2: Half Spacing to Adjacent Beam",
-        description="One-half the distance to the centerline of the adjacent beam.",
-        equation="b₂ = s/2",
-        substitution=f"b₂ = {spacing:.0f}/2 = {b_limit_2:.1f} mm",
-        result=b_limit_2,
-        unit="mm",
-        code_ref="AISC 360-16 §I3.1a(b)"
+        step_num,
+        "Limit 2: Half Spacing to Adjacent Beam",
+        "One-half the distance to the centerline of the adjacent beam.",
+        "b₂ = s/2",
+        f"b₂ = {spacing:.0f}/2 = {b_limit_2:.1f} mm",
+        b_limit_2,
+        "mm",
+        "AISC 360-16 §I3.1a(b)"
     ))
     step_num += 1
     
     if beam_position == "Interior":
         # Interior beam - symmetric effective width
-        b_each_side = min(b_limit_1, b_limit_2)
-        beff = 2 * b_each_side
+        b_each_side = b_interior
         
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Interior Beam: Each Side",
-            description="For interior beams, the effective width on each side is the minimum of the two limits.",
-            equation="b_side = min(b₁, b₂)",
-            substitution=f"b_side = min({b_limit_1:.1f}, {b_limit_2:.1f}) = {b_each_side:.1f} mm",
-            result=b_each_side,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.1a"
+            step_num,
+            "Interior Beam: Each Side",
+            "For interior beams, the effective width on each side is the minimum of the two limits.",
+            "b_side = min(b₁, b₂)",
+            f"b_side = min({b_limit_1:.1f}, {b_limit_2:.1f}) = {b_each_side:.1f} mm",
+            b_each_side,
+            "mm",
+            "AISC 360-16 §I3.1a"
         ))
         step_num += 1
         
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Total Effective Width",
-            description="Total effective width is twice the effective width per side.",
-            equation="beff = 2 × b_side",
-            substitution=f"beff = 2 × {b_each_side:.1f} = {beff:.1f} mm",
-            result=beff,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.1a"
+            step_num,
+            "Total Effective Width",
+            "Total effective width is twice the effective width per side.",
+            "beff = 2 × b_side",
+            f"beff = 2 × {b_each_side:.1f} = {beff:.1f} mm",
+            beff,
+            "mm",
+            "AISC 360-16 §I3.1a"
         ))
         
     else:  # Edge beam
         # Limit 3 - Distance to slab edge (for edge beams only)
-        b_limit_3 = edge_distance if edge_distance > 0 else overhang
-        
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Limit 3: Distance to Slab Edge",
-            description="The distance to the edge of the slab (for edge beams only).",
-            equation="b₃ = distance to slab edge",
-            substitution=f"b₃ = {b_limit_3:.1f} mm",
-            result=b_limit_3,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.1a(c)"
+            step_num,
+            "Limit 3: Distance to Slab Edge",
+            "The distance to the edge of the slab (for edge beams only).",
+            "b₃ = distance to slab edge",
+            f"b₃ = {b_limit_3:.1f} mm",
+            b_limit_3,
+            "mm",
+            "AISC 360-16 §I3.1a(c)"
         ))
         step_num += 1
         
-        # Interior side
-        b_interior = min(b_limit_1, b_limit_2)
-        # Edge side
-        b_edge = min(b_limit_1, b_limit_3)
-        beff = b_interior + b_edge
-        
+        # Interior side b_interior, edge side b_edge
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Edge Beam: Interior Side",
-            description="Effective width on the interior side (towards adjacent beam).",
-            equation="b_int = min(b₁, b₂)",
-            substitution=f"b_int = min({b_limit_1:.1f}, {b_limit_2:.1f}) = {b_interior:.1f} mm",
-            result=b_interior,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.1a"
+            step_num,
+            "Edge Beam: Interior Side",
+            "Effective width on the interior side (towards adjacent beam).",
+            "b_int = min(b₁, b₂)",
+            f"b_int = min({b_limit_1:.1f}, {b_limit_2:.1f}) = {b_interior:.1f} mm",
+            b_interior,
+            "mm",
+            "AISC 360-16 §I3.1a"
         ))
         step_num += 1
         
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Edge Beam: Edge Side",
-            description="Effective width on the edge side (towards slab edge).",
-            equation="b_edge = min(b₁, b₃)",
-            substitution=f"b_edge = min({b_limit_1:.1f}, {b_limit_3:.1f}) = {b_edge:.1f} mm",
-            result=b_edge,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.1a"
+            step_num,
+            "Edge Beam: Edge Side",
+            "Effective width on the edge side (towards slab edge).",
+            "b_edge = min(b₁, b₃)",
+            f"b_edge = min({b_limit_1:.1f}, {b_limit_3:.1f}) = {b_edge:.1f} mm",
+            b_edge,
+            "mm",
+            "AISC 360-16 §I3.1a"
         ))
         step_num += 1
         
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Total Effective Width",
-            description="Total effective width is the sum of interior and edge sides.",
-            equation="beff = b_int + b_edge",
-            substitution=f"beff = {b_interior:.1f} + {b_edge:.1f} = {beff:.1f} mm",
-            result=beff,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.1a"
+            step_num,
+            "Total Effective Width",
+            "Total effective width is the sum of interior and edge sides.",
+            "beff = b_int + b_edge",
+            f"beff = {b_interior:.1f} + {b_edge:.1f} = {beff:.1f} mm",
+            beff,
+            "mm",
+            "AISC 360-16 §I3.1a"
         ))
     
     section.steps = steps
@@ -459,13 +542,59 @@ def calc_effective_width_detailed(
 # SECTION 3: CONCRETE PROPERTIES
 # =============================================================================
 
+class ConcreteProps(NamedTuple):
+    """Concrete slab properties returned by calc_concrete_properties_detailed."""
+    fc: float       # Compressive strength (MPa)
+    Ec: float       # Modulus of elasticity (MPa)
+    n: float        # Modular ratio Es/Ec
+    beta1: float    # Stress block factor β₁
+    tc: float       # Total slab thickness (mm)
+    hr: float       # Deck rib height (mm)
+    t_above: float  # Concrete above the deck ribs (mm)
+    wr: float       # Average deck rib width (mm)
+    ecu: float      # Ultimate concrete strain
+
+
+@njit(cache=True)
+def _concrete_core(fc, Es=200000.0):
+    """
+    Pure-arithmetic concrete properties per ACI 318-19 (Ec for normal
+    weight concrete, modular ratio and β₁), JIT-compiled when numba is
+    available.
+    
+    Returns:
+        (sqrt_fc, Ec, n, beta1)
+    """
+    sqrt_fc = sqrt(fc)
+    Ec = 4700 * sqrt_fc
+    # The linear branch is clipped to [0.65, 0.85]; ACI steps to 0.65 at
+    # f'c = 55 MPa, just before the line itself reaches it
+    if fc >= 55:
+        beta1 = 0.65
+    else:
+        beta1 = max(0.65, min(0.85, 0.85 - 0.05 * (fc - 28) / 7))
+    return sqrt_fc, Ec, Es / Ec, beta1
+
+
+@lru_cache(maxsize=32)
+def _concrete_modulus(fc: float) -> float:
+    """
+    Ec = 4700√f'c (MPa) for normal weight concrete per ACI 318-19, from
+    _concrete_core and cached per f'c since slabs use a handful of
+    standard strengths.
+    """
+    return _concrete_core(float(fc))[1]
+
+
 def calc_concrete_properties_detailed(
     fc: float,
     tc: float,
     hr: float,
     wr: float,
-    unit_wt: float = 23.5
-) -> Tuple[DetailedCalcSection, Dict]:
+    unit_wt: float = 23.5,
+    verbose: bool = True,
+    Es: float = 200000
+) -> Tuple[DetailedCalcSection, ConcreteProps]:
     """
     Calculate concrete slab properties for composite design.
     
@@ -475,9 +604,12 @@ def calc_concrete_properties_detailed(
         hr: Deck rib height (mm)
         wr: Average deck rib width (mm)
         unit_wt: Concrete unit weight (kN/m³), default 23.5 for normal weight
+        verbose: If False, skip the calculation steps and return the
+                 properties with the conclusion only
+        Es: Steel elastic modulus for the modular ratio (MPa)
     
     Returns:
-        Tuple of (DetailedCalcSection, dict of properties)
+        Tuple of (DetailedCalcSection, ConcreteProps)
     """
     section = DetailedCalcSection(
         section_number=3,
@@ -485,126 +617,255 @@ def calc_concrete_properties_detailed(
         description="Determine the properties of the concrete slab for composite action calculations.",
         code_ref="AISC 360-16 §I1.2, ACI 318-19"
     )
+    sqrt_fc, Ec, n, beta1 = _concrete_core(float(fc), float(Es))
+    t_above = tc - hr
+    ecu = 0.003  # Concrete crushing strain
+    props = ConcreteProps(fc, Ec, n, beta1, tc, hr, t_above, wr, ecu)
+    
+    section.conclusion = f"Concrete f'c = {fc:.0f} MPa, Ec = {Ec:.0f} MPa, n = {n:.2f}, β₁ = {beta1:.3f}"
+    if not verbose:
+        return section, props
+    
     steps = []
     step_num = 1
     
     # Step 1: Concrete strength
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Specified Concrete Strength",
-        description="The specified compressive strength of concrete at 28 days.",
-        equation="f'c = specified strength",
-        substitution=f"f'c = {fc:.1f} MPa",
-        result=fc,
-        unit="MPa",
-        code_ref="ACI 318-19 §19.2.1"
+        step_num,
+        "Specified Concrete Strength",
+        "The specified compressive strength of concrete at 28 days.",
+        "f'c = specified strength",
+        f"f'c = {fc:.1f} MPa",
+        fc,
+        "MPa",
+        "ACI 318-19 §19.2.1"
     ))
     step_num += 1
     
     # Step 2: Modulus of elasticity
     # ACI 318-19 Eq. 19.2.2.1b for normal weight concrete
-    Ec = 4700 * math.sqrt(fc)
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Modulus of Elasticity",
-        description="Concrete modulus of elasticity per ACI 318-19 for normal weight concrete (wc = 2300 kg/m³).",
-        equation="Ec = 4700√f'c (MPa)",
-        substitution=f"Ec = 4700 × √{fc:.1f} = 4700 × {math.sqrt(fc):.3f} = {Ec:.0f} MPa",
-        result=Ec,
-        unit="MPa",
-        code_ref="ACI 318-19 Eq. 19.2.2.1b"
+        step_num,
+        "Modulus of Elasticity",
+        "Concrete modulus of elasticity per ACI 318-19 for normal weight concrete (wc = 2300 kg/m³).",
+        "Ec = 4700√f'c (MPa)",
+        f"Ec = 4700 × √{fc:.1f} = 4700 × {sqrt_fc:.3f} = {Ec:.0f} MPa",
+        Ec,
+        "MPa",
+        "ACI 318-19 Eq. 19.2.2.1b"
     ))
     step_num += 1
     
     # Step 3: Slab geometry
-    t_above = tc - hr
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Slab Geometry",
-        description="Total slab thickness and thickness above metal deck ribs.",
-        equation="t_above = tc - hr",
-        substitution=f"t_above = {tc:.0f} - {hr:.0f} = {t_above:.0f} mm",
-        result=t_above,
-        unit="mm",
-        code_ref="AISC 360-16 §I3.2c"
+        step_num,
+        "Slab Geometry",
+        "Total slab thickness and thickness above metal deck ribs.",
+        "t_above = tc - hr",
+        f"t_above = {tc:.0f} - {hr:.0f} = {t_above:.0f} mm",
+        t_above,
+        "mm",
+        "AISC 360-16 §I3.2c"
     ))
     step_num += 1
     
     # Step 4: Modular ratio
-    Es = 200000  # Steel modulus
-    n = Es / Ec
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Modular Ratio",
-        description="The ratio of steel to concrete elastic moduli, used to transform concrete area to equivalent steel area.",
-        equation="n = Es / Ec",
-        substitution=f"n = {Es:.0f} / {Ec:.0f} = {n:.2f}",
-        result=n,
-        unit="",
-        code_ref="AISC 360-16 §I3.2"
+        step_num,
+        "Modular Ratio",
+        "The ratio of steel to concrete elastic moduli, used to transform concrete area to equivalent steel area.",
+        "n = Es / Ec",
+        f"n = {Es:.0f} / {Ec:.0f} = {n:.2f}",
+        n,
+        "",
+        "AISC 360-16 §I3.2"
     ))
     step_num += 1
     
     # Step 5: Equivalent concrete stress block depth factor
-    if fc <= 28:
-        beta1 = 0.85
-    elif fc >= 55:
-        beta1 = 0.65
-    else:
-        beta1 = 0.85 - 0.05 * (fc - 28) / 7
-        beta1 = max(0.65, beta1)
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Stress Block Factor β₁",
-        description="Factor relating depth of equivalent rectangular concrete stress block to neutral axis depth.",
-        equation="β₁ = 0.85 for f'c ≤ 28 MPa; 0.85 - 0.05(f'c-28)/7 for 28 < f'c < 55 MPa; 0.65 for f'c ≥ 55 MPa",
-        substitution=f"For f'c = {fc:.1f} MPa: β₁ = {beta1:.3f}",
-        result=beta1,
-        unit="",
-        code_ref="ACI 318-19 §22.2.2.4.3"
+        step_num,
+        "Stress Block Factor β₁",
+        "Factor relating depth of equivalent rectangular concrete stress block to neutral axis depth.",
+        "β₁ = 0.85 for f'c ≤ 28 MPa; 0.85 - 0.05(f'c-28)/7 for 28 < f'c < 55 MPa; 0.65 for f'c ≥ 55 MPa",
+        f"For f'c = {fc:.1f} MPa: β₁ = {beta1:.3f}",
+        beta1,
+        "",
+        "ACI 318-19 §22.2.2.4.3"
     ))
     step_num += 1
     
     # Step 6: Concrete crushing strain
-    ecu = 0.003
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Ultimate Concrete Strain",
-        description="Maximum usable compressive strain in concrete at crushing.",
-        equation="εcu = 0.003",
-        substitution=f"εcu = {ecu}",
-        result=ecu,
-        unit="mm/mm",
-        code_ref="ACI 318-19 §22.2.2.1"
+        step_num,
+        "Ultimate Concrete Strain",
+        "Maximum usable compressive strain in concrete at crushing.",
+        "εcu = 0.003",
+        f"εcu = {ecu}",
+        ecu,
+        "mm/mm",
+        "ACI 318-19 §22.2.2.1"
     ))
     
     section.steps = steps
-    section.conclusion = f"Concrete f'c = {fc:.0f} MPa, Ec = {Ec:.0f} MPa, n = {n:.2f}, β₁ = {beta1:.3f}"
-    section.status = "PASS"
     
-    props = {
-        'fc': fc,
+    return section, props
+
+
+def calc_concrete_properties_batch(
+    fc: np.ndarray, tc: np.ndarray, hr: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized concrete slab properties for many candidate slabs at once.
+    
+    Same arithmetic as calc_concrete_properties_detailed, evaluated with
+    NumPy with no calculation steps. Inputs broadcast against each other.
+    
+    Parameters:
+        fc: Concrete compressive strength (MPa)
+        tc: Total slab thickness (mm)
+        hr: Deck rib height (mm)
+    
+    Returns:
+        Dict of arrays: Ec (MPa), n, beta1, t_above (mm)
+    """
+    fc = np.asarray(fc, dtype=np.float64)
+    Ec = 4700 * np.sqrt(fc)
+    beta1 = np.where(fc >= 55, 0.65, np.clip(0.85 - 0.05 * (fc - 28) / 7, 0.65, 0.85))
+    return {
         'Ec': Ec,
-        'n': n,
+        'n': 200000 / Ec,
         'beta1': beta1,
-        'tc': tc,
-        'hr': hr,
-        't_above': t_above,
-        'wr': wr,
-        'ecu': ecu
+        't_above': np.asarray(tc, dtype=np.float64) - hr
     }
-    
-    return section, props
 
 
 # =============================================================================
 # SECTION 4: PLASTIC NEUTRAL AXIS AND COMPOSITE STRENGTH
 # =============================================================================
 
+# Design strength per method, indexed 0 for LRFD and 1 for ASD: the factor
+# (φ multiplies the nominal strength, Ω divides it), then the step title,
+# description, equation and substitution template, filled from
+# (factor, nominal, design)
+_FLEXURE_DESIGN = (
+    (0.90, "Design Flexural Strength (LRFD)",
+     "The design flexural strength is the nominal strength multiplied by the resistance factor.",
+     "φbMn = φb × Mn", "φbMn = {0} × {1:.2f} = {2:.2f} kN⋅m"),
+    (1.67, "Allowable Flexural Strength (ASD)",
+     "The allowable flexural strength is the nominal strength divided by the safety factor.",
+     "Mn/Ωb = Mn / Ωb", "Mn/Ωb = {1:.2f} / {0} = {2:.2f} kN⋅m"),
+)
+_SHEAR_DESIGN = (
+    (0.90, "Design Shear Strength (LRFD)",
+     "The design shear strength is the nominal strength multiplied by the resistance factor.",
+     "φvVn = φv × Vn", "φvVn = {0} × {1:.1f} = {2:.1f} kN"),
+    (1.67, "Allowable Shear Strength (ASD)",
+     "The allowable shear strength is the nominal strength divided by the safety factor.",
+     "Vn/Ωv = Vn / Ωv", "Vn/Ωv = {1:.1f} / {0} = {2:.1f} kN"),
+)
+
+
+def _design_strength(nominal, method: str, table) -> Tuple[float, tuple]:
+    """
+    Design (LRFD) or allowable (ASD) strength from the nominal one, with the
+    matching row of a _FLEXURE_DESIGN-style table.
+    """
+    if method == "LRFD":
+        row = table[0]
+        return row[0] * nominal, row
+    row = table[1]
+    return nominal / row[0], row
+
+
+# PNA locations indexed by the pna_code of _composite_flexure_core
+_PNA_LOCATIONS = ("in concrete slab", "in top flange of steel section", "in web of steel section")
+
+
+@njit(cache=True)
+def _composite_flexure_core(d, bf, tf, tw, A, Zx, beff, tc, hr, fc, Fy, Qn_total):
+    """
+    Pure-arithmetic composite flexural strength per AISC 360-16 §I3.2a,
+    JIT-compiled when numba is available. Forces are in kN, lengths in mm
+    and moments in kN·m; pna_code is 0 for the PNA in the slab, 1 in the
+    top flange and 2 in the web. The steel-branch values (Cc, Cs, As_comp,
+    y_steel) are zero when the PNA is in the slab.
+    
+    Returns:
+        (t_above, Ts, Cc_max, Qn, C, comp_ratio, a, pna_code,
+         Cc, Cs, As_comp, y_steel, d1, Mn)
+    """
+    t_above = tc - hr
+    # 0.85f'c·beff is shared by the slab force and the block depth
+    c_coef = 0.85 * fc * beff
+    Ts = A * Fy * N_TO_KN
+    Cc_max = c_coef * t_above * N_TO_KN
+    Qn = Qn_total * N_TO_KN
+    if Qn >= Ts and Ts <= Cc_max:
+        # Full composite action with the steel governing, the usual case:
+        # C = Ts and the PNA is in the slab (Ts ≤ Cc_max gives a ≤ t_above)
+        a = t_above if Ts == Cc_max else Ts * 1000 / c_coef
+        d1 = d/2 + hr + t_above - a/2
+        return (t_above, Ts, Cc_max, Qn, Ts, 1.0, a, 0,
+                0.0, 0.0, 0.0, 0.0, d1, Ts * d1 * INV_MM_TO_M)
+    
+    C = min(Ts, Cc_max, Qn)
+    if Qn >= min(Ts, Cc_max):
+        comp_ratio = 1.0
+    else:
+        comp_ratio = Qn / min(Ts, Cc_max)
+    # When the slab governs the block is the full depth above the deck;
+    # taking it directly keeps rounding from tipping a past t_above
+    a = t_above if C == Cc_max else C * 1000 / c_coef
+    
+    Cc = 0.0
+    Cs = 0.0
+    As_comp = 0.0
+    y_steel = 0.0
+    if a <= t_above:
+        # Steel fully in tension, C acts at the centre of the stress block
+        pna_code = 0
+        d1 = d/2 + hr + t_above - a/2
+        Mn = C * d1 * INV_MM_TO_M
+    else:
+        # Full slab depth in compression, the rest taken by the steel
+        Cc = Cc_max
+        Cs = C - Cc
+        As_comp = Cs * 1000 / Fy
+        Af = bf * tf
+        if As_comp <= Af:
+            pna_code = 1
+            y_steel = As_comp / bf
+        else:
+            pna_code = 2
+            y_steel = tf + (As_comp - Af) / tw
+        
+        # Approximate lever arm, interpolated towards Mp for partial
+        # composite action
+        d1 = d/2 + hr + t_above/2
+        Mn = Ts * d1 * INV_MM_TO_M
+        if comp_ratio < 1.0:
+            Mp = Fy * Zx / 1e6
+            Mn = Mp + (Mn - Mp) * comp_ratio
+    
+    return (t_above, Ts, Cc_max, Qn, C, comp_ratio, a, pna_code,
+            Cc, Cs, As_comp, y_steel, d1, Mn)
+
+
+class FlexureResult(NamedTuple):
+    """Composite flexural strength returned by calc_composite_flexure_detailed."""
+    Ts: float            # Steel tensile capacity As×Fy (kN)
+    Cc_max: float        # Max slab compression 0.85f'c×beff×t_above (kN)
+    Qn: float            # Total shear connector strength (kN)
+    C: float             # Governing compression force (kN)
+    a: float             # Stress block depth (mm)
+    PNA_location: str    # Plastic neutral axis location
+    Mn: float            # Nominal flexural strength (kN⋅m)
+    phi_Mn: float        # Design (LRFD) or allowable (ASD) strength (kN⋅m)
+    comp_type: str       # "Full" or "Partial" composite action
+    comp_ratio: float    # Degree of composite action η
+
+
 def calc_composite_flexure_detailed(
     d: float, bf: float, tf: float, tw: float,
     A: float, Zx: float,
@@ -612,8 +873,9 @@ def calc_composite_flexure_detailed(
     tc: float, hr: float,
     fc: float, Fy: float, E: float,
     Qn_total: float,
-    method: str = "LRFD"
-) -> Tuple[DetailedCalcSection, Dict]:
+    method: str = "LRFD",
+    verbose: bool = True
+) -> Tuple[DetailedCalcSection, FlexureResult]:
     """
     Calculate composite flexural strength with detailed PNA location.
     
@@ -631,9 +893,11 @@ def calc_composite_flexure_detailed(
         E: Steel modulus (MPa)
         Qn_total: Total shear connector strength (N)
         method: "LRFD" or "ASD"
+        verbose: If False, skip the calculation steps (the results and
+                 conclusion come from the numeric core alone)
     
     Returns:
-        Tuple of (DetailedCalcSection, dict of results)
+        Tuple of (DetailedCalcSection, FlexureResult)
     """
     section = DetailedCalcSection(
         section_number=4,
@@ -641,74 +905,68 @@ def calc_composite_flexure_detailed(
         description="Determine the plastic neutral axis location and nominal flexural strength of the composite section per AISC 360-16 Chapter I.",
         code_ref="AISC 360-16 §I3.2"
     )
-    steps = []
-    step_num = 1
     
-    # Resistance/safety factors
-    phi_b = 0.90 if method == "LRFD" else 1.0
-    omega_b = 1.67 if method == "ASD" else 1.0
+    # All of the arithmetic; the steps below only document it
+    (t_above, Ts, Cc_max, Qn, C, comp_ratio, a, pna_code,
+     Cc, Cs, As_comp, y_steel, d1, Mn) = _composite_flexure_core(
+        float(d), float(bf), float(tf), float(tw), float(A), float(Zx), float(beff),
+        float(tc), float(hr), float(fc), float(Fy), float(Qn_total)
+    )
+    comp_type = "Partial" if comp_ratio < 1.0 else "Full"
+    PNA_location = _PNA_LOCATIONS[pna_code]
+    design_strength, design_row = _design_strength(Mn, method, _FLEXURE_DESIGN)
+    
+    section.conclusion = f"PNA is {PNA_location}. Nominal strength Mn = {Mn:.2f} kN⋅m, Design strength = {design_strength:.2f} kN⋅m"
+    results = FlexureResult(
+        Ts, Cc_max, Qn, C, a, PNA_location, Mn, design_strength, comp_type, comp_ratio
+    )
+    if not verbose:
+        return section, results
     
-    # Derived values
-    t_above = tc - hr  # Concrete above deck
-    Ec = 4700 * math.sqrt(fc)
+    steps = []
+    step_num = 1
     
     # Step 1: Steel tensile force capacity
-    Ts = A * Fy / 1000  # Convert to kN
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Steel Tensile Capacity",
-        description="Maximum tensile force that can be developed in the steel section when fully yielded.",
-        equation="Ts = As × Fy",
-        substitution=f"Ts = {A:.0f} × {Fy:.0f} / 1000 = {Ts:.1f} kN",
-        result=Ts,
-        unit="kN",
-        code_ref="AISC 360-16 §I3.2a"
+        step_num,
+        "Steel Tensile Capacity",
+        "Maximum tensile force that can be developed in the steel section when fully yielded.",
+        "Ts = As × Fy",
+        ("Ts = {:.0f} × {:.0f} / 1000 = {:.1f} kN", (A, Fy, Ts)),
+        Ts,
+        "kN",
+        "AISC 360-16 §I3.2a"
     ))
     step_num += 1
     
     # Step 2: Maximum concrete compression capacity
     # Using 0.85f'c over effective area (Whitney stress block)
-    Ac_max = beff * t_above  # Maximum concrete area above deck
-    Cc_max = 0.85 * fc * Ac_max / 1000  # kN
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Maximum Concrete Compression Capacity",
-        description="Maximum compression force in concrete using Whitney stress block (0.85f'c). Only concrete above deck ribs is considered effective.",
-        equation="Cc,max = 0.85 × f'c × beff × (tc - hr)",
-        substitution=f"Cc,max = 0.85 × {fc:.1f} × {beff:.0f} × {t_above:.0f} / 1000 = {Cc_max:.1f} kN",
-        result=Cc_max,
-        unit="kN",
-        code_ref="AISC 360-16 §I3.2a"
+        step_num,
+        "Maximum Concrete Compression Capacity",
+        "Maximum compression force in concrete using Whitney stress block (0.85f'c). Only concrete above deck ribs is considered effective.",
+        "Cc,max = 0.85 × f'c × beff × (tc - hr)",
+        ("Cc,max = 0.85 × {:.1f} × {:.0f} × {:.0f} / 1000 = {:.1f} kN", (fc, beff, t_above, Cc_max)),
+        Cc_max,
+        "kN",
+        "AISC 360-16 §I3.2a"
     ))
     step_num += 1
     
     # Step 3: Shear connector capacity
-    Qn = Qn_total / 1000  # Convert to kN
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Total Shear Connector Capacity",
-        description="Sum of nominal strength of all shear connectors between point of maximum moment and point of zero moment.",
-        equation="ΣQn = n × Qn (for n studs)",
-        substitution=f"ΣQn = {Qn:.1f} kN (from shear stud design)",
-        result=Qn,
-        unit="kN",
-        code_ref="AISC 360-16 §I3.2d"
+        step_num,
+        "Total Shear Connector Capacity",
+        "Sum of nominal strength of all shear connectors between point of maximum moment and point of zero moment.",
+        "ΣQn = n × Qn (for n studs)",
+        ("ΣQn = {:.1f} kN (from shear stud design)", (Qn,)),
+        Qn,
+        "kN",
+        "AISC 360-16 §I3.2d"
     ))
     step_num += 1
     
     # Step 4: Determine compression force and composite type
-    C = min(Ts, Cc_max, Qn)
-    
-    if Qn >= min(Ts, Cc_max):
-        comp_type = "Full"
-        comp_ratio = 1.0
-    else:
-        comp_type = "Partial"
-        comp_ratio = Qn / min(Ts, Cc_max)
-    
     # Determine which governs
     if C == Ts:
         governing = "Steel yielding (Ts)"
@@ -718,30 +976,29 @@ def calc_composite_flexure_detailed(
         governing = "Shear connector capacity (ΣQn)"
     
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Compression Force (Governs Design)",
-        description=f"The compression force is the minimum of steel tension capacity, concrete compression capacity, and shear connector strength. This determines {comp_type} composite action.",
-        equation="C = min(Ts, Cc,max, ΣQn)",
-        substitution=f"C = min({Ts:.1f}, {Cc_max:.1f}, {Qn:.1f}) = {C:.1f} kN (governed by {governing})",
-        result=C,
-        unit="kN",
-        code_ref="AISC 360-16 §I3.2a, I3.2d",
-        notes=f"{comp_type} Composite: {comp_ratio*100:.0f}%"
+        step_num,
+        "Compression Force (Governs Design)",
+        f"The compression force is the minimum of steel tension capacity, concrete compression capacity, and shear connector strength. This determines {comp_type} composite action.",
+        "C = min(Ts, Cc,max, ΣQn)",
+        ("C = min({:.1f}, {:.1f}, {:.1f}) = {:.1f} kN (governed by {})", (Ts, Cc_max, Qn, C, governing)),
+        C,
+        "kN",
+        "AISC 360-16 §I3.2a, I3.2d",
+        "INFO",
+        f"{comp_type} Composite: {comp_ratio*100:.0f}%"
     ))
     step_num += 1
     
     # Step 5: Depth of concrete compression block
-    a = C * 1000 / (0.85 * fc * beff)  # mm
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Concrete Compression Block Depth",
-        description="Depth of the equivalent rectangular stress block in the concrete slab.",
-        equation="a = C / (0.85 × f'c × beff)",
-        substitution=f"a = {C:.1f} × 1000 / (0.85 × {fc:.1f} × {beff:.0f}) = {a:.2f} mm",
-        result=a,
-        unit="mm",
-        code_ref="AISC 360-16 §I3.2a"
+        step_num,
+        "Concrete Compression Block Depth",
+        "Depth of the equivalent rectangular stress block in the concrete slab.",
+        "a = C / (0.85 × f'c × beff)",
+        ("a = {:.1f} × 1000 / (0.85 × {:.1f} × {:.0f}) = {:.2f} mm", (C, fc, beff, a)),
+        a,
+        "mm",
+        "AISC 360-16 §I3.2a"
     ))
     step_num += 1
     
@@ -749,417 +1006,539 @@ def calc_composite_flexure_detailed(
     # If a <= t_above, PNA is in concrete slab
     # If a > t_above, PNA is in steel section
     
-    if a <= t_above:
-        PNA_location = "in concrete slab"
-        y_PNA = tc - a/2  # Distance from top of slab to PNA
-        
+    if pna_code == 0:
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="PNA Location Check",
-            description=f"Since the compression block depth a = {a:.2f} mm is less than the concrete thickness above deck (tc - hr) = {t_above:.0f} mm, the plastic neutral axis is located within the concrete slab.",
-            equation="a ≤ (tc - hr) → PNA in concrete",
-            substitution=f"a = {a:.2f} mm ≤ {t_above:.0f} mm → PNA {PNA_location}",
-            result=a,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.2a",
-            notes="Steel section fully in tension, concrete takes all compression"
+            step_num,
+            "PNA Location Check",
+            f"Since the compression block depth a = {a:.2f} mm is less than the concrete thickness above deck (tc - hr) = {t_above:.0f} mm, the plastic neutral axis is located within the concrete slab.",
+            "a ≤ (tc - hr) → PNA in concrete",
+            ("a = {:.2f} mm ≤ {:.0f} mm → PNA {}", (a, t_above, PNA_location)),
+            a,
+            "mm",
+            "AISC 360-16 §I3.2a",
+            "INFO",
+            "Steel section fully in tension, concrete takes all compression"
         ))
         step_num += 1
         
         # Step 7a: Calculate moment arm for PNA in slab
         # Distance from centroid of steel to centroid of concrete block
-        d1 = d/2 + hr + t_above - a/2
-        
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Moment Arm (PNA in Slab)",
-            description="The moment arm is the distance from the centroid of the steel section to the centroid of the concrete compression block.",
-            equation="d₁ = d/2 + hr + (tc - hr) - a/2 = d/2 + tc - a/2",
-            substitution=f"d₁ = {d:.1f}/2 + {tc:.0f} - {a:.2f}/2 = {d/2:.1f} + {tc:.0f} - {a/2:.2f} = {d1:.2f} mm",
-            result=d1,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.2a"
+            step_num,
+            "Moment Arm (PNA in Slab)",
+            "The moment arm is the distance from the centroid of the steel section to the centroid of the concrete compression block.",
+            "d₁ = d/2 + hr + (tc - hr) - a/2 = d/2 + tc - a/2",
+            ("d₁ = {:.1f}/2 + {:.0f} - {:.2f}/2 = {:.1f} + {:.0f} - {:.2f} = {:.2f} mm", (d, tc, a, d/2, tc, a/2, d1)),
+            d1,
+            "mm",
+            "AISC 360-16 §I3.2a"
         ))
         step_num += 1
         
-        # Step 8a: Nominal moment strength
-        Mn = C * d1 / 1000  # kN⋅m (C is in kN, d1 in mm)
-        
     else:
         # PNA is in steel section - more complex calculation
-        PNA_location = "in steel section"
-        
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="PNA Location Check",
-            description=f"Since the compression block depth a = {a:.2f} mm exceeds the concrete thickness above deck (tc - hr) = {t_above:.0f} mm, the plastic neutral axis is located within the steel section.",
-            equation="a > (tc - hr) → PNA in steel",
-            substitution=f"a = {a:.2f} mm > {t_above:.0f} mm → PNA {PNA_location}",
-            result=a,
-            unit="mm",
-            code_ref="AISC 360-16 §I3.2a",
-            notes="Steel section partially in compression"
+            step_num,
+            "PNA Location Check",
+            f"Since the compression block depth a = {a:.2f} mm exceeds the concrete thickness above deck (tc - hr) = {t_above:.0f} mm, the plastic neutral axis is located within the steel section.",
+            "a > (tc - hr) → PNA in steel",
+            ("a = {:.2f} mm > {:.0f} mm → PNA in steel section", (a, t_above)),
+            a,
+            "mm",
+            "AISC 360-16 §I3.2a",
+            "INFO",
+            "Steel section partially in compression"
         ))
         step_num += 1
         
         # Recalculate with full concrete depth
-        Cc = 0.85 * fc * beff * t_above / 1000  # kN - actual concrete force
-        
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Actual Concrete Compression Force",
-            description="When PNA is in steel, the full concrete above deck is in compression.",
-            equation="Cc = 0.85 × f'c × beff × (tc - hr)",
-            substitution=f"Cc = 0.85 × {fc:.1f} × {beff:.0f} × {t_above:.0f} / 1000 = {Cc:.1f} kN",
-            result=Cc,
-            unit="kN",
-            code_ref="AISC 360-16 §I3.2a"
+            step_num,
+            "Actual Concrete Compression Force",
+            "When PNA is in steel, the full concrete above deck is in compression.",
+            "Cc = 0.85 × f'c × beff × (tc - hr)",
+            ("Cc = 0.85 × {:.1f} × {:.0f} × {:.0f} / 1000 = {:.1f} kN", (fc, beff, t_above, Cc)),
+            Cc,
+            "kN",
+            "AISC 360-16 §I3.2a"
         ))
         step_num += 1
         
         # Force that must be carried by steel in compression
-        Cs = C - Cc  # kN - steel compression force
-        
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Steel Compression Force",
-            description="The portion of the compression force carried by the steel section.",
-            equation="Cs = C - Cc",
-            substitution=f"Cs = {C:.1f} - {Cc:.1f} = {Cs:.1f} kN",
-            result=Cs,
-            unit="kN",
-            code_ref="AISC 360-16 §I3.2a"
+            step_num,
+            "Steel Compression Force",
+            "The portion of the compression force carried by the steel section.",
+            "Cs = C - Cc",
+            ("Cs = {:.1f} - {:.1f} = {:.1f} kN", (C, Cc, Cs)),
+            Cs,
+            "kN",
+            "AISC 360-16 §I3.2a"
         ))
         step_num += 1
         
         # Find PNA location in steel
         # Area of steel in compression = Cs / Fy
-        As_comp = Cs * 1000 / Fy  # mm²
-        
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Steel Area in Compression",
-            description="The area of steel above the plastic neutral axis that is in compression.",
-            equation="As,comp = Cs / Fy",
-            substitution=f"As,comp = {Cs:.1f} × 1000 / {Fy:.0f} = {As_comp:.0f} mm²",
-            result=As_comp,
-            unit="mm²",
-            code_ref="AISC 360-16 §I3.2a"
+            step_num,
+            "Steel Area in Compression",
+            "The area of steel above the plastic neutral axis that is in compression.",
+            "As,comp = Cs / Fy",
+            ("As,comp = {:.1f} × 1000 / {:.0f} = {:.0f} mm²", (Cs, Fy, As_comp)),
+            As_comp,
+            "mm²",
+            "AISC 360-16 §I3.2a"
         ))
         step_num += 1
         
         # Determine if PNA is in flange or web
         Af = bf * tf  # Top flange area
         
-        if As_comp <= Af:
+        if pna_code == 1:
             # PNA in top flange
-            y_steel = As_comp / bf  # Distance from top of steel to PNA
-            PNA_location = "in top flange of steel section"
-            
             steps.append(DetailedCalcStep(
-                step_number=step_num,
-                title="PNA Location in Steel",
-                description=f"Since As,comp = {As_comp:.0f} mm² < Af = {Af:.0f} mm², the PNA is in the top flange.",
-                equation="y_steel = As,comp / bf (for PNA in flange)",
-                substitution=f"y_steel = {As_comp:.0f} / {bf:.0f} = {y_steel:.2f} mm from top of steel",
-                result=y_steel,
-                unit="mm",
-                code_ref="AISC 360-16 §I3.2a",
-                notes=f"PNA is {PNA_location}"
+                step_num,
+                "PNA Location in Steel",
+                f"Since As,comp = {As_comp:.0f} mm² < Af = {Af:.0f} mm², the PNA is in the top flange.",
+                "y_steel = As,comp / bf (for PNA in flange)",
+                ("y_steel = {:.0f} / {:.0f} = {:.2f} mm from top of steel", (As_comp, bf, y_steel)),
+                y_steel,
+                "mm",
+                "AISC 360-16 §I3.2a",
+                "INFO",
+                f"PNA is {PNA_location}"
             ))
             step_num += 1
             
-            # Calculate moment components
-            # Concrete force arm
-            d_cc = t_above/2 + hr + y_steel/2
-            # Steel compression arm (from PNA)
-            d_sc = y_steel/2
-            # Steel tension arm (centroid of tension region from PNA)
-            # This requires more detailed calculation
-            
         else:
             # PNA in web
-            y_flange = tf  # Full flange in compression
-            As_web_comp = As_comp - Af
-            y_web = As_web_comp / tw
-            y_steel = tf + y_web
-            PNA_location = "in web of steel section"
-            
             steps.append(DetailedCalcStep(
-                step_number=step_num,
-                title="PNA Location in Steel",
-                description=f"Since As,comp = {As_comp:.0f} mm² > Af = {Af:.0f} mm², the PNA is in the web.",
-                equation="y_steel = tf + (As,comp - Af)/tw",
-                substitution=f"y_steel = {tf:.1f} + ({As_comp:.0f} - {Af:.0f})/{tw:.1f} = {y_steel:.2f} mm from top of steel",
-                result=y_steel,
-                unit="mm",
-                code_ref="AISC 360-16 §I3.2a",
-                notes=f"PNA is {PNA_location}"
+                step_num,
+                "PNA Location in Steel",
+                f"Since As,comp = {As_comp:.0f} mm² > Af = {Af:.0f} mm², the PNA is in the web.",
+                "y_steel = tf + (As,comp - Af)/tw",
+                ("y_steel = {:.1f} + ({:.0f} - {:.0f})/{:.1f} = {:.2f} mm from top of steel", (tf, As_comp, Af, tw, y_steel)),
+                y_steel,
+                "mm",
+                "AISC 360-16 §I3.2a",
+                "INFO",
+                f"PNA is {PNA_location}"
             ))
             step_num += 1
-        
-        # For simplicity, use the approximate method for Mn
-        # d1 = d/2 + tc - t_above/2 (center of concrete to center of steel)
-        d1 = d/2 + hr + t_above/2
-        d2 = y_steel  # compression region in steel
-        
-        # Moment from concrete
-        Mc = Cc * (d1) / 1000
-        # Moment contribution from steel (simplified - use plastic moment reduction)
-        # More accurate would be to integrate over the section
-        
-        # Use the general formula: Mn = C × d1 for PNA in steel (approximate)
-        Mn = Ts * (d/2 + hr + t_above/2) / 1000
-        
-        # Apply reduction for PNA in steel
-        # Simplified approach using AISC method
-        if comp_ratio < 1.0:
-            # Interpolation formula per AISC §I3.2a
-            Mp = Fy * Zx / 1e6  # Steel plastic moment (kN⋅m)
-            Mn = Mp + (Mn - Mp) * comp_ratio
     
     # Final Mn for PNA in concrete case
-    if a <= t_above:
+    if pna_code == 0:
         steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Nominal Flexural Strength",
-            description="The nominal flexural strength is the product of the compression force and the moment arm.",
-            equation="Mn = C × d₁",
-            substitution=f"Mn = {C:.1f} × {d1:.2f} / 1000 = {Mn:.2f} kN⋅m",
-            result=Mn,
-            unit="kN⋅m",
-            code_ref="AISC 360-16 §I3.2a(a)"
+            step_num,
+            "Nominal Flexural Strength",
+            "The nominal flexural strength is the product of the compression force and the moment arm.",
+            "Mn = C × d₁",
+            ("Mn = {:.1f} × {:.2f} / 1000 = {:.2f} kN⋅m", (C, d1, Mn)),
+            Mn,
+            "kN⋅m",
+            "AISC 360-16 §I3.2a(a)"
         ))
         step_num += 1
     
     # Step: Design strength
-    if method == "LRFD":
-        phi_Mn = phi_b * Mn
-        
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Design Flexural Strength (LRFD)",
-            description="The design flexural strength is the nominal strength multiplied by the resistance factor.",
-            equation="φbMn = φb × Mn",
-            substitution=f"φbMn = {phi_b} × {Mn:.2f} = {phi_Mn:.2f} kN⋅m",
-            result=phi_Mn,
-            unit="kN⋅m",
-            code_ref="AISC 360-16 §I3.2"
-        ))
-        design_strength = phi_Mn
-    else:
-        Mn_omega = Mn / omega_b
-        
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Allowable Flexural Strength (ASD)",
-            description="The allowable flexural strength is the nominal strength divided by the safety factor.",
-            equation="Mn/Ωb = Mn / Ωb",
-            substitution=f"Mn/Ωb = {Mn:.2f} / {omega_b} = {Mn_omega:.2f} kN⋅m",
-            result=Mn_omega,
-            unit="kN⋅m",
-            code_ref="AISC 360-16 §I3.2"
-        ))
-        design_strength = Mn_omega
+    factor, title, description, equation, template = design_row
+    steps.append(DetailedCalcStep(
+        step_num,
+        title,
+        description,
+        equation,
+        (template, (factor, Mn, design_strength)),
+        design_strength,
+        "kN⋅m",
+        "AISC 360-16 §I3.2"
+    ))
     
     section.steps = steps
-    section.conclusion = f"PNA is {PNA_location}. Nominal strength Mn = {Mn:.2f} kN⋅m, Design strength = {design_strength:.2f} kN⋅m"
-    section.status = "PASS"
-    
-    results = {
-        'Ts': Ts,
-        'Cc_max': Cc_max,
-        'Qn': Qn,
-        'C': C,
-        'a': a,
-        'PNA_location': PNA_location,
-        'Mn': Mn,
-        'phi_Mn': phi_Mn if method == "LRFD" else Mn_omega,
-        'comp_type': comp_type,
-        'comp_ratio': comp_ratio
-    }
     
     return section, results
 
 
-# =============================================================================
-# SECTION 5: SHEAR STRENGTH
-# =============================================================================
+def _y_steel_from_ascomp(As_comp, Af, bf, tf, tw):
+    """
+    Depth of the PNA below the top of steel for a steel area in compression
+    As_comp, in the flange (As_comp ≤ Af) or in the web, as one np.where
+    so it applies to scalars and arrays alike.
+    """
+    return np.where(As_comp <= Af, As_comp / bf, tf + (As_comp - Af) / tw)
 
-def calc_composite_shear_detailed(
-    d: float, tw: float,
-    Fy: float, E: float,
+
+def calc_composite_flexure_batch(
+    d: np.ndarray, bf: np.ndarray, tf: np.ndarray, tw: np.ndarray,
+    A: np.ndarray, Zx: np.ndarray,
+    beff: np.ndarray,
+    tc: np.ndarray, hr: np.ndarray,
+    fc: np.ndarray, Fy: np.ndarray,
+    Qn_total: np.ndarray,
     method: str = "LRFD"
-) -> Tuple[DetailedCalcSection, Dict]:
+) -> Dict[str, np.ndarray]:
     """
-    Calculate shear strength of composite beam per AISC 360-16 Chapter G.
+    Vectorized composite flexural strength for many candidate beams at once,
+    e.g. a sweep over sections, effective widths and stud counts ahead of
+    the detailed report for the chosen design.
     
-    Note: Concrete slab does not contribute to shear strength.
+    Same arithmetic as calc_composite_flexure_detailed, evaluated with
+    NumPy with no calculation steps. Inputs broadcast against each other.
     
     Parameters:
-        d: Steel beam depth (mm)
-        tw: Web thickness (mm)
-        Fy: Yield stress (MPa)
-        E: Elastic modulus (MPa)
+        d, bf, tf, tw: Steel section dimensions (mm)
+        A: Steel area (mm²)
+        Zx: Plastic section modulus (mm³)
+        beff: Effective slab width (mm)
+        tc, hr: Slab thickness and rib height (mm)
+        fc: Concrete strength (MPa)
+        Fy: Steel yield stress (MPa)
+        Qn_total: Total shear connector strength (N)
         method: "LRFD" or "ASD"
+    
+    Returns:
+        Dict of arrays: Ts, Cc_max, Qn, C (kN), a (mm), comp_ratio,
+        pna_in_concrete, pna_in_flange, y_steel (mm, zero for the PNA in
+        the slab), Mn, phi_Mn (kN·m; φbMn for LRFD, Mn/Ωb for ASD)
     """
-    section = DetailedCalcSection(
-        section_number=5,
-        title="SHEAR STRENGTH",
-        description="Determine the shear strength of the composite beam. Per AISC 360-16 §I4.2, the concrete slab does not contribute to shear resistance.",
-        code_ref="AISC 360-16 §G2.1"
+    d, bf, tf, tw, A, Zx, beff, tc, hr, fc, Fy, Qn_total = (
+        np.asarray(x, dtype=np.float64)
+        for x in (d, bf, tf, tw, A, Zx, beff, tc, hr, fc, Fy, Qn_total)
     )
-    steps = []
-    step_num = 1
-    
-    # Resistance factors
-    phi_v = 0.90 if method == "LRFD" else 1.0
-    omega_v = 1.67 if method == "ASD" else 1.0
-    
-    # Step 1: Web area
-    Aw = d * tw
+    t_above = tc - hr
+    c_coef = 0.85 * fc * beff
+    
+    Ts = A * Fy * N_TO_KN
+    Cc_max = c_coef * t_above * N_TO_KN
+    Qn = Qn_total * N_TO_KN
+    C_full = np.minimum(Ts, Cc_max)
+    C = np.minimum(C_full, Qn)
+    comp_ratio = np.where(Qn >= C_full, 1.0, Qn / C_full)
+    a = np.where(C == Cc_max, t_above, C * 1000 / c_coef)
+    # Full composite with the steel governing is always in the slab
+    pna_in_concrete = (a <= t_above) | ((Qn >= Ts) & (Ts <= Cc_max))
+    
+    # PNA in slab: C acts at the centre of the stress block
+    Mn_concrete = C * (d/2 + hr + t_above - a/2) * INV_MM_TO_M
+    
+    # PNA in steel: approximate lever arm, interpolated towards Mp for
+    # partial composite action
+    Mn_steel = Ts * (d/2 + hr + t_above/2) * INV_MM_TO_M
+    Mp = Fy * Zx / 1e6
+    Mn_steel = np.where(comp_ratio < 1.0, Mp + (Mn_steel - Mp) * comp_ratio, Mn_steel)
+    Mn = np.where(pna_in_concrete, Mn_concrete, Mn_steel)
+    
+    # Steel area in compression decides flange vs web for the PNA in steel
+    As_comp = (C - Cc_max) * 1000 / Fy
+    Af = bf * tf
+    pna_in_flange = ~pna_in_concrete & (As_comp <= Af)
+    y_steel = np.where(pna_in_concrete, 0.0, _y_steel_from_ascomp(As_comp, Af, bf, tf, tw))
+    
+    phi_Mn = _design_strength(Mn, method, _FLEXURE_DESIGN)[0]
+    
+    return {
+        'Ts': Ts, 'Cc_max': Cc_max, 'Qn': Qn, 'C': C, 'a': a,
+        'comp_ratio': comp_ratio,
+        'pna_in_concrete': pna_in_concrete, 'pna_in_flange': pna_in_flange,
+        'y_steel': y_steel,
+        'Mn': Mn, 'phi_Mn': phi_Mn
+    }
+
+
+# =============================================================================
+# SECTION 5: SHEAR STRENGTH
+# =============================================================================
+
+@njit(cache=True)
+def _web_shear_limits(Fy, E, kv):
+    """
+    Web shear buckling limits per AISC 360-16 §G2.1(b)(1).
     
-    steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Web Area",
-        description="The shear area is taken as the overall depth times the web thickness.",
-        equation="Aw = d × tw",
-        substitution=f"Aw = {d:.1f} × {tw:.1f} = {Aw:.0f} mm²",
-        result=Aw,
-        unit="mm²",
+    Returns:
+        (Limit₁, Limit₂) = (1.10, 1.37) × √(kv×E/Fy)
+    """
+    sqrt_kv_E_Fy = sqrt(kv * E / Fy)
+    return 1.10 * sqrt_kv_E_Fy, 1.37 * sqrt_kv_E_Fy
+
+
+@lru_cache(maxsize=32)
+def _shear_limits(Fy: float, E: float, kv: float = 5.34) -> Tuple[float, float]:
+    """
+    _web_shear_limits for a material grade, cached per (Fy, E, kv) since
+    they depend only on the material and stiffening.
+    """
+    return _web_shear_limits(float(Fy), float(E), float(kv))
+
+
+@njit(cache=True)
+def _web_shear_strength(d, tw, Fy, E, limit_1, limit_2, kv):
+    """
+    Web shear strength per AISC 360-16 §G2.1 with h ≈ d, given the limits
+    from _web_shear_limits.
+    
+    Returns:
+        (Aw, lambda_w, Cv1, Vn) with Vn in kN
+    """
+    Aw = d * tw
+    lambda_w = d / tw
+    if lambda_w <= limit_1:
+        Cv1 = 1.0
+    elif lambda_w <= limit_2:
+        Cv1 = limit_1 / lambda_w
+    else:
+        Cv1 = 1.51 * kv * E / (Fy * (lambda_w * lambda_w))
+    Vn = 0.6 * Fy * Aw * Cv1 * N_TO_KN
+    return Aw, lambda_w, Cv1, Vn
+
+
+def _composite_shear_core(d, tw, Fy, E):
+    """
+    Numeric part of calc_composite_shear_detailed per AISC 360-16 §G2.1,
+    taking h ≈ d for a conservative estimate (rather than the clear
+    distance between flanges, d - 2×tf) and kv = 5.34 (no transverse
+    stiffeners).
+    
+    Returns:
+        (Aw, lambda_w, limit_1, limit_2, Cv1, Vn) with Vn in kN
+    """
+    kv = 5.34
+    limit_1, limit_2 = _shear_limits(Fy, E, kv)
+    Aw, lambda_w, Cv1, Vn = _web_shear_strength(
+        float(d), float(tw), float(Fy), float(E), limit_1, limit_2, kv
+    )
+    return Aw, lambda_w, limit_1, limit_2, Cv1, Vn
+
+
+class ShearResult(NamedTuple):
+    """Shear strength returned by calc_composite_shear_detailed."""
+    Aw: float      # Web area d×tw (mm²)
+    Cv1: float     # Web shear strength coefficient
+    Vn: float      # Nominal shear strength (kN)
+    phi_Vn: float  # Design (LRFD) or allowable (ASD) strength (kN)
+
+
+def calc_composite_shear_detailed(
+    d: float, tw: float,
+    Fy: float, E: float,
+    method: str = "LRFD",
+    verbose: bool = True
+) -> Tuple[DetailedCalcSection, ShearResult]:
+    """
+    Calculate shear strength of composite beam per AISC 360-16 Chapter G.
+    
+    Note: Concrete slab does not contribute to shear strength.
+    
+    Parameters:
+        d: Steel beam depth (mm)
+        tw: Web thickness (mm)
+        Fy: Yield stress (MPa)
+        E: Elastic modulus (MPa)
+        method: "LRFD" or "ASD"
+        verbose: If False, skip the calculation steps and return the
+                 results with the conclusion only
+    
+    Returns:
+        Tuple of (DetailedCalcSection, ShearResult)
+    """
+    section = DetailedCalcSection(
+        section_number=5,
+        title="SHEAR STRENGTH",
+        description="Determine the shear strength of the composite beam. Per AISC 360-16 §I4.2, the concrete slab does not contribute to shear resistance.",
         code_ref="AISC 360-16 §G2.1"
+    )
+    
+    Aw, lambda_w, limit_1, limit_2, Cv1, Vn = _composite_shear_core(d, tw, Fy, E)
+    design_strength, design_row = _design_strength(Vn, method, _SHEAR_DESIGN)
+    
+    section.conclusion = f"Nominal shear strength Vn = {Vn:.1f} kN, Design strength = {design_strength:.1f} kN"
+    results = ShearResult(Aw, Cv1, Vn, design_strength)
+    if not verbose:
+        return section, results
+    
+    kv = 5.34  # No transverse stiffeners, as in _composite_shear_core
+    
+    steps = []
+    step_num = 1
+    
+    # Step 1: Web area
+    steps.append(DetailedCalcStep(
+        step_num,
+        "Web Area",
+        "The shear area is taken as the overall depth times the web thickness.",
+        "Aw = d × tw",
+        ("Aw = {:.1f} × {:.1f} = {:.0f} mm²", (d, tw, Aw)),
+        Aw,
+        "mm²",
+        "AISC 360-16 §G2.1"
     ))
     step_num += 1
     
     # Step 2: Web slenderness
-    h = d - 2 * 0  # Assuming rolled section, h ≈ d for simplicity
-    # For rolled I-shapes, use clear distance between flanges
-    # This is approximated as d - 2*tf, but we'll use d for conservative estimate
-    lambda_w = h / tw
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Web Slenderness Ratio",
-        description="The web height-to-thickness ratio for shear buckling check.",
-        equation="h/tw = d/tw (conservative)",
-        substitution=f"h/tw = {d:.1f}/{tw:.1f} = {lambda_w:.1f}",
-        result=lambda_w,
-        unit="",
-        code_ref="AISC 360-16 §G2.1"
+        step_num,
+        "Web Slenderness Ratio",
+        "The web height-to-thickness ratio for shear buckling check.",
+        "h/tw = d/tw (conservative)",
+        ("h/tw = {:.1f}/{:.1f} = {:.1f}", (d, tw, lambda_w)),
+        lambda_w,
+        "",
+        "AISC 360-16 §G2.1"
     ))
     step_num += 1
     
     # Step 3: Web shear coefficient
-    kv = 5.34  # No transverse stiffeners
-    limit_1 = 1.10 * math.sqrt(kv * E / Fy)
-    limit_2 = 1.37 * math.sqrt(kv * E / Fy)
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Shear Buckling Limits",
-        description="Calculate the limits for determining the web shear coefficient Cv1.",
-        equation="Limit₁ = 1.10√(kv×E/Fy), Limit₂ = 1.37√(kv×E/Fy)",
-        substitution=f"Limit₁ = 1.10×√({kv}×{E}/{Fy}) = {limit_1:.1f}, Limit₂ = 1.37×√({kv}×{E}/{Fy}) = {limit_2:.1f}",
-        result=limit_1,
-        unit="",
-        code_ref="AISC 360-16 §G2.1"
+        step_num,
+        "Shear Buckling Limits",
+        "Calculate the limits for determining the web shear coefficient Cv1.",
+        "Limit₁ = 1.10√(kv×E/Fy), Limit₂ = 1.37√(kv×E/Fy)",
+        ("Limit₁ = 1.10×√({}×{}/{}) = {:.1f}, Limit₂ = 1.37×√({}×{}/{}) = {:.1f}", (kv, E, Fy, limit_1, kv, E, Fy, limit_2)),
+        limit_1,
+        "",
+        "AISC 360-16 §G2.1"
     ))
     step_num += 1
     
     # Step 4: Web shear coefficient Cv1
-    if lambda_w <= limit_1:
-        Cv1 = 1.0
-        shear_yielding = True
-    elif lambda_w <= limit_2:
-        Cv1 = limit_1 / lambda_w
-        shear_yielding = False
-    else:
-        Cv1 = 1.51 * kv * E / (Fy * lambda_w**2)
-        shear_yielding = False
+    shear_yielding = lambda_w <= limit_1
     
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Web Shear Coefficient Cv1",
-        description="The web shear coefficient accounts for the shear buckling strength of the web.",
-        equation="Cv1 = 1.0 if h/tw ≤ 1.10√(kv×E/Fy); = 1.10√(kv×E/Fy)/(h/tw) if intermediate; = 1.51kv×E/(Fy×(h/tw)²) otherwise",
-        substitution=f"h/tw = {lambda_w:.1f} vs limits [{limit_1:.1f}, {limit_2:.1f}] → Cv1 = {Cv1:.3f}",
-        result=Cv1,
-        unit="",
-        code_ref="AISC 360-16 §G2.1(a)",
-        notes="Web yields in shear" if shear_yielding else "Web shear buckling controls"
+        step_num,
+        "Web Shear Coefficient Cv1",
+        "The web shear coefficient accounts for the shear buckling strength of the web.",
+        "Cv1 = 1.0 if h/tw ≤ 1.10√(kv×E/Fy); = 1.10√(kv×E/Fy)/(h/tw) if intermediate; = 1.51kv×E/(Fy×(h/tw)²) otherwise",
+        ("h/tw = {:.1f} vs limits [{:.1f}, {:.1f}] → Cv1 = {:.3f}", (lambda_w, limit_1, limit_2, Cv1)),
+        Cv1,
+        "",
+        "AISC 360-16 §G2.1(a)",
+        "INFO",
+        "Web yields in shear" if shear_yielding else "Web shear buckling controls"
     ))
     step_num += 1
     
     # Step 5: Nominal shear strength
-    Vn = 0.6 * Fy * Aw * Cv1 / 1000  # kN
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Nominal Shear Strength",
-        description="The nominal shear strength based on web yielding or buckling.",
-        equation="Vn = 0.6 × Fy × Aw × Cv1",
-        substitution=f"Vn = 0.6 × {Fy} × {Aw:.0f} × {Cv1:.3f} / 1000 = {Vn:.1f} kN",
-        result=Vn,
-        unit="kN",
-        code_ref="AISC 360-16 Eq. G2-1"
+        step_num,
+        "Nominal Shear Strength",
+        "The nominal shear strength based on web yielding or buckling.",
+        "Vn = 0.6 × Fy × Aw × Cv1",
+        ("Vn = 0.6 × {} × {:.0f} × {:.3f} / 1000 = {:.1f} kN", (Fy, Aw, Cv1, Vn)),
+        Vn,
+        "kN",
+        "AISC 360-16 Eq. G2-1"
     ))
     step_num += 1
     
     # Step 6: Design strength
-    if method == "LRFD":
-        phi_Vn = phi_v * Vn
-        
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Design Shear Strength (LRFD)",
-            description="The design shear strength is the nominal strength multiplied by the resistance factor.",
-            equation="φvVn = φv × Vn",
-            substitution=f"φvVn = {phi_v} × {Vn:.1f} = {phi_Vn:.1f} kN",
-            result=phi_Vn,
-            unit="kN",
-            code_ref="AISC 360-16 §G1"
-        ))
-        design_strength = phi_Vn
-    else:
-        Vn_omega = Vn / omega_v
-        
-        steps.append(DetailedCalcStep(
-            step_number=step_num,
-            title="Allowable Shear Strength (ASD)",
-            description="The allowable shear strength is the nominal strength divided by the safety factor.",
-            equation="Vn/Ωv = Vn / Ωv",
-            substitution=f"Vn/Ωv = {Vn:.1f} / {omega_v} = {Vn_omega:.1f} kN",
-            result=Vn_omega,
-            unit="kN",
-            code_ref="AISC 360-16 §G1"
-        ))
-        design_strength = Vn_omega
+    factor, title, description, equation, template = design_row
+    steps.append(DetailedCalcStep(
+        step_num,
+        title,
+        description,
+        equation,
+        (template, (factor, Vn, design_strength)),
+        design_strength,
+        "kN",
+        "AISC 360-16 §G1"
+    ))
     
     section.steps = steps
-    section.conclusion = f"Nominal shear strength Vn = {Vn:.1f} kN, Design strength = {design_strength:.1f} kN"
-    section.status = "PASS"
-    
-    results = {
-        'Aw': Aw,
-        'Cv1': Cv1,
-        'Vn': Vn,
-        'phi_Vn': design_strength
-    }
     
     return section, results
 
 
+def calc_composite_shear_batch(
+    d: np.ndarray, tw: np.ndarray,
+    Fy: np.ndarray, E: np.ndarray,
+    method: str = "LRFD"
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized shear strength for many candidate sections at once.
+    
+    Same arithmetic as calc_composite_shear_detailed, evaluated with NumPy
+    with no calculation steps; the three Cv1 cases are one np.select.
+    Inputs broadcast against each other.
+    
+    Parameters:
+        d: Steel beam depth (mm)
+        tw: Web thickness (mm)
+        Fy: Yield stress (MPa)
+        E: Elastic modulus (MPa)
+        method: "LRFD" or "ASD"
+    
+    Returns:
+        Dict of arrays: Aw (mm²), Cv1, Vn, phi_Vn (kN; φvVn for LRFD,
+        Vn/Ωv for ASD)
+    """
+    d, tw, Fy, E = (np.asarray(x, dtype=np.float64) for x in (d, tw, Fy, E))
+    Aw = d * tw
+    lambda_w = d / tw  # h ≈ d, as in the detailed calculation
+    kv = 5.34
+    sqrt_kv_E_Fy = np.sqrt(kv * E / Fy)
+    limit_1 = 1.10 * sqrt_kv_E_Fy
+    limit_2 = 1.37 * sqrt_kv_E_Fy
+    Cv1 = np.select(
+        [lambda_w <= limit_1, lambda_w <= limit_2],
+        [1.0, limit_1 / lambda_w],
+        default=1.51 * kv * E / (Fy * lambda_w**2)
+    )
+    Vn = 0.6 * Fy * Aw * Cv1 * N_TO_KN
+    phi_Vn = _design_strength(Vn, method, _SHEAR_DESIGN)[0]
+    
+    return {'Aw': Aw, 'Cv1': Cv1, 'Vn': Vn, 'phi_Vn': phi_Vn}
+
+
 # =============================================================================
 # SECTION 6: EFFECTIVE MOMENT OF INERTIA (LOWER BOUND)
 # =============================================================================
 
+@njit(cache=True)
+def _transformed_section_core(d, A, Ix, beff, t_above, hr, n, comp_ratio):
+    """
+    Numeric part of calc_effective_Itr_detailed: the full composite
+    transformed section and the lower-bound Ieff. Distances are from the
+    top of steel, negative above it. Powers are written as products, which
+    round the same way under numba, CPython and NumPy.
+    
+    Returns:
+        (Atr, y_steel, y_conc, y_bar, Ic, d_steel, d_conc, Itr, Ieff)
+    """
+    # Taking moments about the top of steel:
+    # ȳ × (A + Atr) = A × (d/2) + Atr × (-hr - t_above/2)
+    Atr = beff * t_above / n  # Transformed concrete area above deck
+    y_steel = d / 2  # Top of steel to centroid of steel
+    y_conc = -(hr + t_above/2)  # Top of steel to centroid of concrete
+    y_bar = (A * y_steel + Atr * y_conc) / (A + Atr)
+    
+    # Itr = Ix + A×(d/2 - y_bar)² + (beff×t_above³/12)/n + Atr×(y_conc - y_bar)²
+    Ic = beff * (t_above * t_above * t_above) / 12 / n  # Transformed concrete about its own centroid
+    d_steel = y_steel - y_bar  # Steel centroid to composite NA
+    d_conc = y_conc - y_bar  # Concrete centroid to composite NA
+    Itr = Ix + A * (d_steel * d_steel) + Ic + Atr * (d_conc * d_conc)
+    
+    # Lower-bound Ieff = Ix + √(η) × (Itr - Ix)
+    Ieff = Ix + sqrt(comp_ratio) * (Itr - Ix)
+    return Atr, y_steel, y_conc, y_bar, Ic, d_steel, d_conc, Itr, Ieff
+
+
+class StiffnessResult(NamedTuple):
+    """Composite section stiffness returned by calc_effective_Itr_detailed."""
+    n: float           # Modular ratio Es/Ec
+    Atr: float         # Transformed concrete area (mm²)
+    y_bar: float       # Composite NA from top of steel, negative above (mm)
+    Itr: float         # Full composite transformed moment of inertia (mm⁴)
+    Ieff: float        # Lower-bound effective moment of inertia (mm⁴)
+    comp_ratio: float  # Degree of composite action η
+
+
 def calc_effective_Itr_detailed(
     d: float, A: float, Ix: float,
     beff: float, tc: float, hr: float,
     fc: float, E: float,
     Qn_total: float,
-    Ts: float, Cc_max: float
-) -> Tuple[DetailedCalcSection, Dict]:
+    Ts: float, Cc_max: float,
+    verbose: bool = True,
+    concrete: Optional[ConcreteProps] = None
+) -> Tuple[DetailedCalcSection, StiffnessResult]:
     """
     Calculate the lower-bound moment of inertia per AISC 360-16 §I3.2.
     
@@ -1173,6 +1552,14 @@ def calc_effective_Itr_detailed(
         Qn_total: Total stud capacity (N)
         Ts: Steel tensile capacity (kN)
         Cc_max: Max concrete compression (kN)
+        verbose: If False, skip the calculation steps and return the
+                 results with the conclusion only
+        concrete: Properties from calc_concrete_properties_detailed for
+                  the same f'c and Es = E; when given, Ec and n are taken
+                  from it instead of being recomputed
+    
+    Returns:
+        Tuple of (DetailedCalcSection, StiffnessResult)
     """
     section = DetailedCalcSection(
         section_number=6,
@@ -1180,138 +1567,178 @@ def calc_effective_Itr_detailed(
         description="Calculate the effective moment of inertia for deflection calculations per AISC 360-16 Commentary §I3.2.",
         code_ref="AISC 360-16 §I3.2"
     )
-    steps = []
-    step_num = 1
     
-    # Concrete modulus
-    Ec = 4700 * math.sqrt(fc)
-    n = E / Ec
+    # Concrete modulus and modular ratio
+    if concrete is not None:
+        Ec, n = concrete.Ec, concrete.n
+    else:
+        Ec = _concrete_modulus(fc)
+        n = E / Ec
     t_above = tc - hr
     
+    # Composite ratio
+    Qn = Qn_total * N_TO_KN  # kN
+    C_full = min(Ts, Cc_max)
+    comp_ratio = min(Qn / C_full, 1.0) if C_full > 0 else 1.0
+    
+    (Atr, y_steel, y_conc, y_bar_from_top_steel, Ic,
+     d_steel, d_conc, Itr, Ieff) = _transformed_section_core(
+        float(d), float(A), float(Ix), float(beff), float(t_above), float(hr),
+        float(n), float(comp_ratio)
+    )
+    
+    section.conclusion = f"Lower-bound Ieff = {Ieff/1e6:.2f}×10⁶ mm⁴ for {comp_ratio*100:.0f}% composite action"
+    results = StiffnessResult(n, Atr, y_bar_from_top_steel, Itr, Ieff, comp_ratio)
+    if not verbose:
+        return section, results
+    
+    steps = []
+    step_num = 1
+    
     # Step 1: Modular ratio
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Modular Ratio",
-        description="Ratio of steel to concrete elastic moduli.",
-        equation="n = Es / Ec",
-        substitution=f"n = {E:.0f} / {Ec:.0f} = {n:.2f}",
-        result=n,
-        unit="",
-        code_ref="AISC 360-16 §I2"
+        step_num,
+        "Modular Ratio",
+        "Ratio of steel to concrete elastic moduli.",
+        "n = Es / Ec",
+        ("n = {:.0f} / {:.0f} = {:.2f}", (E, Ec, n)),
+        n,
+        "",
+        "AISC 360-16 §I2"
     ))
     step_num += 1
     
     # Step 2: Transformed concrete area
-    Ac = beff * t_above  # Concrete area above deck
-    Atr = Ac / n  # Transformed area
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Transformed Concrete Area",
-        description="Concrete area transformed to equivalent steel area.",
-        equation="Atr = Ac / n = (beff × t_above) / n",
-        substitution=f"Atr = ({beff:.0f} × {t_above:.0f}) / {n:.2f} = {Atr:.0f} mm²",
-        result=Atr,
-        unit="mm²",
-        code_ref="Elastic theory"
+        step_num,
+        "Transformed Concrete Area",
+        "Concrete area transformed to equivalent steel area.",
+        "Atr = Ac / n = (beff × t_above) / n",
+        ("Atr = ({:.0f} × {:.0f}) / {:.2f} = {:.0f} mm²", (beff, t_above, n, Atr)),
+        Atr,
+        "mm²",
+        "Elastic theory"
     ))
     step_num += 1
     
     # Step 3: Full composite elastic neutral axis from top of steel
-    # Taking moments about top of steel
-    # y_bar × (A + Atr) = A × (d/2) + Atr × (-hr - t_above/2)
-    # Note: negative means above top of steel
-    
-    y_steel = d / 2  # Distance from top of steel to centroid of steel
-    y_conc = -(hr + t_above/2)  # Distance from top of steel to centroid of concrete (negative = above)
-    
-    y_bar_from_top_steel = (A * y_steel + Atr * y_conc) / (A + Atr)
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Full Composite NA Location",
-        description="Location of elastic neutral axis for full composite section, measured from top of steel flange.",
-        equation="ȳ = (As×ys + Atr×yc) / (As + Atr)",
-        substitution=f"ȳ = ({A:.0f}×{y_steel:.1f} + {Atr:.0f}×{y_conc:.1f}) / ({A:.0f} + {Atr:.0f}) = {y_bar_from_top_steel:.2f} mm",
-        result=y_bar_from_top_steel,
-        unit="mm from top of steel",
-        code_ref="Elastic theory",
-        notes="Negative = NA above top of steel"
+        step_num,
+        "Full Composite NA Location",
+        "Location of elastic neutral axis for full composite section, measured from top of steel flange.",
+        "ȳ = (As×ys + Atr×yc) / (As + Atr)",
+        ("ȳ = ({:.0f}×{:.1f} + {:.0f}×{:.1f}) / ({:.0f} + {:.0f}) = {:.2f} mm", (A, y_steel, Atr, y_conc, A, Atr, y_bar_from_top_steel)),
+        y_bar_from_top_steel,
+        "mm from top of steel",
+        "Elastic theory",
+        "INFO",
+        "Negative = NA above top of steel"
     ))
     step_num += 1
     
     # Step 4: Full composite moment of inertia using parallel axis theorem
-    # Itr = Ix + A×(d/2 - y_bar)² + (beff×t_above³/12)/n + Atr×(y_conc - y_bar)²
-    
-    Ic = beff * t_above**3 / 12 / n  # Moment of inertia of transformed concrete about its own centroid
-    
-    d_steel = y_steel - y_bar_from_top_steel  # Distance from steel centroid to composite NA
-    d_conc = y_conc - y_bar_from_top_steel   # Distance from concrete centroid to composite NA
-    
-    Itr = Ix + A * d_steel**2 + Ic + Atr * d_conc**2
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Full Composite Moment of Inertia",
-        description="Transformed moment of inertia for full composite section using parallel axis theorem.",
-        equation="Itr = Ix + As×ds² + Ic + Atr×dc²",
-        substitution=f"Itr = {Ix/1e6:.2f}×10⁶ + {A:.0f}×{d_steel:.1f}² + {Ic/1e6:.4f}×10⁶ + {Atr:.0f}×{d_conc:.1f}² = {Itr/1e6:.2f}×10⁶ mm⁴",
-        result=Itr,
-        unit="mm⁴",
-        code_ref="Elastic theory"
+        step_num,
+        "Full Composite Moment of Inertia",
+        "Transformed moment of inertia for full composite section using parallel axis theorem.",
+        "Itr = Ix + As×ds² + Ic + Atr×dc²",
+        ("Itr = {:.2f}×10⁶ + {:.0f}×{:.1f}² + {:.4f}×10⁶ + {:.0f}×{:.1f}² = {:.2f}×10⁶ mm⁴", (Ix/1e6, A, d_steel, Ic/1e6, Atr, d_conc, Itr/1e6)),
+        Itr,
+        "mm⁴",
+        "Elastic theory"
     ))
     step_num += 1
     
     # Step 5: Composite ratio
-    Qn = Qn_total / 1000  # kN
-    C_full = min(Ts, Cc_max)
-    comp_ratio = min(Qn / C_full, 1.0) if C_full > 0 else 1.0
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Composite Ratio",
-        description="Ratio of actual shear connector capacity to that required for full composite action.",
-        equation="η = ΣQn / min(Ts, Cc)",
-        substitution=f"η = {Qn:.1f} / min({Ts:.1f}, {Cc_max:.1f}) = {Qn:.1f} / {C_full:.1f} = {comp_ratio:.3f}",
-        result=comp_ratio,
-        unit="",
-        code_ref="AISC 360-16 §I3.2d"
+        step_num,
+        "Composite Ratio",
+        "Ratio of actual shear connector capacity to that required for full composite action.",
+        "η = ΣQn / min(Ts, Cc)",
+        ("η = {:.1f} / min({:.1f}, {:.1f}) = {:.1f} / {:.1f} = {:.3f}", (Qn, Ts, Cc_max, Qn, C_full, comp_ratio)),
+        comp_ratio,
+        "",
+        "AISC 360-16 §I3.2d"
     ))
     step_num += 1
     
     # Step 6: Lower-bound moment of inertia per AISC Commentary
-    # Ieff = Ix + √(η) × (Itr - Ix)
-    
-    Ieff = Ix + math.sqrt(comp_ratio) * (Itr - Ix)
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Lower-Bound Effective Moment of Inertia",
-        description="The effective moment of inertia accounting for partial composite action. This lower-bound value is used for serviceability (deflection) calculations.",
-        equation="Ieff = Ix + √η × (Itr - Ix)",
-        substitution=f"Ieff = {Ix/1e6:.2f}×10⁶ + √{comp_ratio:.3f} × ({Itr/1e6:.2f}×10⁶ - {Ix/1e6:.2f}×10⁶) = {Ieff/1e6:.2f}×10⁶ mm⁴",
-        result=Ieff,
-        unit="mm⁴",
-        code_ref="AISC 360-16 Commentary §I3.2",
-        notes=f"Effective I is {Ieff/Ix:.2f}× steel Ix"
+        step_num,
+        "Lower-Bound Effective Moment of Inertia",
+        "The effective moment of inertia accounting for partial composite action. This lower-bound value is used for serviceability (deflection) calculations.",
+        "Ieff = Ix + √η × (Itr - Ix)",
+        ("Ieff = {:.2f}×10⁶ + √{:.3f} × ({:.2f}×10⁶ - {:.2f}×10⁶) = {:.2f}×10⁶ mm⁴", (Ix/1e6, comp_ratio, Itr/1e6, Ix/1e6, Ieff/1e6)),
+        Ieff,
+        "mm⁴",
+        "AISC 360-16 Commentary §I3.2",
+        "INFO",
+        f"Effective I is {Ieff/Ix:.2f}× steel Ix"
     ))
     
     section.steps = steps
-    section.conclusion = f"Lower-bound Ieff = {Ieff/1e6:.2f}×10⁶ mm⁴ for {comp_ratio*100:.0f}% composite action"
-    section.status = "PASS"
-    
-    results = {
-        'n': n,
-        'Atr': Atr,
-        'y_bar': y_bar_from_top_steel,
-        'Itr': Itr,
-        'Ieff': Ieff,
-        'comp_ratio': comp_ratio
-    }
     
     return section, results
 
 
+def calc_effective_Itr_batch(
+    d: np.ndarray, A: np.ndarray, Ix: np.ndarray,
+    beff: np.ndarray, tc: np.ndarray, hr: np.ndarray,
+    fc: np.ndarray, E: np.ndarray,
+    Qn_total: np.ndarray,
+    Ts: np.ndarray, Cc_max: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized lower-bound moment of inertia for many candidate beams at
+    once, e.g. with Ts and Cc_max from calc_composite_flexure_batch.
+    
+    Same arithmetic as calc_effective_Itr_detailed, evaluated with NumPy
+    with no calculation steps. The steel and transformed concrete areas are
+    stacked on a trailing axis of length 2, so the centroid and the
+    parallel-axis terms are formed in one pass each. Inputs broadcast
+    against each other.
+    
+    Parameters:
+        d, A, Ix: Steel section properties
+        beff, tc, hr: Slab geometry
+        fc, E: Material properties
+        Qn_total: Total stud capacity (N)
+        Ts: Steel tensile capacity (kN)
+        Cc_max: Max concrete compression (kN)
+    
+    Returns:
+        Dict of arrays: n, Atr (mm²), y_bar (mm), Itr, Ieff (mm⁴), comp_ratio
+    """
+    d, A, Ix, beff, tc, hr, fc, E, Qn_total, Ts, Cc_max = (
+        np.asarray(x, dtype=np.float64)
+        for x in (d, A, Ix, beff, tc, hr, fc, E, Qn_total, Ts, Cc_max)
+    )
+    n = E / (4700 * np.sqrt(fc))
+    t_above = tc - hr
+    Atr = beff * t_above / n
+    
+    # (steel, concrete) pairs: areas and centroids from the top of steel
+    areas = np.stack(np.broadcast_arrays(A, Atr), axis=-1)
+    ys = np.stack(np.broadcast_arrays(d / 2, -(hr + t_above/2)), axis=-1)
+    y_bar = (areas * ys).sum(axis=-1) / areas.sum(axis=-1)
+    
+    # Parallel-axis terms As×ds² and Atr×dc², added in the scalar order
+    Ic = beff * (t_above * t_above * t_above) / 12 / n
+    transfer = areas * (ys - y_bar[..., np.newaxis])**2
+    Itr = Ix + transfer[..., 0] + Ic + transfer[..., 1]
+    
+    Qn = Qn_total * N_TO_KN
+    C_full = np.minimum(Ts, Cc_max)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        comp_ratio = np.where(C_full > 0, np.minimum(Qn / C_full, 1.0), 1.0)
+    Ieff = Ix + np.sqrt(comp_ratio) * (Itr - Ix)
+    
+    return {
+        'n': n, 'Atr': Atr, 'y_bar': y_bar,
+        'Itr': Itr, 'Ieff': Ieff, 'comp_ratio': comp_ratio
+    }
+
+
 # =============================================================================
 # SECTION 7: DEFLECTION CALCULATIONS
 # =============================================================================
@@ -1322,7 +1749,8 @@ def calc_deflection_detailed(
     E: float,
     w_DL: float, w_SDL: float, w_LL: float,
     defl_limit_LL: float = 360,
-    defl_limit_total: float = 240
+    defl_limit_total: float = 240,
+    verbose: bool = True
 ) -> Tuple[DetailedCalcSection, Dict]:
     """
     Calculate deflections for composite beam.
@@ -1337,6 +1765,8 @@ def calc_deflection_detailed(
         w_LL: Live load (kN/m) - after composite
         defl_limit_LL: Span/limit for live load (default L/360)
         defl_limit_total: Span/limit for total (default L/240)
+        verbose: If False, skip the calculation steps and return the
+                 results with the conclusion only
     """
     section = DetailedCalcSection(
         section_number=7,
@@ -1344,133 +1774,192 @@ def calc_deflection_detailed(
         description="Calculate beam deflections and compare to serviceability limits per IBC/AISC requirements.",
         code_ref="IBC Table 1604.3"
     )
-    steps = []
-    step_num = 1
     
     # Convert w from kN/m to N/mm for deflection formula
     # δ = 5wL⁴/(384EI) where w is in N/mm, L in mm, E in MPa, I in mm⁴
-    
-    # Step 1: Pre-composite deflection (DL only, using steel Ix)
     w_DL_Nmm = w_DL  # kN/m = N/mm
-    delta_DL = 5 * w_DL_Nmm * L**4 / (384 * E * Ix)
+    w_SDL_Nmm = w_SDL
+    w_LL_Nmm = w_LL
     
+    # Pre-composite DL on the steel Ix; SDL and LL on the composite Ieff.
+    # L⁴ and 384×E×Ieff are shared by the three deflections
+    L4 = L**4
+    denom_eff = 384 * E * Ieff
+    delta_DL = 5 * w_DL_Nmm * L4 / (384 * E * Ix)
+    delta_SDL = 5 * w_SDL_Nmm * L4 / denom_eff
+    delta_LL = 5 * w_LL_Nmm * L4 / denom_eff
+    delta_total = delta_DL + delta_SDL + delta_LL
+    
+    delta_limit_LL_val = L / defl_limit_LL
+    DCR_LL = delta_LL / delta_limit_LL_val
+    status_LL = "PASS" if DCR_LL <= 1.0 else "FAIL"
+    delta_limit_total_val = L / defl_limit_total
+    DCR_total = delta_total / delta_limit_total_val
+    status_total = "PASS" if DCR_total <= 1.0 else "FAIL"
+    
+    section.conclusion = f"δLL = {delta_LL:.2f} mm (D/C = {DCR_LL:.3f}), δtotal = {delta_total:.2f} mm (D/C = {DCR_total:.3f})"
+    section.status = "PASS" if status_LL == "PASS" and status_total == "PASS" else "FAIL"
+    results = {
+        'delta_DL': delta_DL,
+        'delta_SDL': delta_SDL,
+        'delta_LL': delta_LL,
+        'delta_total': delta_total,
+        'delta_limit_LL': delta_limit_LL_val,
+        'delta_limit_total': delta_limit_total_val,
+        'DCR_LL': DCR_LL,
+        'DCR_total': DCR_total,
+        'status_LL': status_LL,
+        'status_total': status_total
+    }
+    if not verbose:
+        return section, results
+    
+    steps = []
+    step_num = 1
+    
+    # Step 1: Pre-composite deflection (DL only, using steel Ix)
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Pre-Composite Dead Load Deflection",
-        description="Deflection under dead load (wet concrete + beam) before composite action is achieved. Uses steel section Ix only.",
-        equation="δDL = 5 × wDL × L⁴ / (384 × E × Ix)",
-        substitution=f"δDL = 5 × {w_DL_Nmm:.3f} × {L:.0f}⁴ / (384 × {E:.0f} × {Ix/1e6:.2f}×10⁶) = {delta_DL:.2f} mm",
-        result=delta_DL,
-        unit="mm",
-        code_ref="AISC DG3",
-        notes="Pre-composite stage - steel beam alone"
+        step_num,
+        "Pre-Composite Dead Load Deflection",
+        "Deflection under dead load (wet concrete + beam) before composite action is achieved. Uses steel section Ix only.",
+        "δDL = 5 × wDL × L⁴ / (384 × E × Ix)",
+        ("δDL = 5 × {:.3f} × {:.0f}⁴ / (384 × {:.0f} × {:.2f}×10⁶) = {:.2f} mm",
+         (w_DL_Nmm, L, E, Ix/1e6, delta_DL)),
+        delta_DL,
+        "mm",
+        "AISC DG3",
+        "INFO",
+        "Pre-composite stage - steel beam alone"
     ))
     step_num += 1
     
     # Step 2: Post-composite SDL deflection
-    w_SDL_Nmm = w_SDL
-    delta_SDL = 5 * w_SDL_Nmm * L**4 / (384 * E * Ieff)
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Post-Composite Superimposed Dead Load Deflection",
-        description="Deflection under superimposed dead loads (finishes, partitions, MEP) after composite action. Uses effective Ieff.",
-        equation="δSDL = 5 × wSDL × L⁴ / (384 × E × Ieff)",
-        substitution=f"δSDL = 5 × {w_SDL_Nmm:.3f} × {L:.0f}⁴ / (384 × {E:.0f} × {Ieff/1e6:.2f}×10⁶) = {delta_SDL:.2f} mm",
-        result=delta_SDL,
-        unit="mm",
-        code_ref="AISC DG3",
-        notes="Post-composite stage - uses lower-bound Ieff"
+        step_num,
+        "Post-Composite Superimposed Dead Load Deflection",
+        "Deflection under superimposed dead loads (finishes, partitions, MEP) after composite action. Uses effective Ieff.",
+        "δSDL = 5 × wSDL × L⁴ / (384 × E × Ieff)",
+        ("δSDL = 5 × {:.3f} × {:.0f}⁴ / (384 × {:.0f} × {:.2f}×10⁶) = {:.2f} mm",
+         (w_SDL_Nmm, L, E, Ieff/1e6, delta_SDL)),
+        delta_SDL,
+        "mm",
+        "AISC DG3",
+        "INFO",
+        "Post-composite stage - uses lower-bound Ieff"
     ))
     step_num += 1
     
     # Step 3: Live load deflection
-    w_LL_Nmm = w_LL
-    delta_LL = 5 * w_LL_Nmm * L**4 / (384 * E * Ieff)
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Live Load Deflection",
-        description="Deflection under service live load using effective moment of inertia.",
-        equation="δLL = 5 × wLL × L⁴ / (384 × E × Ieff)",
-        substitution=f"δLL = 5 × {w_LL_Nmm:.3f} × {L:.0f}⁴ / (384 × {E:.0f} × {Ieff/1e6:.2f}×10⁶) = {delta_LL:.2f} mm",
-        result=delta_LL,
-        unit="mm",
-        code_ref="AISC DG3"
+        step_num,
+        "Live Load Deflection",
+        "Deflection under service live load using effective moment of inertia.",
+        "δLL = 5 × wLL × L⁴ / (384 × E × Ieff)",
+        ("δLL = 5 × {:.3f} × {:.0f}⁴ / (384 × {:.0f} × {:.2f}×10⁶) = {:.2f} mm",
+         (w_LL_Nmm, L, E, Ieff/1e6, delta_LL)),
+        delta_LL,
+        "mm",
+        "AISC DG3"
     ))
     step_num += 1
     
     # Step 4: Total deflection
-    delta_total = delta_DL + delta_SDL + delta_LL
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Total Deflection",
-        description="Sum of all deflection components.",
-        equation="δtotal = δDL + δSDL + δLL",
-        substitution=f"δtotal = {delta_DL:.2f} + {delta_SDL:.2f} + {delta_LL:.2f} = {delta_total:.2f} mm",
-        result=delta_total,
-        unit="mm",
-        code_ref=""
+        step_num,
+        "Total Deflection",
+        "Sum of all deflection components.",
+        "δtotal = δDL + δSDL + δLL",
+        ("δtotal = {:.2f} + {:.2f} + {:.2f} = {:.2f} mm", (delta_DL, delta_SDL, delta_LL, delta_total)),
+        delta_total,
+        "mm",
+        ""
     ))
     step_num += 1
     
     # Step 5: Live load deflection limit
-    delta_limit_LL_val = L / defl_limit_LL
-    DCR_LL = delta_LL / delta_limit_LL_val
-    status_LL = "PASS" if DCR_LL <= 1.0 else "FAIL"
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Live Load Deflection Check",
-        description=f"Check live load deflection against L/{defl_limit_LL} limit.",
-        equation=f"δLL ≤ L/{defl_limit_LL}",
-        substitution=f"δLL = {delta_LL:.2f} mm vs L/{defl_limit_LL} = {L:.0f}/{defl_limit_LL} = {delta_limit_LL_val:.2f} mm",
-        result=DCR_LL,
-        unit="D/C",
-        code_ref="IBC Table 1604.3",
-        status=status_LL,
-        notes=f"D/C = {DCR_LL:.3f} {'≤ 1.0 OK' if DCR_LL <= 1.0 else '> 1.0 NG'}"
+        step_num,
+        "Live Load Deflection Check",
+        f"Check live load deflection against L/{defl_limit_LL} limit.",
+        f"δLL ≤ L/{defl_limit_LL}",
+        ("δLL = {:.2f} mm vs L/{} = {:.0f}/{} = {:.2f} mm",
+         (delta_LL, defl_limit_LL, L, defl_limit_LL, delta_limit_LL_val)),
+        DCR_LL,
+        "D/C",
+        "IBC Table 1604.3",
+        status_LL,
+        f"D/C = {DCR_LL:.3f} {'≤ 1.0 OK' if DCR_LL <= 1.0 else '> 1.0 NG'}"
     ))
     step_num += 1
     
     # Step 6: Total deflection limit
-    delta_limit_total_val = L / defl_limit_total
-    DCR_total = delta_total / delta_limit_total_val
-    status_total = "PASS" if DCR_total <= 1.0 else "FAIL"
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Total Deflection Check",
-        description=f"Check total deflection against L/{defl_limit_total} limit.",
-        equation=f"δtotal ≤ L/{defl_limit_total}",
-        substitution=f"δtotal = {delta_total:.2f} mm vs L/{defl_limit_total} = {L:.0f}/{defl_limit_total} = {delta_limit_total_val:.2f} mm",
-        result=DCR_total,
-        unit="D/C",
-        code_ref="IBC Table 1604.3",
-        status=status_total,
-        notes=f"D/C = {DCR_total:.3f} {'≤ 1.0 OK' if DCR_total <= 1.0 else '> 1.0 NG'}"
+        step_num,
+        "Total Deflection Check",
+        f"Check total deflection against L/{defl_limit_total} limit.",
+        f"δtotal ≤ L/{defl_limit_total}",
+        ("δtotal = {:.2f} mm vs L/{} = {:.0f}/{} = {:.2f} mm",
+         (delta_total, defl_limit_total, L, defl_limit_total, delta_limit_total_val)),
+        DCR_total,
+        "D/C",
+        "IBC Table 1604.3",
+        status_total,
+        f"D/C = {DCR_total:.3f} {'≤ 1.0 OK' if DCR_total <= 1.0 else '> 1.0 NG'}"
     ))
     
     section.steps = steps
-    overall_status = "PASS" if status_LL == "PASS" and status_total == "PASS" else "FAIL"
-    section.conclusion = f"δLL = {delta_LL:.2f} mm (D/C = {DCR_LL:.3f}), δtotal = {delta_total:.2f} mm (D/C = {DCR_total:.3f})"
-    section.status = overall_status
     
-    results = {
-        'delta_DL': delta_DL,
-        'delta_SDL': delta_SDL,
-        'delta_LL': delta_LL,
+    return section, results
+
+
+def calc_deflection_batch(
+    L: np.ndarray,
+    Ix: np.ndarray, Ieff: np.ndarray,
+    E: np.ndarray,
+    w_DL: np.ndarray, w_SDL: np.ndarray, w_LL: np.ndarray,
+    defl_limit_LL: float = 360,
+    defl_limit_total: float = 240
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized deflections for many spans, sections and loads at once.
+    
+    Same arithmetic as calc_deflection_detailed, evaluated with NumPy with
+    no calculation steps. Inputs broadcast against each other. NumPy's
+    vectorized L**4 can round differently from the scalar one, so values
+    may differ from the detailed ones in the last bit.
+    
+    Parameters:
+        L: Span (mm)
+        Ix: Steel moment of inertia (mm⁴)
+        Ieff: Effective composite moment of inertia (mm⁴)
+        E: Elastic modulus (MPa)
+        w_DL, w_SDL, w_LL: Dead, superimposed dead and live load (kN/m)
+        defl_limit_LL: Span/limit for live load (default L/360)
+        defl_limit_total: Span/limit for total (default L/240)
+    
+    Returns:
+        Dict of arrays: delta_DL, delta_SDL, delta_LL, delta_total (mm),
+        DCR_LL, DCR_total, pass_LL, pass_total
+    """
+    L, Ix, Ieff, E, w_DL, w_SDL, w_LL = (
+        np.asarray(x, dtype=np.float64) for x in (L, Ix, Ieff, E, w_DL, w_SDL, w_LL)
+    )
+    L4 = L**4
+    denom_eff = 384 * E * Ieff
+    delta_DL = 5 * w_DL * L4 / (384 * E * Ix)
+    delta_SDL = 5 * w_SDL * L4 / denom_eff
+    delta_LL = 5 * w_LL * L4 / denom_eff
+    delta_total = delta_DL + delta_SDL + delta_LL
+    
+    DCR_LL = delta_LL / (L / defl_limit_LL)
+    DCR_total = delta_total / (L / defl_limit_total)
+    
+    return {
+        'delta_DL': delta_DL, 'delta_SDL': delta_SDL, 'delta_LL': delta_LL,
         'delta_total': delta_total,
-        'delta_limit_LL': delta_limit_LL_val,
-        'delta_limit_total': delta_limit_total_val,
-        'DCR_LL': DCR_LL,
-        'DCR_total': DCR_total,
-        'status_LL': status_LL,
-        'status_total': status_total
+        'DCR_LL': DCR_LL, 'DCR_total': DCR_total,
+        'pass_LL': DCR_LL <= 1.0, 'pass_total': DCR_total <= 1.0
     }
-    
-    return section, results
 
 
 # =============================================================================
@@ -1480,7 +1969,8 @@ def calc_deflection_detailed(
 def calc_demand_capacity_detailed(
     Mu: float, Vu: float,
     phi_Mn: float, phi_Vn: float,
-    method: str = "LRFD"
+    method: str = "LRFD",
+    verbose: bool = True
 ) -> Tuple[DetailedCalcSection, Dict]:
     """
     Calculate demand-to-capacity ratios for strength checks.
@@ -1491,6 +1981,8 @@ def calc_demand_capacity_detailed(
         phi_Mn: Design flexural strength (kN⋅m)
         phi_Vn: Design shear strength (kN)
         method: "LRFD" or "ASD"
+        verbose: If False, skip the calculation steps and return the
+                 results with the conclusion only
     """
     section = DetailedCalcSection(
         section_number=8,
@@ -1498,85 +1990,85 @@ def calc_demand_capacity_detailed(
         description="Verify that the composite beam has adequate strength for the applied loads.",
         code_ref="AISC 360-16 Chapter B"
     )
+    DCR_flex = Mu / phi_Mn if phi_Mn > 0 else 999
+    status_flex = "PASS" if DCR_flex <= 1.0 else "FAIL"
+    DCR_shear = Vu / phi_Vn if phi_Vn > 0 else 999
+    status_shear = "PASS" if DCR_shear <= 1.0 else "FAIL"
+    
+    section.conclusion = f"Flexure D/C = {DCR_flex:.3f} ({status_flex}), Shear D/C = {DCR_shear:.3f} ({status_shear})"
+    section.status = "PASS" if status_flex == "PASS" and status_shear == "PASS" else "FAIL"
+    results = {
+        'Mu': Mu,
+        'Vu': Vu,
+        'phi_Mn': phi_Mn,
+        'phi_Vn': phi_Vn,
+        'DCR_flex': DCR_flex,
+        'DCR_shear': DCR_shear,
+        'status_flex': status_flex,
+        'status_shear': status_shear
+    }
+    if not verbose:
+        return section, results
+    
     steps = []
     step_num = 1
     
     # Step 1: Required flexural strength
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Required Flexural Strength",
-        description=f"The required flexural strength from structural analysis using {'LRFD' if method == 'LRFD' else 'ASD'} load combinations.",
-        equation=f"{'Mu' if method == 'LRFD' else 'Ma'} = factored moment from analysis",
-        substitution=f"{'Mu' if method == 'LRFD' else 'Ma'} = {Mu:.2f} kN⋅m",
-        result=Mu,
-        unit="kN⋅m",
-        code_ref="ASCE 7-22 Load Combinations"
+        step_num,
+        "Required Flexural Strength",
+        f"The required flexural strength from structural analysis using {'LRFD' if method == 'LRFD' else 'ASD'} load combinations.",
+        f"{'Mu' if method == 'LRFD' else 'Ma'} = factored moment from analysis",
+        ("{} = {:.2f} kN⋅m", ('Mu' if method == 'LRFD' else 'Ma', Mu)),
+        Mu,
+        "kN⋅m",
+        "ASCE 7-22 Load Combinations"
     ))
     step_num += 1
     
     # Step 2: Required shear strength
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Required Shear Strength",
-        description=f"The required shear strength from structural analysis using {'LRFD' if method == 'LRFD' else 'ASD'} load combinations.",
-        equation=f"{'Vu' if method == 'LRFD' else 'Va'} = factored shear from analysis",
-        substitution=f"{'Vu' if method == 'LRFD' else 'Va'} = {Vu:.2f} kN",
-        result=Vu,
-        unit="kN",
-        code_ref="ASCE 7-22 Load Combinations"
+        step_num,
+        "Required Shear Strength",
+        f"The required shear strength from structural analysis using {'LRFD' if method == 'LRFD' else 'ASD'} load combinations.",
+        f"{'Vu' if method == 'LRFD' else 'Va'} = factored shear from analysis",
+        ("{} = {:.2f} kN", ('Vu' if method == 'LRFD' else 'Va', Vu)),
+        Vu,
+        "kN",
+        "ASCE 7-22 Load Combinations"
     ))
     step_num += 1
     
     # Step 3: Flexural strength check
-    DCR_flex = Mu / phi_Mn if phi_Mn > 0 else 999
-    status_flex = "PASS" if DCR_flex <= 1.0 else "FAIL"
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Flexural Strength Check",
-        description="Verify that the design flexural strength exceeds the required flexural strength.",
-        equation=f"{'Mu ≤ φMn' if method == 'LRFD' else 'Ma ≤ Mn/Ω'}",
-        substitution=f"D/C = {Mu:.2f} / {phi_Mn:.2f} = {DCR_flex:.3f}",
-        result=DCR_flex,
-        unit="",
-        code_ref="AISC 360-16 §B3.1",
-        status=status_flex,
-        notes=f"{'✓ OK' if DCR_flex <= 1.0 else '✗ NG'} - D/C = {DCR_flex:.3f}"
+        step_num,
+        "Flexural Strength Check",
+        "Verify that the design flexural strength exceeds the required flexural strength.",
+        f"{'Mu ≤ φMn' if method == 'LRFD' else 'Ma ≤ Mn/Ω'}",
+        ("D/C = {:.2f} / {:.2f} = {:.3f}", (Mu, phi_Mn, DCR_flex)),
+        DCR_flex,
+        "",
+        "AISC 360-16 §B3.1",
+        status_flex,
+        f"{'✓ OK' if DCR_flex <= 1.0 else '✗ NG'} - D/C = {DCR_flex:.3f}"
     ))
     step_num += 1
     
     # Step 4: Shear strength check
-    DCR_shear = Vu / phi_Vn if phi_Vn > 0 else 999
-    status_shear = "PASS" if DCR_shear <= 1.0 else "FAIL"
-    
     steps.append(DetailedCalcStep(
-        step_number=step_num,
-        title="Shear Strength Check",
-        description="Verify that the design shear strength exceeds the required shear strength.",
-        equation=f"{'Vu ≤ φVn' if method == 'LRFD' else 'Va ≤ Vn/Ω'}",
-        substitution=f"D/C = {Vu:.2f} / {phi_Vn:.2f} = {DCR_shear:.3f}",
-        result=DCR_shear,
-        unit="",
-        code_ref="AISC 360-16 §B3.1",
-        status=status_shear,
-        notes=f"{'✓ OK' if DCR_shear <= 1.0 else '✗ NG'} - D/C = {DCR_shear:.3f}"
+        step_num,
+        "Shear Strength Check",
+        "Verify that the design shear strength exceeds the required shear strength.",
+        f"{'Vu ≤ φVn' if method == 'LRFD' else 'Va ≤ Vn/Ω'}",
+        ("D/C = {:.2f} / {:.2f} = {:.3f}", (Vu, phi_Vn, DCR_shear)),
+        DCR_shear,
+        "",
+        "AISC 360-16 §B3.1",
+        status_shear,
+        f"{'✓ OK' if DCR_shear <= 1.0 else '✗ NG'} - D/C = {DCR_shear:.3f}"
     ))
     
     section.steps = steps
-    overall_status = "PASS" if status_flex == "PASS" and status_shear == "PASS" else "FAIL"
-    section.conclusion = f"Flexure D/C = {DCR_flex:.3f} ({status_flex}), Shear D/C = {DCR_shear:.3f} ({status_shear})"
-    section.status = overall_status
-    
-    results = {
-        'Mu': Mu,
-        'Vu': Vu,
-        'phi_Mn': phi_Mn,
-        'phi_Vn': phi_Vn,
-        'DCR_flex': DCR_flex,
-        'DCR_shear': DCR_shear,
-        'status_flex': status_flex,
-        'status_shear': status_shear
-    }
     
     return section, results
 
@@ -1585,6 +2077,51 @@ def calc_demand_capacity_detailed(
 # MASTER FUNCTION: COMPLETE COMPOSITE BEAM DESIGN
 # =============================================================================
 
+def evaluate_composite_beam(
+    d: float, bf: float, tf: float, tw: float,
+    A: float, Ix: float, Zx: float,
+    beff: float, tc: float, hr: float,
+    fc: float, Fy: float, E: float = 200000,
+    Qn_total: float = 0,
+    method: str = "LRFD"
+) -> Dict[str, float]:
+    """
+    Numeric flexure, shear and lower-bound stiffness of one composite beam
+    in a single pass, with no report. Each quantity is computed once and
+    shared: t_above, Ts, Cc_max and the composite ratio from the flexure
+    kernel feed the transformed section, and Ec is taken once for n.
+    
+    Same arithmetic as the flexure, shear and Itr detailed functions
+    (units as for design_composite_detailed), which remain the report path.
+    
+    Returns:
+        Dict: t_above (mm), Ec (MPa), n, Atr (mm²), Ts, Cc_max, Qn, C (kN),
+        a (mm), comp_ratio, Mn, phi_Mn (kN·m), Aw (mm²), Cv1, Vn,
+        phi_Vn (kN), Itr, Ieff (mm⁴)
+    """
+    (t_above, Ts, Cc_max, Qn, C, comp_ratio, a, pna_code,
+     Cc, Cs, As_comp, y_steel, d1, Mn) = _composite_flexure_core(
+        float(d), float(bf), float(tf), float(tw), float(A), float(Zx), float(beff),
+        float(tc), float(hr), float(fc), float(Fy), float(Qn_total)
+    )
+    Aw, lambda_w, limit_1, limit_2, Cv1, Vn = _composite_shear_core(d, tw, Fy, E)
+    Ec = _concrete_modulus(fc)
+    n = E / Ec
+    Atr, _, _, _, _, _, _, Itr, Ieff = _transformed_section_core(
+        float(d), float(A), float(Ix), float(beff), float(t_above), float(hr),
+        float(n), float(comp_ratio)
+    )
+    return {
+        't_above': t_above, 'Ec': Ec, 'n': n, 'Atr': Atr,
+        'Ts': Ts, 'Cc_max': Cc_max, 'Qn': Qn, 'C': C, 'a': a,
+        'comp_ratio': comp_ratio,
+        'Mn': Mn, 'phi_Mn': _design_strength(Mn, method, _FLEXURE_DESIGN)[0],
+        'Aw': Aw, 'Cv1': Cv1, 'Vn': Vn,
+        'phi_Vn': _design_strength(Vn, method, _SHEAR_DESIGN)[0],
+        'Itr': Itr, 'Ieff': Ieff
+    }
+
+
 def design_composite_detailed(
     # Steel section
     section_name: str,
@@ -1601,11 +2138,19 @@ def design_composite_detailed(
     # Geometry
     L: float = 0,
     # Method
-    method: str = "LRFD"
+    method: str = "LRFD",
+    verbose: bool = True,
+    detail_level: str = "full"
 ) -> CompositeDesignReport:
     """
     Complete composite beam design with detailed professional calculations.
     
+    With verbose=False (or detail_level="summary") every section skips its
+    calculation steps, for sweeps that only need the numeric results and
+    statuses; the conclusions and the summary table are still built.
+    detail_level="none" also skips the summary table, for optimization
+    loops that only read the section statuses and overall_status.
+    
     Parameters:
         section_name: Steel section designation (e.g., "W16x31")
         d, bf, tf, tw: Section dimensions (mm)
@@ -1619,10 +2164,14 @@ def design_composite_detailed(
         w_DL, w_SDL, w_LL: Loads (kN/m)
         L: Span (mm)
         method: "LRFD" or "ASD"
+        verbose: If False, build the sections without calculation steps
+        detail_level: "full", "summary" (as verbose=False) or "none"
+                      (no steps and no summary table)
     
     Returns:
         CompositeDesignReport with all detailed calculations
     """
+    verbose = verbose and detail_level == "full"
     
     report = CompositeDesignReport(
         project_info={'method': method},
@@ -1631,35 +2180,38 @@ def design_composite_detailed(
     
     # Section 1: Steel properties
     sec1 = calc_steel_section_properties_detailed(
-        section_name, d, bf, tf, tw, A, Ix, Sx, Zx, Fy, E
+        section_name, d, bf, tf, tw, A, Ix, Sx, Zx, Fy, E, verbose
     )
     report.add_section(sec1)
     
     # Section 2: Concrete properties
-    sec2, conc_props = calc_concrete_properties_detailed(fc, tc, hr, wr=50)
+    sec2, conc_props = calc_concrete_properties_detailed(
+        fc, tc, hr, wr=50, verbose=verbose, Es=E
+    )
     report.add_section(sec2)
     
     # Section 3: Composite flexural strength (with PNA!)
     sec3, flex_results = calc_composite_flexure_detailed(
-        d, bf, tf, tw, A, Zx, beff, tc, hr, fc, Fy, E, Qn_total, method
+        d, bf, tf, tw, A, Zx, beff, tc, hr, fc, Fy, E, Qn_total, method, verbose
     )
     report.add_section(sec3)
     
     # Section 4: Shear strength
-    sec4, shear_results = calc_composite_shear_detailed(d, tw, Fy, E, method)
+    sec4, shear_results = calc_composite_shear_detailed(d, tw, Fy, E, method, verbose)
     report.add_section(sec4)
     
     # Section 5: Effective moment of inertia
     sec5, Ieff_results = calc_effective_Itr_detailed(
         d, A, Ix, beff, tc, hr, fc, E,
-        Qn_total, flex_results['Ts'], flex_results['Cc_max']
+        Qn_total, flex_results.Ts, flex_results.Cc_max,
+        verbose, conc_props
     )
     report.add_section(sec5)
     
     # Section 6: Deflection
     if L > 0:
         sec6, defl_results = calc_deflection_detailed(
-            L, Ix, Ieff_results['Ieff'], E, w_DL, w_SDL, w_LL
+            L, Ix, Ieff_results.Ieff, E, w_DL, w_SDL, w_LL, verbose=verbose
         )
         report.add_section(sec6)
     
@@ -1671,16 +2223,139 @@ def design_composite_detailed(
         Vu = w_u * L / 2 / 1000    # kN
         
         sec7, dc_results = calc_demand_capacity_detailed(
-            Mu, Vu, flex_results['phi_Mn'], shear_results['phi_Vn'], method
+            Mu, Vu, flex_results.phi_Mn, shear_results.phi_Vn, method, verbose
         )
         report.add_section(sec7)
     
     # Generate summary
-    report.summary = _generate_composite_summary(report, section_name, method)
+    if detail_level != "none":
+        report.summary = _generate_composite_summary(report, section_name, method)
     
     return report
 
 
+@dataclass(slots=True)
+class CandidateArrays:
+    """
+    Candidate composite beams for a design sweep, one array per property
+    (structure of arrays); all fields broadcast against each other.
+    Units as for design_composite_detailed.
+    """
+    d: np.ndarray
+    bf: np.ndarray
+    tf: np.ndarray
+    tw: np.ndarray
+    A: np.ndarray
+    Zx: np.ndarray
+    Ix: np.ndarray
+    beff: np.ndarray
+    tc: np.ndarray
+    hr: np.ndarray
+    fc: np.ndarray
+    Fy: np.ndarray
+    E: np.ndarray
+    Qn_total: np.ndarray
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "CandidateArrays":
+        """Build the arrays from one dict per candidate, keyed by field name."""
+        records = list(records)
+        return cls(*(
+            np.array([r[f.name] for r in records], dtype=np.float64)
+            for f in fields(cls)
+        ))
+
+
+# Columns of the _sweep_core output, in order
+_SWEEP_FIELDS = ('Ts', 'Cc_max', 'Qn', 'C', 'a', 'comp_ratio', 'Mn', 'Vn', 'Itr', 'Ieff')
+
+
+@njit(parallel=True, cache=True)
+def _sweep_core(d, bf, tf, tw, A, Zx, Ix, beff, tc, hr, fc, Fy, E, Qn_total, out):
+    """
+    Per-candidate flexure, shear and stiffness loop of design_composite_sweep,
+    spread over the cores by numba (prange releases the GIL). Inputs are
+    1-D float64 arrays of equal length N; results are written in place to
+    out, of shape (N, len(_SWEEP_FIELDS)), so the loop allocates nothing.
+    """
+    for i in prange(d.shape[0]):
+        (t_above, Ts, Cc_max, Qn, C, comp_ratio, a, pna_code,
+         Cc, Cs, As_comp, y_steel, d1, Mn) = _composite_flexure_core(
+            d[i], bf[i], tf[i], tw[i], A[i], Zx[i], beff[i], tc[i], hr[i],
+            fc[i], Fy[i], Qn_total[i]
+        )
+        
+        # Shear, as _composite_shear_core (kv = 5.34, h ≈ d)
+        limit_1, limit_2 = _web_shear_limits(Fy[i], E[i], 5.34)
+        Vn = _web_shear_strength(d[i], tw[i], Fy[i], E[i], limit_1, limit_2, 5.34)[3]
+        
+        n = _concrete_core(fc[i], E[i])[2]
+        Itr, Ieff = _transformed_section_core(
+            d[i], A[i], Ix[i], beff[i], t_above, hr[i], n, comp_ratio
+        )[7:]
+        
+        out[i, 0] = Ts
+        out[i, 1] = Cc_max
+        out[i, 2] = Qn
+        out[i, 3] = C
+        out[i, 4] = a
+        out[i, 5] = comp_ratio
+        out[i, 6] = Mn
+        out[i, 7] = Vn
+        out[i, 8] = Itr
+        out[i, 9] = Ieff
+
+
+def design_composite_sweep(
+    cands: CandidateArrays,
+    method: str = "LRFD",
+    parallel: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Strength and stiffness of many candidate composite beams in one
+    vectorized pass, for picking a design before building the detailed
+    report of the chosen one with design_composite_detailed.
+    
+    Chains calc_composite_flexure_batch, calc_composite_shear_batch and
+    calc_effective_Itr_batch, so each result matches the corresponding
+    detailed function. With parallel=True (and numba installed) the
+    candidates are instead run through the multi-core _sweep_core loop,
+    which calls the same kernels as the detailed functions.
+    
+    Returns:
+        Dict of arrays: Ts, Cc_max, Qn, C (kN), a (mm), comp_ratio, Mn,
+        phi_Mn (kN·m), Vn, phi_Vn (kN), Itr, Ieff (mm⁴)
+    """
+    c = cands
+    if parallel and NUMBA_AVAILABLE:
+        inputs = [np.asarray(getattr(c, f.name), dtype=np.float64) for f in fields(c)]
+        shape = np.broadcast(*inputs).shape
+        cols = [np.ascontiguousarray(x).ravel() for x in np.broadcast_arrays(*inputs)]
+        out = np.empty((cols[0].size, len(_SWEEP_FIELDS)))
+        _sweep_core(*cols, out)
+        res = {k: out[:, j].reshape(shape) for j, k in enumerate(_SWEEP_FIELDS)}
+        res['phi_Mn'] = _design_strength(res['Mn'], method, _FLEXURE_DESIGN)[0]
+        res['phi_Vn'] = _design_strength(res['Vn'], method, _SHEAR_DESIGN)[0]
+        return {k: res[k] for k in ('Ts', 'Cc_max', 'Qn', 'C', 'a', 'comp_ratio', 'Mn',
+                                    'phi_Mn', 'Vn', 'phi_Vn', 'Itr', 'Ieff')}
+    
+    flex = calc_composite_flexure_batch(
+        c.d, c.bf, c.tf, c.tw, c.A, c.Zx, c.beff, c.tc, c.hr, c.fc, c.Fy, c.Qn_total, method
+    )
+    shear = calc_composite_shear_batch(c.d, c.tw, c.Fy, c.E, method)
+    Itr = calc_effective_Itr_batch(
+        c.d, c.A, c.Ix, c.beff, c.tc, c.hr, c.fc, c.E,
+        c.Qn_total, flex['Ts'], flex['Cc_max']
+    )
+    return {
+        'Ts': flex['Ts'], 'Cc_max': flex['Cc_max'], 'Qn': flex['Qn'],
+        'C': flex['C'], 'a': flex['a'], 'comp_ratio': flex['comp_ratio'],
+        'Mn': flex['Mn'], 'phi_Mn': flex['phi_Mn'],
+        'Vn': shear['Vn'], 'phi_Vn': shear['phi_Vn'],
+        'Itr': Itr['Itr'], 'Ieff': Itr['Ieff']
+    }
+
+
 def _generate_composite_summary(report: CompositeDesignReport, beam: str, method: str) -> str:
     """Generate a formatted summary table for the composite beam design."""
     
@@ -1711,50 +2386,66 @@ def _generate_composite_summary(report: CompositeDesignReport, beam: str, method
     return "\n".join(lines)
 
 
-def format_composite_report(report: CompositeDesignReport) -> str:
+def _iter_composite_report_chunks(report: CompositeDesignReport) -> Iterator[str]:
     """
-    Format the complete design report as a text string for display or export.
+    Yield the lines of the composite design report in order, so that it can
+    be joined or written out without building the full list first.
     """
-    lines = []
-    
     # Header
-    lines.append("=" * 80)
-    lines.append("COMPOSITE BEAM DESIGN - DETAILED CALCULATIONS")
-    lines.append("Per AISC 360-16 Specification for Structural Steel Buildings")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append(f"Beam: {report.beam_designation}")
-    lines.append(f"Method: {report.project_info.get('method', 'LRFD')}")
-    lines.append("")
+    yield "=" * 80
+    yield "COMPOSITE BEAM DESIGN - DETAILED CALCULATIONS"
+    yield "Per AISC 360-16 Specification for Structural Steel Buildings"
+    yield "=" * 80
+    yield ""
+    yield f"Beam: {report.beam_designation}"
+    yield f"Method: {report.project_info.get('method', 'LRFD')}"
+    yield ""
     
     # Each section
     for section in report.sections:
-        lines.append("=" * 80)
-        lines.append(f"SECTION {section.section_number}: {section.title}")
-        lines.append(f"Reference: {section.code_ref}")
-        lines.append("-" * 80)
-        lines.append(section.description)
-        lines.append("")
+        yield "=" * 80
+        yield f"SECTION {section.section_number}: {section.title}"
+        yield f"Reference: {section.code_ref}"
+        yield "-" * 80
+        yield section.description
+        yield ""
         
         for step in section.steps:
-            lines.append(f"Step {step.step_number}: {step.title}")
-            lines.append(f"    {step.description}")
-            lines.append(f"    Equation: {step.equation}")
-            lines.append(f"    Substitution: {step.substitution}")
-            lines.append(f"    Result: {step.result:.4f} {step.unit}")
+            yield f"Step {step.step_number}: {step.title}"
+            yield f"    {step.description}"
+            yield f"    Equation: {step.equation}"
+            yield f"    Substitution: {step.rendered_substitution}"
+            yield f"    Result: {step.result:.4f} {step.unit}"
             if step.code_ref:
-                lines.append(f"    Reference: {step.code_ref}")
+                yield f"    Reference: {step.code_ref}"
             if step.status != "INFO":
-                lines.append(f"    Status: {step.status}")
+                yield f"    Status: {step.status}"
             if step.notes:
-                lines.append(f"    Notes: {step.notes}")
-            lines.append("")
+                yield f"    Notes: {step.notes}"
+            yield ""
         
-        lines.append(f"Conclusion: {section.conclusion}")
-        lines.append(f"Section Status: {section.status}")
-        lines.append("")
+        yield f"Conclusion: {section.conclusion}"
+        yield f"Section Status: {section.status}"
+        yield ""
     
     # Summary
-    lines.append(report.summary)
-    
-    return "\n".join(lines)
+    yield report.summary
+
+
+def format_composite_report(report: CompositeDesignReport) -> str:
+    """
+    Format the complete design report as a text string for display or export.
+    """
+    return "\n".join(_iter_composite_report_chunks(report))
+
+
+def write_composite_report(report: CompositeDesignReport, fp: TextIO) -> None:
+    """
+    Write the complete design report to an open text file (or StringIO),
+    line by line. The text is the same as format_composite_report(report).
+    """
+    lines = _iter_composite_report_chunks(report)
+    fp.write(next(lines))
+    for line in lines:
+        fp.write("\n")
+        fp.write(line)
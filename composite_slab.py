@@ -18,9 +18,15 @@ Version: 1.0
 import math
 import numpy as np
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Tuple, Optional, Dict
 from enum import Enum
 
+try:
+    from ._calc_common import njit
+except ImportError:
+    from _calc_common import njit
+
 
 class SpanCondition(Enum):
     """Slab span condition"""
@@ -39,17 +45,17 @@ class FireRating(Enum):
     THREE_HOUR = "3_hour"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConcreteProperties:
-    """Concrete material properties per ACI 318-19"""
+    """Concrete material properties per ACI 318-19, frozen so the derived values can be cached"""
     fc: float                    # Specified compressive strength (MPa)
     wc: float = 2400             # Unit weight (kg/m³), normal weight default
     
-    @property
+    @cached_property
     def is_lightweight(self) -> bool:
         return self.wc < 2160
     
-    @property
+    @cached_property
     def lambda_factor(self) -> float:
         """Lightweight concrete factor λ per ACI 318-19 §19.2.4"""
         if self.wc >= 2160:
@@ -59,18 +65,18 @@ class ConcreteProperties:
         else:
             return 0.85  # Sand-lightweight
     
-    @property
+    @cached_property
     def Ec(self) -> float:
         """Modulus of elasticity per ACI 318-19 §19.2.2 (MPa)"""
         # Ec = wc^1.5 × 0.043 × √f'c  (for wc in kg/m³, fc in MPa)
         return (self.wc ** 1.5) * 0.043 * math.sqrt(self.fc)
     
-    @property
+    @cached_property
     def fr(self) -> float:
         """Modulus of rupture per ACI 318-19 §19.2.3 (MPa)"""
         return 0.62 * self.lambda_factor * math.sqrt(self.fc)
     
-    @property
+    @cached_property
     def beta1(self) -> float:
         """Stress block factor β1 per ACI 318-19 §22.2.2.4.3"""
         if self.fc <= 28:
@@ -81,9 +87,9 @@ class ConcreteProperties:
             return 0.85 - 0.05 * (self.fc - 28) / 7
 
 
-@dataclass
+@dataclass(frozen=True)
 class SlabGeometry:
-    """Composite slab geometry"""
+    """Composite slab geometry, frozen so the derived depths can be cached"""
     tc: float                    # Total slab thickness (mm)
     hr: float                    # Deck rib height (mm)
     wr_top: float               # Rib opening at top (mm)
@@ -92,12 +98,12 @@ class SlabGeometry:
     span: float                 # Clear span (mm)
     span_condition: SpanCondition = SpanCondition.SIMPLE
     
-    @property
+    @cached_property
     def tc_above_deck(self) -> float:
         """Concrete thickness above deck (mm)"""
         return self.tc - self.hr
     
-    @property
+    @cached_property
     def avg_depth(self) -> float:
         """Average slab depth for weight calculation (mm)"""
         # Account for ribs
@@ -105,7 +111,7 @@ class SlabGeometry:
         rib_volume_ratio = rib_area / (self.pitch * self.hr)
         return self.tc_above_deck + self.hr * rib_volume_ratio
     
-    @property
+    @cached_property
     def effective_depth(self) -> float:
         """Effective depth d for flexure (mm) - from top to tension reinforcement"""
         # For composite slab, tension zone is typically at deck level
@@ -192,6 +198,42 @@ class DesignResult:
 # FLEXURAL DESIGN - ACI 318-19 Chapter 7 & 22
 # =============================================================================
 
+@njit(cache=True)
+def _flex_core(tc, d, cover_top, fc, beta1, As_rebar, fy_rebar, As_deck, fy_deck, b, has_deck):
+    """
+    Pure-arithmetic positive moment capacity per ACI 318-19 §22.2,
+    JIT-compiled when numba is available. d is the effective depth to the
+    deck (SlabGeometry.effective_depth). Areas per metre width (mm²/m),
+    stresses in MPa, lengths in mm.
+    
+    Returns:
+        (T_total (N/m), As_total, fy_eq, a, c, Mn (kN·m/m))
+    """
+    # Tension force, with the deck and rebar at their own yield strengths
+    if has_deck:
+        T_total = As_rebar * fy_rebar + As_deck * fy_deck
+        As_total = As_rebar + As_deck
+        fy_eq = T_total / As_total if As_total > 0 else fy_deck
+    else:
+        As_total = As_rebar
+        fy_eq = fy_rebar
+        T_total = As_total * fy_eq
+    
+    # C = T, where C = 0.85×f'c×a×b
+    a = T_total / (0.85 * fc * b) if As_total > 0 else 0.0
+    c = a / beta1
+    
+    if has_deck and As_rebar > 0:
+        # Two layers of reinforcement at different levels: deck at the
+        # bottom, rebar below the top cover
+        d_rebar = tc - cover_top
+        Mn = (As_rebar * fy_rebar * (d_rebar - a/2) +
+              As_deck * fy_deck * (d - a/2)) / 1e6
+    else:
+        Mn = As_total * fy_eq * (d - a/2) / 1e6
+    return T_total, As_total, fy_eq, a, c, Mn
+
+
 def calculate_flexural_capacity(
     geometry: SlabGeometry,
     concrete: ConcreteProperties,
@@ -221,7 +263,6 @@ def calculate_flexural_capacity(
     steps = []
     
     b = width  # mm
-    d = geometry.effective_depth  # mm
     fc = concrete.fc  # MPa
     beta1 = concrete.beta1
     
@@ -233,6 +274,14 @@ def calculate_flexural_capacity(
     fy_rebar = reinforcement.fy
     fy_deck = deck.Fy_deck if deck else fy_rebar
     
+    # All of the arithmetic; the steps below only document it
+    d = geometry.effective_depth  # mm
+    T_total, As_total, fy_eq, a, c, Mn = _flex_core(
+        float(geometry.tc), float(d), float(reinforcement.cover_top),
+        float(fc), float(beta1), float(As_rebar), float(fy_rebar),
+        float(As_deck), float(fy_deck), float(b), deck is not None
+    )
+    
     steps.append(CalculationStep(
         description="Effective depth",
         formula="d = tc - hr/2",
@@ -242,17 +291,8 @@ def calculate_flexural_capacity(
         code_ref="ACI 318-19 §22.2"
     ))
     
-    # Calculate tension force
     if deck:
         # Combined reinforcement with different yield strengths
-        T_rebar = As_rebar * fy_rebar  # N/m
-        T_deck = As_deck * fy_deck     # N/m
-        T_total = T_rebar + T_deck
-        
-        # Equivalent yield strength
-        As_total = As_rebar + As_deck
-        fy_eq = T_total / As_total if As_total > 0 else fy_deck
-        
         steps.append(CalculationStep(
             description="Total tension force",
             formula="T = As_rebar×fy + As_deck×Fy_deck",
@@ -261,18 +301,8 @@ def calculate_flexural_capacity(
             unit="kN/m",
             code_ref="ACI 318-19 §22.2.1"
         ))
-    else:
-        As_total = As_rebar
-        fy_eq = fy_rebar
-        T_total = As_total * fy_eq
     
     # Compression block depth
-    # C = T, where C = 0.85×f'c×a×b
-    if As_total > 0:
-        a = T_total / (0.85 * fc * b)  # mm
-    else:
-        a = 0
-    
     steps.append(CalculationStep(
         description="Compression block depth",
         formula="a = As×fy / (0.85×f'c×b)",
@@ -282,10 +312,7 @@ def calculate_flexural_capacity(
         code_ref="ACI 318-19 §22.2.2.4.1"
     ))
     
-    # Check neutral axis depth
-    c = a / beta1
-    c_d_ratio = c / d if d > 0 else 0
-    
+    # Neutral axis depth
     steps.append(CalculationStep(
         description="Neutral axis depth",
         formula="c = a/β₁",
@@ -295,18 +322,7 @@ def calculate_flexural_capacity(
         code_ref="ACI 318-19 §22.2.2.4.3"
     ))
     
-    # Nominal moment capacity
-    # Mn = As×fy×(d - a/2) for single layer
-    if deck and As_rebar > 0:
-        # Two layers of reinforcement at different levels
-        d_deck = geometry.tc - geometry.hr / 2  # Deck at bottom
-        d_rebar = geometry.tc - reinforcement.cover_top  # Top rebar
-        
-        Mn = (As_rebar * fy_rebar * (d_rebar - a/2) + 
-              As_deck * fy_deck * (d_deck - a/2)) / 1e6  # kN·m/m
-    else:
-        Mn = As_total * fy_eq * (d - a/2) / 1e6  # kN·m/m
-    
+    # Nominal moment capacity, Mn = As×fy×(d - a/2) for a single layer
     steps.append(CalculationStep(
         description="Nominal moment capacity",
         formula="Mn = As×fy×(d - a/2)",
@@ -319,6 +335,22 @@ def calculate_flexural_capacity(
     return Mn, steps
 
 
+@njit(cache=True)
+def _neg_flex_core(tc, cover_top, fc, As, fy, b):
+    """
+    Pure-arithmetic negative moment capacity (top rebar only) per ACI
+    318-19 §22.2, JIT-compiled when numba is available.
+    
+    Returns:
+        (d_neg (mm), T (N/m), a (mm), Mn_neg (kN·m/m))
+    """
+    d_neg = tc - cover_top
+    T = As * fy
+    a = T / (0.85 * fc * b) if fc > 0 else 0.0
+    Mn_neg = As * fy * (d_neg - a/2) / 1e6
+    return d_neg, T, a, Mn_neg
+
+
 def calculate_negative_moment_capacity(
     geometry: SlabGeometry,
     concrete: ConcreteProperties,
@@ -349,12 +381,16 @@ def calculate_negative_moment_capacity(
     fc = concrete.fc
     beta1 = concrete.beta1
     
-    # Effective depth for negative moment (from bottom of slab to top rebar)
-    d_neg = geometry.tc - reinforcement.cover_top
-    
     As = reinforcement.As_provided
     fy = reinforcement.fy
     
+    # Effective depth for negative moment (from bottom of slab to top rebar),
+    # compression block and capacity
+    d_neg, T, a, Mn_neg = _neg_flex_core(
+        float(geometry.tc), float(reinforcement.cover_top), float(fc),
+        float(As), float(fy), float(b)
+    )
+    
     steps.append(CalculationStep(
         description="Effective depth (negative)",
         formula="d = tc - cover_top",
@@ -365,9 +401,6 @@ def calculate_negative_moment_capacity(
     ))
     
     # Compression block
-    T = As * fy
-    a = T / (0.85 * fc * b) if fc > 0 else 0
-    
     steps.append(CalculationStep(
         description="Compression block depth",
         formula="a = As×fy / (0.85×f'c×b)",
@@ -378,8 +411,6 @@ def calculate_negative_moment_capacity(
     ))
     
     # Nominal capacity
-    Mn_neg = As * fy * (d_neg - a/2) / 1e6  # kN·m/m
-    
     steps.append(CalculationStep(
         description="Negative moment capacity",
         formula="Mn⁻ = As×fy×(d - a/2)",
@@ -18,7 +18,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedCalcStep:
     """A single calculation step with full professional documentation."""
     step_number: int
@@ -33,7 +33,7 @@ class DetailedCalcStep:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedCalcSection:
     """A section of calculations."""
     section_number: int
@@ -45,7 +45,7 @@ class DetailedCalcSection:
     status: str = "PASS"
 
 
-@dataclass 
+@dataclass(slots=True)
 class PreCompositeDesignReport:
     """Complete design report for pre-composite steel beam."""
     project_info: Dict
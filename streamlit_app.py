@@ -756,7 +756,7 @@ def run_composite_analysis(sec, Fy, fc, tc, beff, L, w_DL, w_SDL, w_LL, studs, m
     Itr = Ix + A*(Y1 + tc/2)**2 + (beff*tc**3/12 + beff*tc*(tc/2)**2)/n
     
     # Effective moment of inertia (AISC 360-16 §I3.2)
-    Ieff = Ix + (Itr - Ix) * comp_ratio**0.5
+    Ieff = Ix + (Itr - Ix) * math.sqrt(comp_ratio)
     
     # Load combinations
     # LRFD: 1.2D + 1.6L (ASCE 7-22)
@@ -5955,7 +5955,7 @@ with tab9:
                         
                         # Substitution
                         st.markdown(f"**Substitution:**")
-                        st.code(step.substitution, language=None)
+                        st.code(step.rendered_substitution, language=None)
                         
                         # Result
                         col_res1, col_res2, col_res3 = st.columns([2, 1, 2])
@@ -5974,7 +5974,7 @@ with tab9:
                         
                         # Notes if any
                         if step.notes:
-                            st.info(f"📝 **Note:** {step.notes}")
+                            st.info(f"📝 **Note:** {step.rendered_notes}")
                         
                         st.markdown("---")
                     